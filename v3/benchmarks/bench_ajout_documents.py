@@ -0,0 +1,111 @@
+"""!
+# bench_ajout_documents.py
+
+Benchmark : ajout des documents au Corpus, boucle `add_document` des notebooks comparée à
+l'API groupée `Corpus.from_dataframe`.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_ajout_documents.py
+"""
+
+import ast
+import csv
+import os
+import re
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import meilleur_temps
+from models.Corpus import Corpus
+from models.Document import Document, RedditDocument, ArxivDocument
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+
+def boucle_discours(corpus, df):
+    """!
+    Boucle de `search_engine_us_speeches.ipynb` : un `add_document` par phrase.
+
+    **Parameters**
+    - **corpus**: Le Corpus à remplir.
+    - **df**: DataFrame de discours_US.csv.
+    """
+    for _, row in df.iterrows():
+        auteur, texte, date, titre, url = [row[df.columns[i]] for i in range(5)]
+        for i, phrase in enumerate(re.split(r'[.!?]\s+', str(texte))):
+            if len(phrase.strip()) > 20:
+                corpus.add_document(Document(titre=f"{titre} (phrase {i+1})", auteur=auteur, date=date, url=url,
+                                             texte=phrase.strip()))
+
+
+def boucle_corpus(corpus, df):
+    """!
+    Boucle de `search_engine.ipynb` : un `add_document` par ligne.
+
+    **Parameters**
+    - **corpus**: Le Corpus à remplir.
+    - **df**: DataFrame de corpus_data.csv.
+    """
+    for _, row in df.iterrows():
+        if str(row['type']).strip().lower() == 'reddit':
+            doc = RedditDocument(str(row['titre']).strip(), str(row['auteur']).strip(), str(row['date']).strip(),
+                                 str(row['url']).strip(), str(row['texte']).strip(), int(row['nb_comments']))
+        else:
+            co = str(row['co_auteurs']).strip()
+            doc = ArxivDocument(str(row['titre']).strip(), str(row['auteur']).strip(), str(row['date']).strip(),
+                                str(row['url']).strip(), str(row['texte']).strip(),
+                                co_auteurs=ast.literal_eval(co) if co.startswith('[') else [])
+        corpus.add_document(doc)
+
+
+def remplissage(fonction, stockage, repetitions=5):
+    """!
+    Meilleur temps d'un remplissage du Corpus.
+
+    **Parameters**
+    - **fonction**: Fonction recevant le Corpus vide.
+    - **stockage**: "objets" ou "colonnes".
+    - **repetitions**: Nombre de répétitions.
+
+    **Returns**
+    - Un couple (meilleur temps en secondes, nombre de documents).
+    """
+    corpus = Corpus()
+    # Le Corpus est un singleton : on le réinitialise avant chaque mesure
+    meilleur, _ = meilleur_temps(lambda: fonction(corpus), repetitions,
+                                 preparation=lambda: corpus.__init__(nom="Benchmark", stockage=stockage))
+    return meilleur, len(corpus.get_documents())
+
+
+def main():
+    """!
+    Compare les deux méthodes sur discours_US.csv (phrases) et corpus_data.csv, pour les deux stockages.
+    """
+    ## @cond
+    discours = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                           engine='python', escapechar='\\')
+    donnees = pd.read_csv(os.path.join(DONNEES, 'corpus_data.csv'), sep='\t')
+
+    cas = [
+        ("discours_US.csv (phrases)", lambda c: boucle_discours(c, discours),
+         lambda c: c.from_dataframe(discours, phrases=True)),
+        ("corpus_data.csv", lambda c: boucle_corpus(c, donnees), lambda c: c.from_dataframe(donnees)),
+    ]
+    for nom, boucle, groupe in cas:
+        for stockage in ["objets", "colonnes"]:
+            t_boucle, n_documents = remplissage(boucle, stockage)
+            t_groupe, _ = remplissage(groupe, stockage)
+            print(f"{nom:<28} {stockage:<9} {n_documents:>7} docs  add_document : {t_boucle * 1000:7.1f} ms  "
+                  f"from_dataframe : {t_groupe * 1000:7.1f} ms  (x{t_boucle / t_groupe:.1f})")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""!
+# bench_auteurs.py
+
+Benchmark : recherche des documents d'un auteur ou co-auteur, par préfixe et statistiques d'auteur,
+servies par `Corpus.get_index_auteurs`, comparées au parcours de tous les documents.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_auteurs.py
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+## Nombre de copies de corpus_data.csv (simule un gros corpus Arxiv).
+COPIES = 20
+
+
+def parcours_documents(corpus, nom):
+    """!
+    Documents écrits ou co-écrits par un auteur, en parcourant tous les documents.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **nom**: Nom de l'auteur (casse ignorée).
+
+    **Returns**
+    - La liste des identifiants.
+    """
+    nom = nom.casefold()
+    return [doc_id for doc_id, doc in corpus.get_documents().items()
+            if doc.get_auteur().casefold() == nom
+            or any(co.casefold() == nom for co in getattr(doc, 'co_auteurs', None) or [])]
+
+
+def parcours_prefixe(corpus, prefixe):
+    """!
+    Auteurs principaux dont le nom commence par un préfixe, en parcourant le dictionnaire des auteurs.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **prefixe**: Début du nom (casse ignorée).
+
+    **Returns**
+    - La liste triée des noms.
+    """
+    return sorted(nom for nom in corpus.get_authors() if nom.casefold().startswith(prefixe.casefold()))
+
+
+def taille_moyenne_recalculee(auteur):
+    """!
+    Ancien `Author.get_average_size` : relecture du texte de chaque document de l'auteur.
+
+    **Parameters**
+    - **auteur**: L'objet Author.
+
+    **Returns**
+    - La taille moyenne en caractères.
+    """
+    return sum(len(doc.get_texte()) for doc in auteur.get_production()) / auteur.get_nb_docs()
+
+
+def main():
+    """!
+    Compare l'index des auteurs et les parcours sur corpus_data.csv (copié COPIES fois).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'corpus_data.csv'), sep='\t')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        for _ in range(COPIES):
+            corpus.from_dataframe(df)
+        debut = time.perf_counter()
+        index = corpus.get_index_auteurs()
+        construction = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    # Auteur le plus productif (auteur principal ou co-auteur)
+    code = max(range(len(index.noms)), key=lambda c: len(index.documents[c]))
+    nom = index.noms[code]
+    principal = max(corpus.get_authors().values(), key=lambda auteur: auteur.get_nb_docs())
+    prefixe = nom[:2]
+
+    print(f"{len(corpus.get_documents())} documents, {len(index.noms)} auteurs et co-auteurs "
+          f"({len(corpus.get_authors())} auteurs principaux)")
+    print(f"Construction de l'index : {construction * 1000:.0f} ms, {index.nbytes() / 2 ** 20:.2f} Mo")
+
+    assert index.get_documents(nom.upper()).tolist() == parcours_documents(corpus, nom)
+    t_index = mesurer(lambda: index.get_documents(nom.upper()))
+    t_parcours = mesurer(lambda: parcours_documents(corpus, nom))
+    print(f"Documents de « {nom} » ({len(index.documents[code])}) : index {t_index:.3f} ms  "
+          f"parcours {t_parcours:.1f} ms")
+
+    t_index = mesurer(lambda: index.rechercher(prefixe))
+    t_parcours = mesurer(lambda: parcours_prefixe(corpus, prefixe))
+    print(f"Préfixe « {prefixe} » ({len(index.rechercher(prefixe))} noms) : index {t_index:.3f} ms  "
+          f"parcours des auteurs principaux {t_parcours:.2f} ms")
+
+    t_agregat = mesurer(principal.get_average_size)
+    t_recalcul = mesurer(lambda: taille_moyenne_recalculee(principal))
+    print(f"Taille moyenne de « {principal.get_name()} » ({principal.get_nb_docs()} documents) : "
+          f"agrégat {t_agregat * 1000:.1f} µs  recalcul {t_recalcul:.3f} ms")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""!
+# bench_cache.py
+
+Benchmark : requêtes répétées (distribution de Zipf, comme dans l'interface des notebooks) avec et sans
+cache de requêtes du SearchEngine.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_cache.py
+"""
+
+import csv
+import os
+import random
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+from models.QueryCache import CacheRequetes
+from models.SearchEngine import SearchEngine
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+
+def requetes_zipf(vocabulaire, n_requetes, n_distinctes=200, graine=0):
+    """!
+    Tirage de requêtes selon une loi de Zipf : quelques requêtes populaires très fréquentes.
+
+    **Parameters**
+    - **vocabulaire**: Liste de mots dans laquelle les requêtes sont construites.
+    - **n_requetes**: Nombre de requêtes tirées.
+    - **n_distinctes**: Nombre de requêtes différentes.
+    - **graine**: Graine du générateur aléatoire.
+
+    **Returns**
+    - Liste de requêtes.
+    """
+    aleatoire = random.Random(graine)
+    distinctes = [" ".join(aleatoire.sample(vocabulaire, aleatoire.randint(1, 3))) for _ in range(n_distinctes)]
+    poids = [1 / rang for rang in range(1, n_distinctes + 1)]
+    return aleatoire.choices(distinctes, weights=poids, k=n_requetes)
+
+
+def duree_serie(moteur, requetes):
+    """!
+    Durée d'une série de recherches.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requetes**: Liste de requêtes.
+
+    **Returns**
+    - La durée moyenne par requête en millisecondes.
+    """
+    def serie():
+        for requete in requetes:
+            moteur.search(requete, n_results=10)
+
+    return mesurer(serie, repetitions=1) / len(requetes)
+
+
+def main():
+    """!
+    Compare plusieurs tailles de cache sur discours_US.csv (un document par phrase).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        moteur = SearchEngine(corpus)
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    # Mots fréquents du vocabulaire, pour que les requêtes aient des résultats
+    vocabulaire = sorted(moteur.vocab, key=lambda mot: -moteur.vocab[mot]['doc_count'])[50:1050]
+    requetes = requetes_zipf(vocabulaire, 2000)
+    print(f"{len(corpus.get_documents())} documents, {len(requetes)} requêtes dont {len(set(requetes))} distinctes")
+    for taille in [0, 16, 128, 1024]:
+        moteur.cache = CacheRequetes(taille)
+        duree = duree_serie(moteur, requetes)
+        stats = moteur.get_stats_cache()
+        print(f"taille_cache={taille:<5} {duree:7.3f} ms/requête  succès {stats['taux_succes']:6.1%}  "
+              f"évictions {stats['evictions']}")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
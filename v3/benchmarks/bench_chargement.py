@@ -0,0 +1,146 @@
+"""!
+# bench_chargement.py
+
+Benchmark : débit et mémoire du chargement par blocs (`Corpus.load_stream`) comparés à la
+reconstruction ligne par ligne des notebooks (`pd.read_csv` puis `iterrows`).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_chargement.py
+"""
+
+import ast
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from models.Corpus import Corpus
+from models.Document import RedditDocument, ArxivDocument
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+
+def charger_iterrows(corpus, chemin):
+    """!
+    Reconstruction des documents comme dans `search_engine.ipynb` (fichier entier puis `iterrows`).
+
+    **Parameters**
+    - **corpus**: Le Corpus à remplir.
+    - **chemin**: Chemin d'un fichier au format corpus_data.csv.
+
+    **Returns**
+    - Le nombre de documents ajoutés.
+    """
+    df = pd.read_csv(chemin, sep='\t')
+    for _, row in df.iterrows():
+        if str(row['type']).strip().lower() == 'reddit':
+            doc = RedditDocument(str(row['titre']), str(row['auteur']), str(row['date']), str(row['url']),
+                                 str(row['texte']), int(row['nb_comments']))
+        else:
+            co = str(row['co_auteurs'])
+            doc = ArxivDocument(str(row['titre']), str(row['auteur']), str(row['date']), str(row['url']),
+                                str(row['texte']), co_auteurs=ast.literal_eval(co) if co.startswith('[') else [])
+        corpus.add_document(doc)
+    return len(df)
+
+
+def mesurer_chargement(chargement, chemin):
+    """!
+    Mesure un chargement : durée, puis mémoire (pic et mémoire conservée) dans une seconde exécution.
+
+    **Parameters**
+    - **chargement**: Fonction (corpus, chemin) -> nombre de documents.
+    - **chemin**: Fichier à charger.
+
+    **Returns**
+    - Un triplet (nombre de documents, durée en secondes, pic transitoire en octets).
+
+    **Notes**
+    - Le pic transitoire est le pic mesuré par `tracemalloc` moins la mémoire encore utilisée à la fin
+      (les documents du corpus) : c'est la mémoire propre à la lecture du fichier.
+    """
+    corpus = Corpus()
+    # Le Corpus est un singleton : on le réinitialise avant chaque mesure
+    corpus.__init__(nom="Benchmark")
+    debut = time.perf_counter()
+    n_documents = chargement(corpus, chemin)
+    duree = time.perf_counter() - debut
+
+    corpus.__init__(nom="Benchmark")
+    tracemalloc.start()
+    chargement(corpus, chemin)
+    conservee, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    corpus.__init__(nom="Benchmark")
+    return n_documents, duree, pic - conservee
+
+
+def afficher(nom, chemin, n_documents, duree, pic):
+    """!
+    Affiche une ligne de résultats.
+
+    **Parameters**
+    - **nom**: Nom de la méthode.
+    - **chemin**: Fichier chargé.
+    - **n_documents**: Nombre de documents.
+    - **duree**: Durée en secondes.
+    - **pic**: Pic transitoire en octets.
+    """
+    mo = os.path.getsize(chemin) / 2 ** 20
+    print(f"{nom:<36} {mo:7.1f} Mo {n_documents:>8} docs  {duree:7.2f} s  {n_documents / duree:>10,.0f} docs/s  "
+          f"{mo / duree:6.1f} Mo/s  pic lecture {pic / 2 ** 20:7.1f} Mo")
+
+
+def main():
+    """!
+    Débit sur corpus_data.csv et discours_US.csv, puis pic mémoire sur des fichiers de taille croissante.
+    """
+    ## @cond
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        resultats = []
+        for fichier in ['corpus_data.csv', 'discours_US.csv']:
+            chemin = os.path.join(DONNEES, fichier)
+            if fichier == 'corpus_data.csv':
+                resultats.append(("iterrows (notebook)", chemin, *mesurer_chargement(charger_iterrows, chemin)))
+            resultats.append(("load_stream", chemin, *mesurer_chargement(lambda c, p: c.load_stream(p), chemin)))
+            resultats.append(("load_stream(phrases=True)", chemin,
+                              *mesurer_chargement(lambda c, p: c.load_stream(p, phrases=True), chemin)))
+
+        # Fichiers synthétiques : corpus_data.csv répété k fois
+        dossier = tempfile.mkdtemp()
+        croissance = []
+        source = pd.read_csv(os.path.join(DONNEES, 'corpus_data.csv'), sep='\t')
+        for k in [1, 4, 16]:
+            chemin = os.path.join(dossier, f"corpus_x{k}.csv")
+            pd.concat([source] * k).to_csv(chemin, sep='\t', index=False)
+            croissance.append((f"iterrows, x{k}", chemin, *mesurer_chargement(charger_iterrows, chemin)))
+            croissance.append((f"load_stream(taille_bloc=2000), x{k}", chemin,
+                               *mesurer_chargement(lambda c, p: c.load_stream(p, taille_bloc=2000), chemin)))
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print("Débit de chargement :")
+    for ligne in resultats:
+        afficher(*ligne)
+    print("\nPic mémoire de la lecture selon la taille du fichier :")
+    for ligne in croissance:
+        afficher(*ligne)
+    shutil.rmtree(dossier)
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""!
+# bench_concordance.py
+
+Benchmark : concordancier (`Corpus.concorde`) d'un mot entier (`\\bmot\\b`) servi par l'index positionnel,
+comparé au parcours de tous les textes par expression régulière.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_concordance.py
+"""
+
+import csv
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+MOTS = ["peace", "war", "freedom", "america", "jobs", "democracy"]
+
+
+def parcours_regex(corpus, motif):
+    """!
+    Ancienne méthode : `re.finditer` sur le texte de chaque document.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **motif**: Expression régulière.
+
+    **Returns**
+    - La liste des couples (id du document, début de l'occurrence).
+    """
+    motif = re.compile(motif, re.IGNORECASE)
+    return [(doc_id, match.start()) for doc_id, texte in zip(corpus.get_documents().keys(), corpus._iter_textes())
+            for match in motif.finditer(texte)]
+
+
+def main():
+    """!
+    Compare l'index positionnel et l'expression régulière sur discours_US.csv (phrases).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        debut = time.perf_counter()
+        index = corpus.get_index_positionnel()
+        construction = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    texte = sum(len(t) for t in corpus._iter_textes())
+    print(f"{len(corpus.get_documents())} documents, {texte / 2 ** 20:.1f} M caractères")
+    print(f"Construction de l'index positionnel (TokenStore compris) : {construction:.2f} s, "
+          f"{index.nbytes() / 2 ** 20:.1f} Mo hors TokenStore")
+    for mot in MOTS:
+        motif = rf"\b{mot}\b"
+        occurrences = [(ligne["id document"], ligne["position"]) for ligne in corpus.iter_concorde(motif)]
+        assert occurrences == parcours_regex(corpus, motif)
+        t_index = mesurer(lambda: corpus.concorde(motif))
+        t_regex = mesurer(lambda: parcours_regex(corpus, motif))
+        print(f"{mot:<10} {len(occurrences):>5} occurrences  index : {t_index:7.2f} ms  "
+              f"regex : {t_regex:7.2f} ms  (x{t_regex / t_index:.0f})")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
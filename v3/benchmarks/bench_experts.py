@@ -0,0 +1,86 @@
+"""!
+# bench_experts.py
+
+Benchmark : recherche d'experts (`SearchEngine.search_auteurs`, produit creux auteurs x documents) comparée
+au regroupement par auteur, avec pandas, du DataFrame de tous les résultats de `search`.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_experts.py
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+from models.SearchEngine import SearchEngine
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+## Nombre de copies de corpus_data.csv (simule un gros corpus Arxiv).
+COPIES = 10
+REQUETES = ["software engineering", "machine learning", "requirements", "python testing"]
+
+
+def regroupement_pandas(moteur, requete, n_results=10):
+    """!
+    Ancienne méthode : tous les résultats en DataFrame, puis somme des scores par auteur principal.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requete**: La requête.
+    - **n_results**: Nombre d'auteurs.
+
+    **Returns**
+    - Série pandas des scores des meilleurs auteurs (les co-auteurs ne sont pas crédités).
+    """
+    resultats = moteur.search(requete, n_results=moteur.N_docs)
+    return resultats.groupby("Auteur")["Score"].sum().nlargest(n_results)
+
+
+def main():
+    """!
+    Compare les deux méthodes sur corpus_data.csv (copié COPIES fois).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'corpus_data.csv'), sep='\t')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        for _ in range(COPIES):
+            corpus.from_dataframe(df)
+        moteur = SearchEngine(corpus, taille_cache=0)
+        debut = time.perf_counter()
+        _, incidence = moteur._get_incidence_auteurs()
+        construction = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print(f"{moteur.N_docs} documents")
+    print(f"Matrice d'incidence (index des auteurs compris) : {incidence.shape[0]} auteurs x "
+          f"{incidence.shape[1]} documents, {incidence.nnz} liens, {construction * 1000:.0f} ms")
+    for texte in REQUETES:
+        experts = moteur.search_auteurs(texte, dataframe=False)
+        t_experts = mesurer(lambda: moteur.search_auteurs(texte, dataframe=False), repetitions=3)
+        t_dataframe = mesurer(lambda: moteur.search_auteurs(texte), repetitions=3)
+        t_pandas = mesurer(lambda: regroupement_pandas(moteur, texte), repetitions=1)
+        print(f"{texte:<22} search_auteurs : {t_experts:6.2f} ms (DataFrame : {t_dataframe:6.2f} ms)  "
+              f"search + groupby : {t_pandas:8.1f} ms  premier : {experts[0][0] if experts else '-'}")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""!
+# bench_filtres.py
+
+Benchmark : recherche filtrée sur les métadonnées (masque calculé avant les scores) comparée à la recherche
+sans filtre et au filtrage des résultats après coup, document par document.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_filtres.py
+"""
+
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+from models.MetadataFilter import FiltresMetadonnees
+from models.SearchEngine import SearchEngine
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+REQUETES = ["health care", "the american people", "president"]
+FILTRES = [{'date_min': '2016-01-01'}, {'auteur': 'TRUMP'}, {'date_min': '2016-10-01'},
+           {'auteur': 'CLINTON', 'date_min': '2016-09-01', 'date_max': '2016-10-31'}]
+
+
+def post_filtrage(moteur, requete, filtres, n_results=10):
+    """!
+    Filtrage après coup : tous les résultats sont calculés, puis les métadonnées de chaque document sont lues.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requete**: La requête.
+    - **filtres**: Dictionnaire des filtres.
+    - **n_results**: Nombre de documents à retourner.
+
+    **Returns**
+    - Tableau NumPy des identifiants retenus.
+    """
+    documents = moteur.corpus.get_documents()
+    filtres = FiltresMetadonnees(filtres)
+    auteurs = filtres.valeurs.get('auteurs')
+    minimum, maximum = filtres.intervalles.get('dates', (None, None))
+    resultats = moteur.search(requete, n_results=moteur.N_docs, dataframe=False)
+    retenus = []
+    for doc_id in resultats.ids.tolist():
+        document = documents[doc_id]
+        date = pd.Timestamp(document.get_date(), tz='UTC').timestamp()
+        if ((auteurs is None or document.get_auteur() in auteurs) and (minimum is None or date >= minimum)
+                and (maximum is None or date <= maximum)):
+            retenus.append(doc_id)
+            if len(retenus) == n_results:
+                break
+    return np.array(retenus)
+
+
+def main():
+    """!
+    Mesure les recherches filtrées sur discours_US.csv (phrases).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        moteur = SearchEngine(corpus, taille_cache=0)
+        debut = time.perf_counter()
+        metadonnees = corpus.get_metadonnees()
+        FiltresMetadonnees({'date_min': 0}).masque(metadonnees)
+        construction = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print(f"{moteur.N_docs} documents")
+    print(f"Colonnes de métadonnées : {construction * 1000:.0f} ms, {metadonnees.nbytes() / 2 ** 20:.1f} Mo")
+    for filtres in FILTRES:
+        selection = FiltresMetadonnees(filtres).masque(metadonnees).mean()
+        # Compilation du masque : faite une fois par filtre et par version du corpus (cache du moteur)
+        t_masque = mesurer(lambda: FiltresMetadonnees(filtres).masque(metadonnees), repetitions=20)
+        print(f"\n{filtres} : {selection:.1%} des documents, compilation du masque : {t_masque:.2f} ms")
+        for texte in REQUETES:
+            resultats = moteur.search(texte, dataframe=False, filtres=filtres)
+            assert np.array_equal(resultats.ids, post_filtrage(moteur, texte, filtres))
+            t_sans = mesurer(lambda: moteur.search(texte, dataframe=False), repetitions=20)
+            t_filtre = mesurer(lambda: moteur.search(texte, dataframe=False, filtres=filtres), repetitions=20)
+            t_post = mesurer(lambda: post_filtrage(moteur, texte, filtres), repetitions=3)
+            print(f"  {texte:<22} sans filtre : {t_sans:5.2f} ms  masque : {t_filtre:5.2f} ms  "
+                  f"post-filtrage : {t_post:7.2f} ms")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""!
+# bench_memoire_documents.py
+
+Benchmark : mémoire par document du Corpus selon le stockage ("objets" ou "colonnes"),
+et coût d'accès aux documents reconstruits.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_memoire_documents.py
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from models.Corpus import Corpus
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+
+def mesurer_memoire(stockage, chemin, phrases):
+    """!
+    Charge un fichier dans un Corpus et mesure la mémoire conservée.
+
+    **Parameters**
+    - **stockage**: "objets" ou "colonnes".
+    - **chemin**: Fichier à charger.
+    - **phrases**: Découpage des discours en phrases.
+
+    **Returns**
+    - Un triplet (corpus, nombre de documents, octets conservés par le corpus).
+    """
+    corpus = Corpus()
+    # Le Corpus est un singleton : on le réinitialise avant chaque mesure
+    corpus.__init__(nom="Benchmark", stockage=stockage)
+    tracemalloc.start()
+    avant = tracemalloc.get_traced_memory()[0]
+    corpus.load_stream(chemin, phrases=phrases)
+    apres = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return corpus, len(corpus.get_documents()), apres - avant
+
+
+def temps_acces(corpus, n=10000):
+    """!
+    Temps moyen d'accès à un document tiré au hasard (reconstruction comprise).
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **n**: Nombre d'accès.
+
+    **Returns**
+    - Le temps moyen en microsecondes.
+    """
+    documents = corpus.get_documents()
+    ids = random.Random(0).choices(list(documents.keys()), k=n)
+    debut = time.perf_counter()
+    for doc_id in ids:
+        documents[doc_id].get_texte()
+    return (time.perf_counter() - debut) / n * 1e6
+
+
+def main():
+    """!
+    Compare les deux stockages sur discours_US.csv (phrases) et corpus_data.csv.
+    """
+    ## @cond
+    cas = [("discours_US.csv (phrases)", 'discours_US.csv', True), ("corpus_data.csv", 'corpus_data.csv', False)]
+    sortie = sys.stdout
+    resultats = []
+    for nom, fichier, phrases in cas:
+        for stockage in ["objets", "colonnes"]:
+            sys.stdout = open(os.devnull, 'w')
+            try:
+                corpus, n_documents, octets = mesurer_memoire(stockage, os.path.join(DONNEES, fichier), phrases)
+            finally:
+                sys.stdout.close()
+                sys.stdout = sortie
+            texte = sum(len(t.encode('utf-8')) for t in corpus._iter_textes())
+            resultats.append((nom, stockage, n_documents, octets, texte, temps_acces(corpus)))
+
+    print(f"{'Fichier':<28} {'Stockage':<9} {'Documents':>9} {'Mémoire':>10} {'Octets/doc':>11} "
+          f"{'dont texte':>11} {'Accès (µs)':>11}")
+    for nom, stockage, n_documents, octets, texte, acces in resultats:
+        print(f"{nom:<28} {stockage:<9} {n_documents:>9} {octets / 2 ** 20:>7.1f} Mo {octets / n_documents:>11.0f} "
+              f"{texte / n_documents:>11.0f} {acces:>11.2f}")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""!
+# bench_pagination.py
+
+Benchmark : concordance paginée (`Corpus.iter_concorde`, `limit` / `offset`) comparée à la concordance
+complète, et parcours parallèle des motifs non filtrables par les index.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_pagination.py
+"""
+
+import csv
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+## Motifs fréquents : sous-chaîne filtrée par trigrammes, mot entier (index positionnel), parcours complet.
+MOTIFS = ["the", r"\bthe\b", r"\w+ing\b", r"\w+ly\b"]
+## Motifs sans trigramme obligatoire, parcourus en parallèle.
+MOTIFS_PARALLELES = [r"\d{4}", r"\b\w{15,}\b"]
+
+
+def main():
+    """!
+    Mesure premier résultat, page de 20 et concordance complète sur discours_US.csv (phrases).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        # Index construits avant la mesure
+        corpus.concorde("peace")
+        corpus.concorde(r"\bpeace\b")
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print(f"{len(corpus.get_documents())} documents, {os.cpu_count()} cœur(s)")
+    for motif in MOTIFS:
+        n_occurrences = len(corpus.concorde(motif))
+        t_premier = mesurer(lambda: next(corpus.iter_concorde(motif)), repetitions=3)
+        t_page = mesurer(lambda: corpus.concorde(motif, limit=20, offset=100), repetitions=3)
+        t_complet = mesurer(lambda: corpus.concorde(motif), repetitions=3)
+        print(f"{motif:<10} {n_occurrences:>6} occurrences ({corpus.stats_requete['methode']})  "
+              f"premier : {t_premier:6.2f} ms  page de 20 : {t_page:6.2f} ms  complète : {t_complet:7.1f} ms")
+
+    print("\nParcours complet : séquentiel vs processus (n_workers)")
+    for motif in MOTIFS_PARALLELES:
+        assert corpus.concorde(motif).equals(corpus.concorde(motif, n_workers=2))
+        durees = {n_workers: mesurer(lambda: corpus.concorde(motif, n_workers=n_workers), repetitions=3)
+                  for n_workers in (1, 2, 4)}
+        mesures = [f"{n_workers} : {duree:6.1f} ms" for n_workers, duree in durees.items()]
+        t_premier = mesurer(lambda: next(corpus.iter_concorde(motif, n_workers=4)), repetitions=3)
+        print(f"{motif:<12} " + "  ".join(mesures) + f"  premier (4 processus) : {t_premier:5.1f} ms")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""!
+# bench_passages.py
+
+Benchmark : discours_US.csv indexé avec un Document par phrase (notebook) ou avec un Document par
+discours et un index au niveau des passages : mémoire conservée et lignes distinctes des résultats.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_passages.py
+"""
+
+import csv
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from models.Corpus import Corpus
+from models.Passage import DecoupeurPassages
+from models.SearchEngine import SearchEngine
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+REQUETES = ["war peace", "democracy", "economy", "jobs america", "health care", "terrorism", "immigration"]
+
+
+def mesurer_construction(df, phrases, passages):
+    """!
+    Construit le corpus et le moteur, et mesure la mémoire conservée.
+
+    **Parameters**
+    - **df**: DataFrame de discours_US.csv.
+    - **phrases**: Si vrai, un Document par phrase (comme dans le notebook).
+    - **passages**: DecoupeurPassages du moteur, ou None.
+
+    **Returns**
+    - Un quadruplet (moteur, nombre de documents, octets conservés, durée en secondes).
+    """
+    corpus = Corpus()
+    # Le Corpus est un singleton : on le réinitialise avant chaque mesure
+    corpus.__init__(nom="Benchmark")
+    tracemalloc.start()
+    avant = tracemalloc.get_traced_memory()[0]
+    debut = time.perf_counter()
+    corpus.from_dataframe(df, phrases=phrases)
+    moteur = SearchEngine(corpus, passages=passages)
+    duree = time.perf_counter() - debut
+    apres = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return moteur, len(corpus.get_documents()), apres - avant, duree
+
+
+def discours_distincts(moteur, n_results=10):
+    """!
+    Nombre moyen de discours distincts dans les n premiers résultats des requêtes de test.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **n_results**: Nombre de résultats par requête.
+
+    **Returns**
+    - Un couple (lignes moyennes, discours distincts moyens).
+    """
+    lignes, distincts = 0, 0
+    for requete in REQUETES:
+        resultats = moteur.search(requete, n_results=n_results)
+        lignes += len(resultats)
+        # Le titre d'une phrase est "titre (phrase i)" : on retire le suffixe (plusieurs discours ont le même titre)
+        titres = resultats["Document"].str.replace(r" \(phrase \d+\)$", "", regex=True)
+        distincts += len(resultats.assign(Document=titres)[["Document", "Auteur", "Date", "URL"]].drop_duplicates())
+    return lignes / len(REQUETES), distincts / len(REQUETES)
+
+
+def main():
+    """!
+    Compare les deux indexations de discours_US.csv.
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    cas = [("Document par phrase", True, None), ("Passages (1 phrase)", False, DecoupeurPassages()),
+           ("Passages (3 phrases)", False, DecoupeurPassages(phrases_par_passage=3))]
+
+    sortie = sys.stdout
+    resultats = []
+    for nom, phrases, passages in cas:
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            moteur, n_documents, octets, duree = mesurer_construction(df, phrases, passages)
+            lignes, distincts = discours_distincts(moteur)
+        finally:
+            sys.stdout.close()
+            sys.stdout = sortie
+        resultats.append((nom, n_documents, moteur.N_docs, octets, duree, lignes, distincts))
+
+    print(f"{'Indexation':<22} {'Documents':>9} {'Lignes index':>12} {'Mémoire':>10} {'Durée':>8} "
+          f"{'Top 10 : lignes':>15} {'discours distincts':>18}")
+    for nom, n_documents, n_lignes, octets, duree, lignes, distincts in resultats:
+        print(f"{nom:<22} {n_documents:>9} {n_lignes:>12} {octets / 2 ** 20:>7.1f} Mo {duree:>6.2f} s "
+              f"{lignes:>15.1f} {distincts:>18.1f}")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""!
+# bench_proximite.py
+
+Benchmark : requêtes de phrases et de proximité sur l'index positionnel du moteur.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_proximite.py
+"""
+
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+from models.ProximityQuery import RequetePositionnelle
+from models.SearchEngine import SearchEngine
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+PHRASES = ['"foreign policy"', '"of the people"', '"the united states of america"', '"in the world"',
+           '"health care reform"']
+REQUETES = ["foreign policy", "health care", "the american people", "war NEAR/5 peace", '"tax cuts" economy']
+
+
+def phrase_fusion(index, mots):
+    """!
+    Évaluation naïve d'une phrase : intersection des listes d'occurrences complètes de tous ses mots.
+
+    **Parameters**
+    - **index**: IndexPositionnel du moteur.
+    - **mots**: Tokens de la phrase.
+
+    **Returns**
+    - Tableau NumPy trié des lignes contenant la phrase.
+    """
+    debuts = index.indices(mots[0]).astype(np.int64)
+    for i, mot in enumerate(mots[1:], start=1):
+        debuts = np.intersect1d(debuts, index.indices(mot).astype(np.int64) - i, assume_unique=True)
+    debuts = debuts[index.lignes(debuts) == index.lignes(debuts + len(mots) - 1)]
+    return np.unique(index.lignes(debuts))
+
+
+def main():
+    """!
+    Mesure les phrases (mot le plus rare vs intersection des listes complètes) et le coût du bonus de proximité.
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        moteur = SearchEngine(corpus, taille_cache=0)
+        debut = time.perf_counter()
+        index = moteur._get_index_positionnel()
+        index.indices("the")
+        construction = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print(f"{moteur.N_docs} documents, {len(index.store.tokens)} tokens")
+    print(f"Index positionnel (au-dessus du TokenStore) : {construction * 1000:.0f} ms, "
+          f"{index.nbytes() / 2 ** 20:.1f} Mo")
+
+    print("\nPhrases : mot le plus rare + vérification dans le TokenStore vs intersection des listes complètes")
+    for texte in PHRASES:
+        requete = RequetePositionnelle(texte, moteur.tokenizer)
+        mots = requete.phrases[0]
+        lignes = requete.lignes_valides(index)
+        assert np.array_equal(lignes, phrase_fusion(index, mots))
+        occurrences = sum(len(index.indices(mot)) for mot in mots)
+        t_rare = mesurer(lambda: requete.lignes_valides(index))
+        t_fusion = mesurer(lambda: phrase_fusion(index, mots))
+        print(f"{texte:<32} {len(lignes):>5} lignes  {occurrences:>7} occurrences  "
+              f"rare : {t_rare:6.2f} ms  fusion : {t_fusion:6.2f} ms  (x{t_fusion / t_rare:.0f})")
+
+    print("\nRecherche vectorielle : sac de mots (par défaut) vs bonus de proximité (poids_proximite=0.5)")
+    for texte in REQUETES:
+        t_sac = mesurer(lambda: moteur.search(texte, dataframe=False))
+        t_prox = mesurer(lambda: moteur.search(texte, poids_proximite=0.5, dataframe=False))
+        print(f"{texte:<32} sac de mots : {t_sac:6.2f} ms  proximité : {t_prox:6.2f} ms")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
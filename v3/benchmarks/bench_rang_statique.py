@@ -0,0 +1,99 @@
+"""!
+# bench_rang_statique.py
+
+Benchmark : coût du rang statique (fraîcheur, commentaires Reddit) dans `SearchEngine.search`, comparé à la
+recherche textuelle seule et au calcul des mêmes signaux à chaque requête depuis les documents.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_rang_statique.py
+"""
+
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+from models.Metadata import Metadonnees
+from models.SearchEngine import SearchEngine
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+REQUETES = ["health care", "the american people", "jobs economy"]
+
+
+def signaux_a_la_requete(moteur, requete, poids_recence, n_results=10):
+    """!
+    Fraîcheur calculée à chaque requête : lecture et analyse de la date de chaque document de score non nul.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requete**: La requête.
+    - **poids_recence**: Poids de la fraîcheur.
+    - **n_results**: Nombre de documents à retourner.
+
+    **Returns**
+    - Tableau NumPy des identifiants des meilleurs documents.
+    """
+    documents = moteur.corpus.get_documents()
+    resultats = moteur.search(requete, n_results=moteur.N_docs, dataframe=False)
+    dates = Metadonnees.epoch([documents[doc_id].get_date() for doc_id in resultats.ids.tolist()])
+    plus_recente = np.nanmax(moteur.corpus.get_metadonnees().dates)
+    recence = np.nan_to_num(np.exp2(-(plus_recente - dates) / (moteur.rang_statique.demi_vie * 86400)), nan=0.0)
+    scores = resultats.scores * (1 + poids_recence * recence)
+    return resultats.ids[np.lexsort((resultats.ids, -scores))[:n_results]]
+
+
+def main():
+    """!
+    Mesure le rang statique sur discours_US.csv (phrases).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        debut = time.perf_counter()
+        moteur = SearchEngine(corpus, taille_cache=0)
+        indexation = time.perf_counter() - debut
+        debut = time.perf_counter()
+        moteur.search("peace", poids_recence=1.0, dataframe=False)
+        caracteristiques = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print(f"{moteur.N_docs} documents")
+    print(f"Indexation : {indexation * 1000:.0f} ms ; caractéristiques de rang statique (première requête) : "
+          f"{caracteristiques * 1000:.0f} ms")
+    t_demi_vie = mesurer(lambda: moteur.rang_statique.set_demi_vie(30), repetitions=10)
+    print(f"Changement de demi-vie : {t_demi_vie:.2f} ms (sans réindexation)")
+    for texte in REQUETES:
+        resultats = moteur.search(texte, dataframe=False, poids_recence=1.0)
+        assert np.array_equal(resultats.ids, signaux_a_la_requete(moteur, texte, 1.0))
+        t_texte = mesurer(lambda: moteur.search(texte, dataframe=False), repetitions=10)
+        t_statique = mesurer(lambda: moteur.search(texte, dataframe=False, poids_recence=1.0, poids_commentaires=0.5),
+                             repetitions=10)
+        t_requete = mesurer(lambda: signaux_a_la_requete(moteur, texte, 1.0), repetitions=3)
+        print(f"{texte:<22} texte seul : {t_texte:5.2f} ms  rang statique : {t_statique:5.2f} ms  "
+              f"signaux calculés à la requête : {t_requete:7.1f} ms")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""!
+# bench_resultats.py
+
+Benchmark : coût d'une recherche selon le format de sortie, DataFrame (`search`) ou
+Resultats (`search(..., dataframe=False)`, tableaux NumPy et métadonnées à la demande).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_resultats.py
+"""
+
+import csv
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+from models.SearchEngine import SearchEngine
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+REQUETES = ["war peace", "democracy", "design", "software engineering", "code review", "economy jobs"]
+
+
+def construire(df, phrases):
+    """!
+    Construction du corpus et du moteur (sans cache de requêtes).
+
+    **Parameters**
+    - **df**: DataFrame du fichier de données.
+    - **phrases**: Découpage des discours en phrases.
+
+    **Returns**
+    - Le SearchEngine.
+    """
+    corpus = Corpus()
+    # Le Corpus est un singleton : on le réinitialise avant chaque mesure
+    corpus.__init__(nom="Benchmark")
+    corpus.from_dataframe(df, phrases=phrases)
+    return SearchEngine(corpus, taille_cache=0)
+
+
+def duree_recherche(moteur, dataframe, n_results, repetitions=50):
+    """!
+    Durée moyenne d'une recherche.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **dataframe**: Format de sortie demandé.
+    - **n_results**: Nombre de résultats par requête.
+    - **repetitions**: Nombre de passages sur les requêtes de test.
+
+    **Returns**
+    - La durée moyenne en microsecondes.
+    """
+    def serie():
+        for requete in REQUETES:
+            moteur.search(requete, n_results=n_results, dataframe=dataframe)
+
+    return mesurer(serie, repetitions) / len(REQUETES) * 1000
+
+
+def main():
+    """!
+    Compare les deux formats sur corpus_data.csv et discours_US.csv (phrases).
+    """
+    ## @cond
+    cas = [("corpus_data.csv", pd.read_csv(os.path.join(DONNEES, 'corpus_data.csv'), sep='\t'), False),
+           ("discours_US.csv (phrases)", pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t',
+                                                     quoting=csv.QUOTE_NONE, engine='python', escapechar='\\'), True)]
+    for nom, df, phrases in cas:
+        sortie = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            moteur = construire(df, phrases)
+        finally:
+            sys.stdout.close()
+            sys.stdout = sortie
+        for n_results in [10, 50]:
+            t_df = duree_recherche(moteur, True, n_results)
+            t_leger = duree_recherche(moteur, False, n_results)
+            print(f"{nom:<28} n_results={n_results:<3} DataFrame : {t_df:8.0f} µs  Resultats : {t_leger:8.0f} µs  "
+                  f"(x{t_df / t_leger:.1f})")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""!
+# bench_tokenizer.py
+
+Micro-benchmark : débit (tokens/seconde) du Tokenizer comparé à l'ancien `nettoyer_texte`.
+
+**Author:** LOREL Guillaume  
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_tokenizer.py
+"""
+
+import csv
+import os
+import re
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import meilleur_temps
+from models.Tokenizer import Tokenizer
+
+CHEMIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'discours_US.csv')
+
+
+def nettoyer_texte_ancien(text):
+    """!
+    Ancienne implémentation de `Corpus.nettoyer_texte`, conservée comme référence.
+
+    **Parameters**
+    - **text**: Texte brut.
+
+    **Returns**
+    - Texte nettoyé.
+    """
+    text = text.lower()
+    text = text.replace('\n', ' ')
+    text = re.sub(r'[^a-z\s]+', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def tokenisation(fonction, textes, repetitions=5):
+    """!
+    Mesure le meilleur temps d'exécution de `fonction` sur tous les textes.
+
+    **Parameters**
+    - **fonction**: Fonction prenant la liste des textes et retournant une liste de listes de tokens.
+    - **textes**: Liste des textes.
+    - **repetitions**: Nombre de répétitions (le meilleur temps est retenu).
+
+    **Returns**
+    - Un couple (meilleur temps en secondes, nombre de tokens produits).
+    """
+    meilleur, resultat = meilleur_temps(lambda: fonction(textes), repetitions)
+    return meilleur, sum(len(tokens) for tokens in resultat)
+
+
+def main():
+    """!
+    Compare l'ancien nettoyage et le Tokenizer sur les textes de `discours_US.csv`.
+    """
+    ## @cond
+    df = pd.read_csv(CHEMIN, sep='\t', quoting=csv.QUOTE_NONE, engine='python', escapechar='\\')
+    textes = [str(t) for t in df[df.columns[1]]]
+    print(f"{len(textes)} textes, {sum(len(t) for t in textes)} caractères.")
+
+    def ancien(textes):
+        return [[m for m in nettoyer_texte_ancien(t).split(' ') if m] for t in textes]
+
+    candidats = [
+        ("nettoyer_texte (ancien)", ancien),
+        ("Tokenizer()", Tokenizer().tokeniser_lot),
+        ("Tokenizer(retirer_accents=True)", Tokenizer(retirer_accents=True).tokeniser_lot),
+        ("Tokenizer(stopwords, longueur_min=3)",
+         Tokenizer(stopwords={'the', 'and', 'to', 'of', 'a', 'in'}, longueur_min=3).tokeniser_lot),
+    ]
+
+    reference = None
+    for nom, fonction in candidats:
+        duree, n_tokens = tokenisation(fonction, textes)
+        if reference is None:
+            reference = duree
+        print(f"{nom:<40} {n_tokens:>9} tokens  {duree * 1000:8.1f} ms  "
+              f"{n_tokens / duree:>12,.0f} tokens/s  (x{reference / duree:.2f})")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
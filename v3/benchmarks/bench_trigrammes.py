@@ -0,0 +1,100 @@
+"""!
+# bench_trigrammes.py
+
+Benchmark : expressions régulières de `Corpus.concorde` filtrées par l'index de trigrammes, comparées
+au parcours de tous les textes.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_trigrammes.py
+"""
+
+import csv
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+MOTIFS = [r"\bpeace\b", r"foreign\s+policy", r"health ?care", r"(war|peace)", r"[Aa]meric(a|an)s?",
+          r"tax(es)? cuts?", r"\w+ing\b", r"\d{4}"]
+
+
+def parcours_complet(corpus, motif):
+    """!
+    Ancienne concordance : `re.finditer` sur le texte de chaque document.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **motif**: Expression régulière compilée.
+
+    **Returns**
+    - Le nombre d'occurrences.
+    """
+    return sum(1 for texte in corpus._iter_textes() for _ in motif.finditer(texte))
+
+
+def parcours_candidats(corpus, motif):
+    """!
+    Concordance filtrée : `re.finditer` sur les seuls documents candidats de l'index de trigrammes.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **motif**: Expression régulière compilée.
+
+    **Returns**
+    - Le nombre d'occurrences.
+    """
+    documents, _ = corpus._documents_candidats(motif)
+    return sum(1 for _, texte in documents for _ in motif.finditer(texte))
+
+
+def main():
+    """!
+    Compare l'index de trigrammes et le parcours complet sur discours_US.csv (phrases).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        debut = time.perf_counter()
+        index = corpus.get_index_trigrammes()
+        index.postings("the")
+        construction = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print(f"{len(corpus.get_documents())} documents")
+    print(f"Construction de l'index de trigrammes : {construction:.2f} s, {index.nbytes() / 2 ** 20:.1f} Mo")
+    for texte in MOTIFS:
+        motif = re.compile(texte, re.IGNORECASE)
+        n_occurrences = parcours_complet(corpus, motif)
+        assert parcours_candidats(corpus, motif) == n_occurrences
+        stats = corpus.stats_requete
+        t_index = mesurer(lambda: parcours_candidats(corpus, motif), repetitions=3)
+        t_complet = mesurer(lambda: parcours_complet(corpus, motif), repetitions=3)
+        print(f"{texte:<22} {n_occurrences:>6} occurrences  candidats : {stats['ratio_candidats']:6.1%} "
+              f"({stats['methode']})  index : {t_index:7.1f} ms  parcours : {t_complet:7.1f} ms")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""!
+# bench_tris.py
+
+Benchmark : documents les plus récents et premiers titres servis par les index triés de `Corpus.get_metadonnees`,
+comparés au tri de tous les documents à chaque appel, et mise à jour des index après des ajouts.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python v3/benchmarks/bench_tris.py
+"""
+
+import csv
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from commun import mesurer
+from models.Corpus import Corpus
+from models.Document import Document
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+
+def tri_complet_dates(corpus, n):
+    """!
+    Ancien `get_sorted_by_date` : tri de tous les documents sur la chaîne de la date.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **n**: Nombre de documents.
+
+    **Returns**
+    - Les n premiers documents.
+    """
+    return sorted(corpus.get_documents().values(), key=lambda doc: doc.get_date(), reverse=True)[:n]
+
+
+def tri_complet_titres(corpus, n):
+    """!
+    Ancien `get_sorted_by_title` : tri de tous les documents sur le titre en minuscules.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **n**: Nombre de documents.
+
+    **Returns**
+    - Les n premiers documents.
+    """
+    return sorted(corpus.get_documents().values(), key=lambda doc: doc.get_titre().lower())[:n]
+
+
+def premiers_index(corpus, colonne, n):
+    """!
+    Lecture des n premiers documents d'un index trié.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **colonne**: "dates" (plus récents d'abord) ou "titres".
+    - **n**: Nombre de documents.
+
+    **Returns**
+    - Les n premiers documents.
+    """
+    metadonnees = corpus.get_metadonnees()
+    positions = metadonnees.premiers(colonne, n, decroissant=colonne == 'dates')
+    documents = corpus.get_documents()
+    return [documents[doc_id] for doc_id in metadonnees.ids[positions].tolist()]
+
+
+def main():
+    """!
+    Compare les tris sur discours_US.csv (phrases).
+    """
+    ## @cond
+    df = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t', quoting=csv.QUOTE_NONE,
+                     engine='python', escapechar='\\')
+    sortie = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise avant la mesure
+        corpus.__init__(nom="Benchmark")
+        corpus.from_dataframe(df, phrases=True)
+        debut = time.perf_counter()
+        premiers_index(corpus, 'dates', 1)
+        premiers_index(corpus, 'titres', 1)
+        construction = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+
+    print(f"{len(corpus.get_documents())} documents")
+    print(f"Colonnes et index triés (dates analysées une fois) : {construction * 1000:.0f} ms")
+    for n in (10, 100):
+        t_dates = mesurer(lambda: premiers_index(corpus, 'dates', n))
+        t_dates_tri = mesurer(lambda: tri_complet_dates(corpus, n))
+        t_titres = mesurer(lambda: premiers_index(corpus, 'titres', n))
+        t_titres_tri = mesurer(lambda: tri_complet_titres(corpus, n))
+        print(f"n = {n:<4} dates : index {t_dates:6.2f} ms  tri complet {t_dates_tri:6.1f} ms   "
+              f"titres : index {t_titres:6.2f} ms  tri complet {t_titres_tri:6.1f} ms")
+
+    t_tranche = mesurer(lambda: corpus.get_ids_by_date('2016-10-01', '2016-10-31', n=20, recent=True))
+    print(f"Tranche de dates (octobre 2016, 20 plus récents) : {t_tranche:.2f} ms")
+
+    # Ajouts document par document : les index sont complétés par fusion au prochain accès
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        debut = time.perf_counter()
+        for i in range(100):
+            corpus.add_document(Document(f"Ajout {i}", "BENCHMARK", "November 9, 2016", "", "texte ajouté"))
+        ajout = time.perf_counter() - debut
+        debut = time.perf_counter()
+        premiers_index(corpus, 'dates', 10)
+        fusion = time.perf_counter() - debut
+    finally:
+        sys.stdout.close()
+        sys.stdout = sortie
+    print(f"100 add_document : {ajout * 1000:.1f} ms, puis mise à jour des index au premier accès : "
+          f"{fusion * 1000:.1f} ms (tri complet : {mesurer(lambda: tri_complet_dates(corpus, 10)):.1f} ms)")
+    ## @endcond
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""!
+# commun.py
+
+Outils de mesure partagés par les scripts de benchmark.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import time
+
+
+def mesurer(fonction, repetitions=5):
+    """!
+    Durée moyenne d'un appel.
+
+    **Parameters**
+    - **fonction**: Fonction sans argument.
+    - **repetitions**: Nombre d'appels.
+
+    **Returns**
+    - La durée moyenne en millisecondes.
+    """
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        fonction()
+    return (time.perf_counter() - debut) / repetitions * 1000
+
+
+def meilleur_temps(fonction, repetitions=5, preparation=None):
+    """!
+    Meilleur temps d'un appel.
+
+    **Parameters**
+    - **fonction**: Fonction sans argument.
+    - **repetitions**: Nombre d'appels (le meilleur temps est retenu).
+    - **preparation**: Fonction sans argument appelée avant chaque appel, hors mesure (None : aucune).
+
+    **Returns**
+    - Un couple (meilleur temps en secondes, résultat du dernier appel).
+    """
+    meilleur = float('inf')
+    resultat = None
+    for _ in range(repetitions):
+        if preparation is not None:
+            preparation()
+        debut = time.perf_counter()
+        resultat = fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur, resultat
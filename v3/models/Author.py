@@ -16,11 +16,13 @@ class Author:
         @brief Constructeur de la classe Author.
         @param name Nom de l'auteur.
         @param nb_docs Nombre initial de documents.
-        @param production Liste initiale des documents (objets Document).
+        @param production Liste initiale des documents (objets Document, ou ListeDocuments d'identifiants).
         """
         self.name = name
         self.nb_docs = nb_docs
         self.production = production
+        # Taille cumulée des textes, tenue à jour par add et add_all
+        self.taille_totale = sum(len(doc.get_texte()) for doc in production)
     
     def get_name(self):
         """!
@@ -43,13 +45,27 @@ class Author:
         """
         return self.production
     
-    def add(self, document):
+    def add(self, document, taille=None):
         """!
         @brief Ajoute un document à la production de l'auteur.
-        @param document L'instance de Document à ajouter.
+        @param document L'instance de Document à ajouter (son identifiant si la production est une ListeDocuments).
+        @param taille Taille du texte en caractères (obligatoire si `document` est un identifiant).
         """
         self.production.append(document)
         self.nb_docs += 1
+        self.taille_totale += len(document.get_texte()) if taille is None else taille
+
+    def add_all(self, documents, tailles=None):
+        """!
+        @brief Ajoute plusieurs documents à la production de l'auteur en une fois.
+        @param documents Liste des documents (ou de leurs identifiants si la production est une ListeDocuments).
+        @param tailles Tailles des textes en caractères (obligatoires si `documents` sont des identifiants).
+        """
+        self.production.extend(documents)
+        self.nb_docs += len(documents)
+        if tailles is None:
+            tailles = [len(document.get_texte()) for document in documents]
+        self.taille_totale += sum(tailles)
 
     def __str__(self):
         """!
@@ -62,10 +78,10 @@ class Author:
         """!
         @brief Calcule la taille moyenne des documents de l'auteur.
         @return La taille moyenne en caractères (float).
+        @note Lecture de la taille cumulée tenue à jour à chaque ajout : aucun texte n'est relu.
         """
         if self.nb_docs == 0:
             return 0
         
-        # Somme des longueurs de tous les textes / nombre de docs
-        total_size = sum(len(doc.get_texte()) for doc in self.production)
-        return total_size / self.nb_docs
+        # Taille cumulée des textes / nombre de docs
+        return self.taille_totale / self.nb_docs
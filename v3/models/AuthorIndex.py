@@ -0,0 +1,194 @@
+"""!
+# AuthorIndex.py
+
+Index des auteurs et co-auteurs : nom normalisé -> identifiants des documents, avec statistiques.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from array import array
+from bisect import bisect_left
+import numpy as np
+
+
+class IndexAuteurs:
+    """!
+    # IndexAuteurs
+
+    Index inversé des auteurs : chaque nom (auteur principal ou co-auteur d'un ArxivDocument) reçoit
+    un code, et chaque code la liste compacte (tableau d'entiers) des documents qu'il a écrits ou co-écrits.
+
+    - Les noms sont comparés sous forme normalisée (casse et espaces ignorés) : "Hans  Fangohr" et
+      "hans fangohr" désignent le même auteur ; le nom affiché est la première graphie rencontrée.
+    - Le nombre de documents (dont ceux en auteur principal) et la taille totale des textes sont tenus
+      à jour à chaque ajout : les statistiques d'un auteur se lisent sans parcourir ses documents.
+    - Les noms normalisés sont gardés triés : recherche par préfixe en temps logarithmique.
+    """
+
+    def __init__(self):
+        """!
+        Constructeur d'un index vide.
+        """
+        self.codes = {}
+        self.noms = []
+        self.documents = []
+        self.nb_principal = array('q')
+        self.tailles = array('q')
+        self._noms_tries = []
+        self._nouveaux_noms = []
+        self._n_documents = 0
+
+    def __len__(self):
+        """!
+        Nombre de documents indexés.
+
+        **Returns**
+        - Le nombre de documents ajoutés à l'index.
+        """
+        return self._n_documents
+
+    @staticmethod
+    def normaliser(nom):
+        """!
+        Forme normalisée d'un nom d'auteur.
+
+        **Parameters**
+        - **nom**: Nom de l'auteur.
+
+        **Returns**
+        - Le nom sans différence de casse, espaces multiples réduits.
+        """
+        return " ".join(str(nom).split()).casefold()
+
+    def _code(self, nom):
+        """!
+        Code d'un auteur, créé s'il est nouveau.
+
+        **Parameters**
+        - **nom**: Nom de l'auteur (tel qu'écrit dans le document).
+
+        **Returns**
+        - Le code entier de l'auteur.
+        """
+        cle = self.normaliser(nom)
+        code = self.codes.get(cle)
+        if code is None:
+            code = len(self.noms)
+            self.codes[cle] = code
+            self.noms.append(nom)
+            self.documents.append(array('q'))
+            self.nb_principal.append(0)
+            self.tailles.append(0)
+            self._nouveaux_noms.append(cle)
+        return code
+
+    def ajouter(self, ids_docs, auteurs, co_auteurs, tailles):
+        """!
+        Ajoute des documents à l'index.
+
+        **Parameters**
+        - **ids_docs**: Identifiants des documents.
+        - **auteurs**: Auteur principal de chaque document.
+        - **co_auteurs**: Liste des co-auteurs de chaque document (vide hors Arxiv).
+        - **tailles**: Taille du texte (en caractères) de chaque document.
+
+        **Notes**
+        - Un nom présent plusieurs fois pour un même document (auteur principal répété parmi les
+          co-auteurs) ne compte qu'une fois.
+        """
+        n = 0
+        for doc_id, auteur, co, taille in zip(ids_docs, auteurs, co_auteurs, tailles):
+            principal = self._code(auteur)
+            self.nb_principal[principal] += 1
+            for code in dict.fromkeys([principal] + [self._code(nom) for nom in co]):
+                self.documents[code].append(doc_id)
+                self.tailles[code] += taille
+            n += 1
+        self._n_documents += n
+
+        if self._nouveaux_noms:
+            # Deux suites triées : le tri de Python les fusionne en temps linéaire
+            self._noms_tries = sorted(self._noms_tries + sorted(self._nouveaux_noms))
+            self._nouveaux_noms = []
+
+    def code(self, nom):
+        """!
+        Code d'un auteur, sans tenir compte de la casse ni des espaces.
+
+        **Parameters**
+        - **nom**: Nom de l'auteur.
+
+        **Returns**
+        - Le code entier, ou None si l'auteur est inconnu.
+        """
+        return self.codes.get(self.normaliser(nom))
+
+    def get_documents(self, nom):
+        """!
+        Documents écrits ou co-écrits par un auteur.
+
+        **Parameters**
+        - **nom**: Nom de l'auteur (casse et espaces ignorés).
+
+        **Returns**
+        - Tableau NumPy des identifiants, par ordre d'ajout (vide si l'auteur est inconnu).
+        """
+        code = self.code(nom)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return np.array(self.documents[code], dtype=np.int64)
+
+    def rechercher(self, prefixe, n=None):
+        """!
+        Auteurs dont le nom commence par un préfixe.
+
+        **Parameters**
+        - **prefixe**: Début du nom (casse et espaces ignorés).
+        - **n**: Nombre maximal de noms (None : tous).
+
+        **Returns**
+        - Liste des noms affichés, par ordre alphabétique des noms normalisés.
+
+        **Notes**
+        - Deux recherches dichotomiques dans les noms triés, puis lecture de la tranche.
+        """
+        prefixe = self.normaliser(prefixe)
+        debut = bisect_left(self._noms_tries, prefixe)
+        # Le plus grand caractère Unicode borne tous les noms qui commencent par le préfixe
+        fin = bisect_left(self._noms_tries, prefixe + "\U0010ffff", debut)
+        if n is not None:
+            fin = min(fin, debut + n)
+        return [self.noms[self.codes[cle]] for cle in self._noms_tries[debut:fin]]
+
+    def stats(self, nom):
+        """!
+        Statistiques d'un auteur, lues dans les agrégats tenus à jour.
+
+        **Parameters**
+        - **nom**: Nom de l'auteur (casse et espaces ignorés).
+
+        **Returns**
+        - Dictionnaire (nom, documents, principal, co_auteur, taille_moyenne), ou None si l'auteur est inconnu.
+        """
+        code = self.code(nom)
+        if code is None:
+            return None
+        n_documents = len(self.documents[code])
+        return {
+            'nom': self.noms[code],
+            'documents': n_documents,
+            'principal': self.nb_principal[code],
+            'co_auteur': n_documents - self.nb_principal[code],
+            'taille_moyenne': self.tailles[code] / n_documents if n_documents else 0.0
+        }
+
+    def nbytes(self):
+        """!
+        Mémoire occupée par les listes de documents et les agrégats (hors noms).
+
+        **Returns**
+        - Le nombre d'octets.
+        """
+        tableaux = self.documents + [self.nb_principal, self.tailles]
+        return sum(tableau.itemsize * len(tableau) for tableau in tableaux)
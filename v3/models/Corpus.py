@@ -7,10 +7,23 @@ Module contenant la logique de gestion du corpus de documents.
 **Version:** 3.0
 """
 
+import csv
+import hashlib
+from itertools import count, islice
+import time
+import numpy as np
 import pandas as pd
 import re
 from models.Author import Author
-from collections import Counter
+from models.AuthorIndex import IndexAuteurs
+from models.Document import Document, RedditDocument, ArxivDocument
+from models.DocumentStore import StockageDocuments, ListeDocuments
+from models.Metadata import Metadonnees
+from models.ParallelSearch import RechercheParallele
+from models.PositionalIndex import IndexPositionnel
+from models.TokenStore import TokenStore
+from models.Tokenizer import Tokenizer
+from models.TrigramIndex import IndexTrigrammes
 
 def singleton(cls):
     """!
@@ -38,7 +51,24 @@ class Corpus:
 
     **Note:** Utilise le pattern Singleton.
     """
-    def __init__(self, nom="Corpus par défaut", documents=None, id_document=0, authors=None):
+
+    ## Colonnes du format enregistré par `save` (corpus_data.csv).
+    COLONNES_CORPUS = ['titre', 'auteur', 'date', 'url', 'texte', 'type', 'nb_comments', 'co_auteurs']
+    ## Colonnes du format des discours (discours_US.csv).
+    COLONNES_DISCOURS = ['speaker', 'text', 'date', 'descr', 'link']
+    ## Éléments d'une liste Python écrite par `str(list)` : chaînes entre apostrophes ou guillemets.
+    MOTIF_CO_AUTEURS = r"'((?:[^'\\]|\\.)*)'|\"((?:[^\"\\]|\\.)*)\""
+    ## Séparateur de phrases utilisé pour découper les discours.
+    MOTIF_PHRASES = re.compile(r'[.!?]\s+')
+    ## Compteur des versions : chaque modification du corpus reçoit une version jamais attribuée.
+    _VERSIONS = count()
+    ## Mot entier servi par l'index positionnel : \b suivi de lettres ASCII et de \b, rien d'autre.
+    MOTIF_MOT_ENTIER = re.compile(r'\\b([A-Za-z]+)\\b')
+    ## Caractères non ASCII égaux à "i", "k" ou "s" pour re.IGNORECASE, mais pas pour le Tokenizer.
+    CASSE_SPECIALE = re.compile('[\u0130\u0131\u017f\u212a]')
+
+    def __init__(self, nom="Corpus par défaut", documents=None, id_document=0, authors=None, tokenizer=None,
+                 stockage="objets"):
         """!
         Constructeur du Corpus.
 
@@ -47,12 +77,38 @@ class Corpus:
         - **documents**: Dictionnaire initial des documents (optionnel).
         - **id_document**: Identifiant initial pour les documents (optionnel).
         - **authors**: Dictionnaire initial des auteurs (optionnel).
+        - **tokenizer**: Tokenizer utilisé pour découper les textes (Tokenizer par défaut si absent).
+        - **stockage**: "objets" (dictionnaire de Document) ou "colonnes" (StockageDocuments, plus compact).
+
+        **Notes**
+        - En stockage "colonnes", `get_documents()` retourne un StockageDocuments qui s'utilise comme le
+          dictionnaire : les documents sont reconstruits à chaque accès et la production des auteurs
+          ne contient que des identifiants (ListeDocuments).
+        - `version` change à chaque modification des documents (voir `get_version`).
         """
+        if stockage not in ("objets", "colonnes"):
+            raise ValueError(f"Stockage inconnu : {stockage} (attendu 'objets' ou 'colonnes').")
         self.nom = nom
-        self.documents = documents if documents is not None else {}
+        self.tokenizer = tokenizer if tokenizer is not None else Tokenizer()
+        self.stockage = stockage
         self.authors = authors if authors is not None else {}
-        self.id_document = len(self.documents) if documents is not None else id_document
-        self._full_text = None
+        self._token_store = None
+        self._index_positionnel = None
+        self._index_trigrammes = None
+        self._metadonnees = None
+        self._index_auteurs = None
+        self._textes_verifies = 0
+        self._casse_speciale = False
+        self.stats_requete = {}
+        self.version = next(self._VERSIONS)
+        if stockage == "colonnes":
+            self.id_document = id_document
+            self.documents = StockageDocuments(id_document)
+            for document in (documents or {}).values():
+                self.add_document(document)
+        else:
+            self.documents = documents if documents is not None else {}
+            self.id_document = len(self.documents) if documents is not None else id_document
     
     def get_nom(self):
         """!
@@ -81,6 +137,15 @@ class Corpus:
         """
         return self.id_document
     
+    def get_version(self):
+        """!
+        Accesseur pour la version du corpus.
+
+        **Returns**
+        - Un entier qui change à chaque ajout ou rechargement de documents (utilisé pour invalider les caches).
+        """
+        return self.version
+
     def get_authors(self):
         """!
         Accesseur pour les auteurs.
@@ -97,15 +162,401 @@ class Corpus:
         **Parameters**
         - **document**: Instance de Document (ou classe fille) à ajouter.
         """
-        self.documents[self.id_document] = document
+        doc_id = self.id_document
+        self.documents[doc_id] = document
+        if self._token_store is not None:
+            self._token_store.ajouter(doc_id, self.tokenizer.tokeniser(document.get_texte()))
         self.id_document += 1
+        self.version = next(self._VERSIONS)
 
         author_name = document.get_auteur()
+        colonnes = self.stockage == "colonnes"
 
         if author_name not in self.authors:
-            self.authors[author_name] = Author(author_name, 0, []) 
-        
-        self.authors[author_name].add(document)
+            production = ListeDocuments(self.documents) if colonnes else []
+            self.authors[author_name] = Author(author_name, 0, production)
+
+        # En stockage "colonnes", la production des auteurs ne référence que les identifiants
+        self.authors[author_name].add(doc_id if colonnes else document, len(document.get_texte()))
+
+    def add_documents(self, documents):
+        """!
+        Ajoute plusieurs Documents au corpus en une seule opération.
+
+        **Parameters**
+        - **documents**: Itérable d'instances de Document (ou classes filles).
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+
+        **Notes**
+        - Les identifiants sont attribués en une fois, la production de chaque auteur est complétée
+          une seule fois par auteur et les textes sont tokenisés en un lot si le TokenStore existe.
+        - Résultat identique à des appels successifs à `add_document`.
+        """
+        documents = list(documents)
+        ids = range(self.id_document, self.id_document + len(documents))
+        if self.stockage == "colonnes":
+            self.documents.ajouter_lot(ids.start, documents)
+        else:
+            self.documents.update(zip(ids, documents))
+        self._apres_ajout(ids, [document.get_texte() for document in documents],
+                          [document.get_auteur() for document in documents], documents)
+        return len(documents)
+
+    def _ajouter_colonnes(self, colonnes):
+        """!
+        Ajoute des documents décrits colonne par colonne (voir `_colonnes_corpus` et `_colonnes_discours`).
+
+        **Parameters**
+        - **colonnes**: Dictionnaire de listes alignées (classes, titres, auteurs, dates, urls, textes,
+          nb_comments, co_auteurs).
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+
+        **Notes**
+        - En stockage "colonnes", aucun objet Document n'est créé : les colonnes sont copiées telles quelles.
+        """
+        ids = range(self.id_document, self.id_document + len(colonnes['textes']))
+        if self.stockage == "colonnes":
+            documents = None
+            self.documents.ajouter_colonnes(ids.start, colonnes)
+        else:
+            documents = self._documents_depuis_colonnes(colonnes)
+            self.documents.update(zip(ids, documents))
+        self._apres_ajout(ids, colonnes['textes'], colonnes['auteurs'], documents)
+        return len(ids)
+
+    @staticmethod
+    def _documents_depuis_colonnes(colonnes):
+        """!
+        Construction des objets Document décrits colonne par colonne.
+
+        **Parameters**
+        - **colonnes**: Voir `_ajouter_colonnes`.
+
+        **Returns**
+        - Liste de Document, RedditDocument et ArxivDocument.
+        """
+        if set(colonnes['classes']) <= {Document}:
+            return list(map(Document, colonnes['titres'], colonnes['auteurs'], colonnes['dates'], colonnes['urls'],
+                            colonnes['textes']))
+
+        documents = []
+        champs = zip(colonnes['classes'], colonnes['titres'], colonnes['auteurs'], colonnes['dates'],
+                     colonnes['urls'], colonnes['textes'], colonnes['nb_comments'], colonnes['co_auteurs'])
+        for classe, titre, auteur, date, url, texte, nb, co in champs:
+            if classe is RedditDocument:
+                documents.append(RedditDocument(titre, auteur, date, url, texte, nb))
+            elif classe is ArxivDocument:
+                documents.append(ArxivDocument(titre, auteur, date, url, texte, co_auteurs=co))
+            else:
+                documents.append(Document(titre, auteur, date, url, texte))
+        return documents
+
+    def _apres_ajout(self, ids, textes, auteurs, documents):
+        """!
+        Mises à jour communes après l'ajout d'un lot de documents : TokenStore, identifiant, cache et auteurs.
+
+        **Parameters**
+        - **ids**: Identifiants attribués aux documents (range).
+        - **textes**: Textes des documents.
+        - **auteurs**: Auteurs des documents.
+        - **documents**: Objets Document (stockage "objets"), ou None en stockage "colonnes".
+        """
+        if self._token_store is not None:
+            self._token_store.ajouter_lot(ids, self.tokenizer.tokeniser_lot(textes))
+        self.id_document += len(ids)
+        # Version changée une seule fois pour tout le lot
+        self.version = next(self._VERSIONS)
+
+        # Regroupement par auteur (tri stable des codes) : une mise à jour par auteur et non par document
+        colonnes = self.stockage == "colonnes"
+        codes, noms = pd.factorize(pd.Series(auteurs, dtype=object))
+        ordre = np.argsort(codes, kind='stable')
+        bornes = np.cumsum(np.bincount(codes, minlength=len(noms)))
+        for author_name, debut, fin in zip(noms, np.concatenate([[0], bornes[:-1]]), bornes):
+            positions = ordre[debut:fin].tolist()
+            if author_name not in self.authors:
+                self.authors[author_name] = Author(author_name, 0, ListeDocuments(self.documents) if colonnes else [])
+            tailles = [len(textes[p]) for p in positions]
+            if colonnes:
+                self.authors[author_name].add_all([ids.start + p for p in positions], tailles)
+            else:
+                self.authors[author_name].add_all([documents[p] for p in positions], tailles)
+
+    def _iter_textes(self):
+        """!
+        Parcours des textes de tous les documents, dans l'ordre des identifiants.
+
+        **Returns**
+        - Un itérable des textes (sans reconstruire les documents en stockage "colonnes").
+        """
+        if self.stockage == "colonnes":
+            return self.documents.iter_textes()
+        return (doc.get_texte() for doc in self.documents.values())
+
+    def get_token_store(self):
+        """!
+        Accesseur pour la représentation tokenisée du corpus.
+
+        **Returns**
+        - L'objet TokenStore, construit à la première demande puis mis à jour par `add_document`.
+
+        **Notes**
+        - Chaque document n'est tokenisé qu'une seule fois.
+        """
+        if self._token_store is None:
+            self._token_store = TokenStore()
+            self._token_store.ajouter_lot(self.documents.keys(), self.tokenizer.tokeniser_lot(self._iter_textes()))
+        return self._token_store
+
+    def has_token_store(self):
+        """!
+        Indique si la représentation tokenisée du corpus est déjà construite.
+
+        **Returns**
+        - Vrai si le TokenStore existe.
+        """
+        return self._token_store is not None
+
+    def set_token_store(self, store):
+        """!
+        Mutateur pour la représentation tokenisée du corpus (par exemple construite en parallèle).
+
+        **Parameters**
+        - **store**: TokenStore contenant tous les documents du corpus, dans l'ordre.
+        """
+        self._token_store = store
+        self._index_positionnel = None
+
+    def get_index_positionnel(self):
+        """!
+        Accesseur pour l'index positionnel du corpus (terme -> document, position, positions dans le texte).
+
+        **Returns**
+        - L'objet IndexPositionnel, construit à la première demande puis complété avec les documents ajoutés.
+
+        **Notes**
+        - Réutilise les tokens du TokenStore : seules les positions dans les textes sont calculées.
+        """
+        if self._index_positionnel is None:
+            self._index_positionnel = IndexPositionnel(self.get_token_store(), self.tokenizer)
+        index = self._index_positionnel
+        if len(index) < len(self.documents):
+            index.actualiser(islice(self._iter_textes(), len(index), None))
+        return index
+
+    def get_index_trigrammes(self):
+        """!
+        Accesseur pour l'index de trigrammes des textes (expressions régulières de `search` et `concorde`).
+
+        **Returns**
+        - L'objet IndexTrigrammes, construit à la première demande puis complété avec les documents ajoutés.
+        """
+        if self._index_trigrammes is None:
+            self._index_trigrammes = IndexTrigrammes()
+        index = self._index_trigrammes
+        if len(index) < len(self.documents):
+            index.ajouter(islice(self.documents.keys(), len(index), None),
+                          islice(self._iter_textes(), len(index), None))
+        return index
+
+    def get_metadonnees(self):
+        """!
+        Accesseur pour les métadonnées des documents en colonnes (filtres de recherche du SearchEngine,
+        tris par date et par titre).
+
+        **Returns**
+        - L'objet Metadonnees, construit à la première demande puis complété avec les documents ajoutés.
+
+        **Notes**
+        - Les documents ajoutés depuis le dernier accès sont traités en un seul lot : leurs dates sont
+          analysées et les index triés (dates, titres) complétés par fusion.
+        """
+        if self._metadonnees is None:
+            self._metadonnees = Metadonnees()
+        metadonnees = self._metadonnees
+        if len(metadonnees) < len(self.documents):
+            metadonnees.ajouter(self._colonnes_metadonnees(len(metadonnees)))
+        return metadonnees
+
+    def _colonnes_metadonnees(self, debut):
+        """!
+        Métadonnées des documents à partir d'une position, colonne par colonne.
+
+        **Parameters**
+        - **debut**: Position (dans l'ordre du corpus) du premier document.
+
+        **Returns**
+        - Dictionnaire de listes alignées : ids, types, auteurs, dates, nb_comments, titres.
+
+        **Notes**
+        - En stockage "colonnes", les valeurs sont lues dans les colonnes, sans reconstruire les documents.
+        """
+        if self.stockage == "colonnes":
+            stockage = self.documents
+            positions = range(debut, len(stockage))
+            return {
+                'ids': [stockage.premier_id + i for i in positions],
+                'types': [stockage.TYPES[stockage.codes_types[i]] for i in positions],
+                'auteurs': [stockage.auteurs[stockage.codes_auteurs[i]] for i in positions],
+                'dates': [stockage.dates[i] for i in positions],
+                'nb_comments': stockage.nb_comments[debut:],
+                'titres': [stockage.titres[i] for i in positions]
+            }
+        documents = list(islice(self.documents.items(), debut, None))
+        return {
+            'ids': [doc_id for doc_id, _ in documents],
+            'types': [doc.getType() for _, doc in documents],
+            'auteurs': [doc.get_auteur() for _, doc in documents],
+            'dates': [doc.get_date() for _, doc in documents],
+            'nb_comments': [getattr(doc, 'nb_comments', 0) for _, doc in documents],
+            'titres': [doc.get_titre() for _, doc in documents]
+        }
+
+    def get_index_auteurs(self):
+        """!
+        Accesseur pour l'index des auteurs et co-auteurs (nom normalisé -> identifiants des documents).
+
+        **Returns**
+        - L'objet IndexAuteurs, construit à la première demande puis complété avec les documents ajoutés.
+
+        **Notes**
+        - Contrairement à `authors`, les co-auteurs des ArxivDocument sont indexés, et les noms se
+          cherchent sans tenir compte de la casse ou par préfixe (voir IndexAuteurs).
+        """
+        if self._index_auteurs is None:
+            self._index_auteurs = IndexAuteurs()
+        index = self._index_auteurs
+        if len(index) < len(self.documents):
+            index.ajouter(*self._colonnes_auteurs(len(index)))
+        return index
+
+    def _colonnes_auteurs(self, debut):
+        """!
+        Auteurs, co-auteurs et tailles des textes des documents à partir d'une position.
+
+        **Parameters**
+        - **debut**: Position (dans l'ordre du corpus) du premier document.
+
+        **Returns**
+        - Un quadruplet de listes alignées (identifiants, auteurs, listes de co-auteurs, tailles des textes).
+        """
+        if self.stockage == "colonnes":
+            stockage = self.documents
+            positions = range(debut, len(stockage))
+            offsets = stockage.offsets_co_auteurs
+            return ([stockage.premier_id + i for i in positions],
+                    [stockage.auteurs[stockage.codes_auteurs[i]] for i in positions],
+                    [[stockage.auteurs[code] for code in stockage.co_auteurs[offsets[i]:offsets[i + 1]]]
+                     for i in positions],
+                    [len(stockage.textes[i]) for i in positions])
+        documents = list(islice(self.documents.items(), debut, None))
+        return ([doc_id for doc_id, _ in documents],
+                [doc.get_auteur() for _, doc in documents],
+                [getattr(doc, 'co_auteurs', None) or [] for _, doc in documents],
+                [len(doc.get_texte()) for _, doc in documents])
+
+    def _documents_candidats(self, motif):
+        """!
+        Documents à parcourir avec une expression régulière : ceux qui contiennent ses trigrammes obligatoires.
+
+        **Parameters**
+        - **motif**: Expression régulière compilée.
+
+        **Returns**
+        - Un couple (itérateur de couples (id du document, texte) dans l'ordre du corpus, booléen vrai
+          si tous les documents sont parcourus).
+
+        **Notes**
+        - Tous les documents sont parcourus si aucun trigramme ne peut être extrait du motif.
+        - Le nombre de documents candidats est enregistré dans `stats_requete`.
+        """
+        index = self.get_index_trigrammes()
+        lignes = index.candidats(motif)
+        if lignes is None:
+            self._enregistrer_stats("parcours complet", len(self.documents))
+            return zip(self.documents.keys(), self._iter_textes()), True
+
+        self._enregistrer_stats("trigrammes", len(lignes))
+        return ((doc_id, self._get_texte(doc_id)) for doc_id in index.ids_docs[lignes].tolist()), False
+
+    def _enregistrer_stats(self, methode, candidats):
+        """!
+        Enregistre les statistiques de la dernière recherche de motif (`search` ou `concorde`).
+
+        **Parameters**
+        - **methode**: "index positionnel", "trigrammes" ou "parcours complet".
+        - **candidats**: Nombre de documents examinés.
+        """
+        n_documents = len(self.documents)
+        self.stats_requete = {
+            'methode': methode,
+            'documents': n_documents,
+            'candidats': candidats,
+            'ratio_candidats': candidats / n_documents if n_documents else 0.0
+        }
+
+    def _mot_simple(self, motif):
+        """!
+        Indique si un motif est un mot entier servi par l'index positionnel.
+
+        **Parameters**
+        - **motif**: Motif recherché par `concorde`.
+
+        **Returns**
+        - Le token correspondant, ou None si le motif doit être cherché avec une expression régulière.
+
+        **Notes**
+        - Seul un motif explicitement de la forme `\\bmot\\b` (lettres ASCII) est concerné : un mot nu
+          ("ski") reste une sous-chaîne ("skiing", "Kaski"), comme avec `re.finditer`.
+        - Le mot doit être conservé tel quel par le Tokenizer (ni mot vide, ni trop court).
+        - Les occurrences de l'index sont ensuite vérifiées avec l'expression régulière (voir `_occurrences`) :
+          il faut encore qu'aucune occurrence de l'expression ne lui échappe. C'est le cas, sauf si un texte contient
+          un des caractères de `CASSE_SPECIALE` (égal à "i", "k" ou "s" pour `re.IGNORECASE`).
+        """
+        correspondance = self.MOTIF_MOT_ENTIER.fullmatch(motif)
+        if correspondance is None:
+            return None
+        mot = correspondance.group(1).lower()
+        if self.tokenizer.tokeniser(mot) != [mot]:
+            return None
+        if not set(mot).isdisjoint("iks") and self._a_casse_speciale():
+            return None
+        return mot
+
+    def _a_casse_speciale(self):
+        """!
+        Indique si un texte du corpus contient un caractère de `CASSE_SPECIALE`.
+
+        **Returns**
+        - Vrai si un tel caractère est présent.
+
+        **Notes**
+        - Seuls les textes ajoutés depuis la dernière vérification sont relus.
+        """
+        if not self._casse_speciale and self._textes_verifies < len(self.documents):
+            textes = islice(self._iter_textes(), self._textes_verifies, None)
+            self._casse_speciale = any(self.CASSE_SPECIALE.search(texte) for texte in textes)
+            self._textes_verifies = len(self.documents)
+        return self._casse_speciale
+
+    def signature(self):
+        """!
+        Empreinte du contenu du corpus (identifiants, titres et tailles des textes).
+
+        **Returns**
+        - Chaîne hexadécimale SHA-256.
+
+        **Notes**
+        - Permet de vérifier qu'un index enregistré correspond bien à ce corpus.
+        """
+        empreinte = hashlib.sha256()
+        for doc_id, doc in self.documents.items():
+            empreinte.update(f"{doc_id}\x1f{doc.get_titre()}\x1f{len(doc.get_texte())}\x1e".encode('utf-8'))
+        return empreinte.hexdigest()
 
     def add_author(self, author):
         """!
@@ -134,15 +585,16 @@ class Corpus:
 
         **Parameters**
         - **n**: Nombre de documents à afficher.
+
+        **Notes**
+        - Les dates sont comparées après analyse (formats ISO, "April 12, 2015", ...) et non comme
+          des chaînes ; les dates inconnues viennent en dernier.
+        - Lecture des n premiers documents de l'index trié des dates (voir `get_metadonnees`).
         """
         print(f"\n--- {n} documents les plus récents de {self.nom} ---")
-        sorted_docs = sorted(
-            self.documents.values(), 
-            key=lambda doc: doc.get_date(), 
-            reverse=True
-        )   
-        for i, doc in enumerate(sorted_docs[:n]):
-            print(f"[{i + 1}] {doc}")
+        metadonnees = self.get_metadonnees()
+        for i, doc_id in enumerate(metadonnees.ids[metadonnees.premiers('dates', n, decroissant=True)].tolist()):
+            print(f"[{i + 1}] {self.documents[doc_id]}")
 
     def get_sorted_by_title(self, n=10):
         """!
@@ -150,14 +602,38 @@ class Corpus:
 
         **Parameters**
         - **n**: Nombre de documents à afficher.
+
+        **Notes**
+        - Lecture des n premiers documents de l'index trié des titres (en minuscules).
         """
         print(f"\n--- {n} documents triés par titre de {self.nom} ---")
-        sorted_docs = sorted(
-            self.documents.values(), 
-            key=lambda doc: doc.get_titre().lower()
-        )  
-        for i, doc in enumerate(sorted_docs[:n]):
-            print(f"[{i + 1}] {doc}")
+        metadonnees = self.get_metadonnees()
+        for i, doc_id in enumerate(metadonnees.ids[metadonnees.premiers('titres', n)].tolist()):
+            print(f"[{i + 1}] {self.documents[doc_id]}")
+
+    def get_ids_by_date(self, date_min=None, date_max=None, n=None, recent=False):
+        """!
+        Identifiants des documents dont la date est comprise entre deux bornes, triés par date.
+
+        **Parameters**
+        - **date_min**: Borne inférieure incluse (chaîne, datetime ou secondes depuis l'epoch ; None : aucune).
+        - **date_max**: Borne supérieure incluse (None : aucune).
+        - **n**: Nombre maximal de documents (None : tous).
+        - **recent**: Si vrai, du plus récent au plus ancien.
+
+        **Returns**
+        - Tableau NumPy des identifiants (à date égale, par ordre d'ajout) ; les dates inconnues sont exclues.
+
+        **Notes**
+        - Deux recherches dichotomiques dans l'index trié des dates, puis lecture de la tranche :
+          le coût dépend de la taille de la tranche, pas du nombre total de documents.
+        """
+        metadonnees = self.get_metadonnees()
+        bornes = [None if date is None else Metadonnees.instant(date) for date in (date_min, date_max)]
+        for borne, date in zip(bornes, (date_min, date_max)):
+            if borne is not None and np.isnan(borne):
+                raise ValueError(f"Date invalide : {date!r}")
+        return metadonnees.ids[metadonnees.intervalle('dates', *bornes, n=n, decroissant=recent)]
 
     def save(self, filename='corpus.csv'):
         """!
@@ -204,14 +680,170 @@ class Corpus:
             return
 
         self.nom = nom
-        self.documents = {}
+        self.documents = StockageDocuments() if self.stockage == "colonnes" else {}
         self.authors = {}
         self.id_document = 0
+        self._token_store = None
+        self._index_positionnel = None
+        self._index_trigrammes = None
+        self._metadonnees = None
+        self._index_auteurs = None
+        self._textes_verifies = 0
+        self._casse_speciale = False
+        self.version = next(self._VERSIONS)
         
         self.df_data = df
         
         print(f"Chargement terminé. {len(self.df_data)} lignes de données chargées.")
     
+    def load_stream(self, chemin, taille_bloc=2000, moteur=None, phrases=False):
+        """!
+        Charge un fichier CSV par blocs et ajoute ses documents au corpus.
+
+        **Parameters**
+        - **chemin**: Chemin du fichier (format de `save`, comme corpus_data.csv, ou des discours, comme discours_US.csv).
+        - **taille_bloc**: Nombre de lignes lues à la fois.
+        - **moteur**: SearchEngine à mettre à jour après chaque bloc (optionnel, voir `SearchEngine.actualiser`).
+        - **phrases**: Si vrai, chaque discours est découpé en phrases (un document par phrase de plus de 20 caractères).
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+
+        **Notes**
+        - Contrairement à `load`, les documents sont reconstruits (RedditDocument, ArxivDocument ou Document)
+          et ajoutés à la suite des documents existants.
+        - Seul un bloc de lignes est en mémoire à la fois : la mémoire utilisée par la lecture ne dépend pas
+          de la taille du fichier. Les colonnes sont converties par bloc (opérations vectorisées pandas).
+        """
+        print(f"\n-> Chargement par blocs depuis {chemin}...")
+        with open(chemin, encoding='utf-8') as fichier:
+            colonnes = [c.strip().strip('"') for c in fichier.readline().split('\t')]
+
+        conversion = self._conversion(colonnes)
+        options = {'quoting': csv.QUOTE_NONE, 'escapechar': '\\'} if conversion == self._colonnes_discours else {}
+
+        debut = time.perf_counter()
+        n_documents = 0
+        lecteur = pd.read_csv(chemin, sep='\t', chunksize=taille_bloc, dtype=str, keep_default_na=False, **options)
+        for bloc in lecteur:
+            bloc.columns = colonnes
+            n_documents += self._ajouter_colonnes(conversion(bloc, phrases))
+            if moteur is not None:
+                moteur.actualiser()
+
+        duree = time.perf_counter() - debut
+        print(f"Chargement terminé. {n_documents} documents ajoutés en {duree:.2f} s "
+              f"({n_documents / duree if duree > 0 else 0:,.0f} documents/s).")
+        return n_documents
+
+    def _conversion(self, colonnes):
+        """!
+        Choix de la reconstruction des documents selon les colonnes d'un fichier ou d'un DataFrame.
+
+        **Parameters**
+        - **colonnes**: Noms des colonnes (sans guillemets).
+
+        **Returns**
+        - La méthode de conversion (`_colonnes_corpus` ou `_colonnes_discours`).
+        """
+        if set(self.COLONNES_CORPUS) <= set(colonnes):
+            return self._colonnes_corpus
+        if set(self.COLONNES_DISCOURS) <= set(colonnes):
+            return self._colonnes_discours
+        raise ValueError(f"Format de données non reconnu (colonnes : {colonnes}).")
+
+    def from_dataframe(self, df, phrases=False):
+        """!
+        Ajoute au corpus les documents d'un DataFrame, en une seule opération.
+
+        **Parameters**
+        - **df**: DataFrame au format de `save` (corpus_data.csv) ou des discours (discours_US.csv).
+        - **phrases**: Si vrai, chaque discours est découpé en phrases (un document par phrase de plus de 20 caractères).
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+
+        **Notes**
+        - Les colonnes sont converties en une fois (opérations vectorisées pandas), puis ajoutées en un lot
+          (voir `add_documents`). Les valeurs manquantes deviennent des chaînes vides.
+        """
+        colonnes = [str(c).strip().strip('"') for c in df.columns]
+        conversion = self._conversion(colonnes)
+        df = df.fillna('').astype(str).set_axis(colonnes, axis=1)
+        return self._ajouter_colonnes(conversion(df, phrases))
+
+    def from_records(self, records, phrases=False):
+        """!
+        Ajoute au corpus des documents décrits par des dictionnaires (un par document).
+
+        **Parameters**
+        - **records**: Itérable de dictionnaires ayant les clés d'un des formats de `from_dataframe`.
+        - **phrases**: Voir `from_dataframe`.
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+        """
+        return self.from_dataframe(pd.DataFrame.from_records(list(records)), phrases)
+
+    def _colonnes_corpus(self, bloc, phrases=False):
+        """!
+        Conversion des colonnes d'un bloc au format de `save`.
+
+        **Parameters**
+        - **bloc**: DataFrame du bloc (colonnes en chaînes de caractères).
+        - **phrases**: Non utilisé pour ce format.
+
+        **Returns**
+        - Dictionnaire de listes alignées (voir `_ajouter_colonnes`) de RedditDocument et ArxivDocument.
+        """
+        titres, auteurs, dates, urls, textes = [bloc[col].str.strip().tolist()
+                                                for col in ['titre', 'auteur', 'date', 'url', 'texte']]
+        est_reddit = (bloc['type'].str.strip().str.lower() == 'reddit').tolist()
+        nb_comments = pd.to_numeric(bloc['nb_comments'], errors='coerce').fillna(0).astype(int).tolist()
+
+        # Co-auteurs : éléments de la liste écrite par str(list), ou la valeur brute si ce n'est pas une liste
+        brut = bloc['co_auteurs'].str.strip()
+        elements = brut.str.findall(self.MOTIF_CO_AUTEURS)
+        co_auteurs = [[a or b for a, b in liste] if texte.startswith('[') else ([texte] if texte else [])
+                      for texte, liste in zip(brut.tolist(), elements.tolist())]
+
+        return {
+            'classes': [RedditDocument if reddit else ArxivDocument for reddit in est_reddit],
+            'titres': titres, 'auteurs': auteurs, 'dates': dates, 'urls': urls, 'textes': textes,
+            # Le nombre de commentaires ne concerne que Reddit, les co-auteurs qu'Arxiv
+            'nb_comments': [nb if reddit else 0 for nb, reddit in zip(nb_comments, est_reddit)],
+            'co_auteurs': [[] if reddit else co for co, reddit in zip(co_auteurs, est_reddit)]
+        }
+
+    def _colonnes_discours(self, bloc, phrases=False):
+        """!
+        Conversion des colonnes d'un bloc au format des discours.
+
+        **Parameters**
+        - **bloc**: DataFrame du bloc (colonnes en chaînes de caractères).
+        - **phrases**: Si vrai, un document par phrase de plus de 20 caractères.
+
+        **Returns**
+        - Dictionnaire de listes alignées (voir `_ajouter_colonnes`) de Document.
+        """
+        champs = [bloc[col].str.strip().str.strip('"').tolist() for col in ['speaker', 'text', 'date', 'descr', 'link']]
+        if phrases:
+            lignes = []
+            for auteur, texte, date, titre, url in zip(*champs):
+                for i, phrase in enumerate(self.MOTIF_PHRASES.split(texte), 1):
+                    phrase = phrase.strip()
+                    if len(phrase) > 20:
+                        lignes.append((f"{titre} (phrase {i})", auteur, date, url, phrase))
+            titres, auteurs, dates, urls, textes = map(list, zip(*lignes)) if lignes else ([], [], [], [], [])
+        else:
+            auteurs, textes, dates, titres, urls = champs
+
+        return {
+            'classes': [Document] * len(textes),
+            'titres': titres, 'auteurs': auteurs, 'dates': dates, 'urls': urls, 'textes': textes,
+            'nb_comments': [0] * len(textes), 'co_auteurs': [[]] * len(textes)
+        }
+
     def display_types(self, n=10):
         """!
         Affiche les types des 'n' premiers documents du corpus.
@@ -221,7 +853,7 @@ class Corpus:
         """
         print(f"\n--- Types des documents dans le corpus '{self.nom}' ---")
         # Affiche seulement les n premiers pour éviter de polluer la console
-        for doc_id, doc in list(self.documents.items())[:n]:
+        for doc_id, doc in islice(self.documents.items(), n):
             print(f"ID {doc_id}: Type = {doc.getType()}")
 
     def search(self, keyword):
@@ -233,63 +865,162 @@ class Corpus:
 
         **Returns**
         - Liste des extraits contenant le mot-clé.
+
+        **Notes**
+        - Le mot-clé est cherché avec une expression régulière dans les seuls documents qui contiennent
+          ses trigrammes (voir `get_index_trigrammes`). Les extraits ne débordent jamais sur un autre document.
+        - La proportion de documents examinés est disponible dans `stats_requete`.
         """
-        if self._full_text is None:
-            self._build_full_text()
         pattern = re.compile(r".{0,40}\b" + re.escape(keyword) + r"\b.{0,40}", re.IGNORECASE)
-        return pattern.findall(self._full_text)
-    
-    def _build_full_text(self):
+        extraits = []
+        documents, _ = self._documents_candidats(pattern)
+        for _, texte in documents:
+            extraits.extend(pattern.findall(texte))
+        return extraits
+
+    def _get_texte(self, doc_id):
         """!
-        Construit la chaîne de texte complète du corpus pour les recherches.
+        Texte d'un document (sans reconstruire le document en stockage "colonnes").
+
+        **Parameters**
+        - **doc_id**: Identifiant du document.
+
+        **Returns**
+        - Le texte du document.
         """
-        self._full_text = " ".join(doc.get_texte() for doc in self.documents.values())
+        if self.stockage == "colonnes":
+            return self.documents.get_texte(doc_id)
+        return self.documents[doc_id].get_texte()
 
-    def concorde(self, pattern, context_size=30):
+    def _occurrences(self, pattern, debut=0, fin=None, n_workers=1, taille_lot=500):
         """!
-        Génère une concordance pour un motif donné dans le corpus.
+        Occurrences d'un motif dans le corpus, produites au fil de l'eau.
 
         **Parameters**
         - **pattern**: Motif (expression régulière) à rechercher.
+        - **debut**, **fin**: Rangs de la première occurrence produite et de celle qui suit la dernière.
+        - **n_workers**, **taille_lot**: Voir `iter_concorde`.
+
+        **Returns**
+        - Générateur de quadruplets (id du document, texte, début, fin), dans l'ordre du corpus.
+        """
+        motif = re.compile(pattern, re.IGNORECASE)
+        mot = self._mot_simple(pattern)
+        if mot is not None:
+            yield from islice(self._occurrences_index(mot, motif), debut, fin)
+            return
+
+        documents, complet = self._documents_candidats(motif)
+        if complet and n_workers != 1:
+            occurrences = RechercheParallele(n_workers, taille_lot).occurrences(motif, documents)
+        else:
+            occurrences = ((doc_id, texte, match.start(), match.end())
+                           for doc_id, texte in documents for match in motif.finditer(texte))
+        try:
+            yield from islice(occurrences, debut, fin)
+        finally:
+            # Arrêt anticipé : les lots encore en attente dans les processus sont annulés
+            occurrences.close()
+
+    def _occurrences_index(self, mot, motif):
+        """!
+        Occurrences d'un mot entier lues dans l'index positionnel.
+
+        **Parameters**
+        - **mot**: Le token (voir `_mot_simple`).
+        - **motif**: Expression régulière compilée `\\bmot\\b`.
+
+        **Returns**
+        - Générateur de quadruplets (id du document, texte, début, fin), dans l'ordre du corpus.
+
+        **Notes**
+        - Chaque occurrence est vérifiée avec `motif` à sa position : un token collé à un chiffre, à "_" ou à
+          une lettre accentuée ("peace2", "peaceé"), ou dont le texte diffère du mot (accents retirés par le
+          Tokenizer), n'est pas une occurrence de l'expression régulière.
+        """
+        index = self.get_index_positionnel()
+        self._enregistrer_stats("index positionnel", index.frequence_documentaire(mot))
+        n_occurrences = len(index.indices(mot))
+        texte, doc_courant = None, None
+        # Occurrences lues par tranches : le premier résultat ne dépend pas du nombre d'occurrences
+        for tranche in range(0, n_occurrences, 1024):
+            ids_docs, _, debuts, fins = index.occurrences(mot, tranche, tranche + 1024)
+            for doc_id, debut, fin in zip(ids_docs.tolist(), debuts.tolist(), fins.tolist()):
+                if doc_id != doc_courant:
+                    texte, doc_courant = self._get_texte(doc_id), doc_id
+                correspondance = motif.match(texte, debut)
+                if correspondance is not None and correspondance.end() == fin:
+                    yield doc_id, texte, debut, fin
+
+    def iter_concorde(self, pattern, context_size=30, limit=None, offset=0, n_workers=1, taille_lot=500, mot=False):
+        """!
+        Concordance produite au fil de l'eau, avec pagination.
+
+        **Parameters**
+        - **pattern**: Motif (expression régulière) à rechercher, ou mot si `mot` est vrai.
         - **context_size**: Taille du contexte à extraire autour du motif.
+        - **limit**: Nombre maximal d'occurrences produites (None : toutes).
+        - **offset**: Nombre d'occurrences sautées avant la première produite.
+        - **n_workers**: Nombre de processus pour parcourir les textes quand le motif ne peut pas être filtré
+          par les index (1 : parcours séquentiel, None : tous les cœurs).
+        - **taille_lot**: Nombre de documents par lot traité par un processus.
+        - **mot**: Si vrai, `pattern` est un mot cherché en entier (`\\bmot\\b`, caractères spéciaux échappés)
+          et non une expression régulière.
 
         **Returns**
-        - DataFrame avec colonnes "contexte gauche", "motif trouvé", "contexte droit".
+        - Générateur de dictionnaires (colonnes de `concorde`, plus "position" : début de l'occurrence
+          dans le texte de son document), dans l'ordre du corpus.
+
+        **Notes**
+        - Rien n'est calculé avant la première occurrence demandée : le temps d'obtention des premiers
+          résultats ne dépend pas du nombre total d'occurrences, et les textes non encore parcourus
+          ne le sont jamais si le générateur n'est pas consommé jusqu'au bout.
+        - Un mot entier (`mot=True`, ou un motif `\\bmot\\b`) est servi par l'index positionnel, sans parcours
+          des textes.
         """
-        if self._full_text is None:
-            self._build_full_text()
-        text = self._full_text
-        
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        
-        results = []
-        
-        for match in matches:
-            start_index = match.start()
-            end_index = match.end()
-            motif = match.group()
-            
-            # Extraire le contexte gauche
-            # Début du contexte = max(0, start_index - taille du contexte)
-            context_gauche_start = max(0, start_index - context_size)
-            context_gauche = text[context_gauche_start:start_index].strip()
-            
-            # Extraire le contexte droit
-            # Fin du contexte = min(longueur totale, end_index + taille du contexte)
-            context_droit_end = min(len(text), end_index + context_size)
-            context_droit = text[end_index:context_droit_end].strip()
-            
-            results.append({
-                "contexte gauche": context_gauche,
-                "motif trouvé": motif,
-                "contexte droit": context_droit
-            })
-        
+        if mot:
+            pattern = rf"\b{re.escape(pattern)}\b"
+        fin = None if limit is None else offset + limit
+        for doc_id, texte, debut, fin_occurrence in self._occurrences(pattern, offset, fin, n_workers, taille_lot):
+            # Contextes limités au document de l'occurrence
+            yield {
+                "contexte gauche": texte[max(0, debut - context_size):debut].strip(),
+                "motif trouvé": texte[debut:fin_occurrence],
+                "contexte droit": texte[fin_occurrence:fin_occurrence + context_size].strip(),
+                "id document": doc_id,
+                "position": debut
+            }
+
+    def concorde(self, pattern, context_size=30, limit=None, offset=0, n_workers=1, mot=False):
+        """!
+        Génère une concordance pour un motif donné dans le corpus.
+
+        **Parameters**
+        - **pattern**: Motif (expression régulière) à rechercher, ou mot si `mot` est vrai.
+        - **context_size**: Taille du contexte à extraire autour du motif.
+        - **limit**, **offset**: Pagination des occurrences (toutes par défaut), voir `iter_concorde`.
+        - **n_workers**: Voir `iter_concorde`.
+        - **mot**: Si vrai, `pattern` est un mot cherché en entier, voir `iter_concorde`.
+
+        **Returns**
+        - DataFrame avec colonnes "contexte gauche", "motif trouvé", "contexte droit", "id document".
+
+        **Notes**
+        - Un mot entier (`concorde("peace", mot=True)`, équivalent à `concorde(r"\\bpeace\\b")`) est servi par
+          l'index positionnel, sans parcours des textes, avec les mêmes occurrences que `re.finditer`.
+        - Tout autre motif est cherché avec `re.finditer` dans les seuls documents qui contiennent ses
+          trigrammes. Sans `mot=True`, un mot nu est une sous-chaîne : "peace" trouve aussi "peaceful".
+        - Les contextes sont coupés aux limites du document de l'occurrence.
+        - La proportion de documents examinés est disponible dans `stats_requete`.
+        """
+        colonnes = ["contexte gauche", "motif trouvé", "contexte droit", "id document"]
+        results = list(self.iter_concorde(pattern, context_size, limit, offset, n_workers, mot=mot))
+
         if not results:
             print(f"Aucune occurrence du motif '{pattern}' trouvée.")
-            return pd.DataFrame(columns=["contexte gauche", "motif trouvé", "contexte droit"])
-            
-        concordancier = pd.DataFrame(results)
+            return pd.DataFrame(columns=colonnes)
+
+        concordancier = pd.DataFrame(results, columns=colonnes)
         return concordancier
     
     def nettoyer_texte(self, text):
@@ -301,18 +1032,11 @@ class Corpus:
 
         **Returns**
         - Texte nettoyé (minuscules, caractères non alphabétiques retirés, espaces normalisés).
+
+        **Notes**
+        - Délègue au Tokenizer du corpus ; préférer `tokenizer.tokeniser` qui évite de recouper la chaîne.
         """
-        text = text.lower()
-        
-        text = text.replace('\n', ' ')
-        
-        # [^a-z] signifie "tout ce qui n'est pas une lettre minuscule"
-        text = re.sub(r'[^a-z\s]+', ' ', text)
-        
-        # Remplacement des espaces multiples par un seul espace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return ' '.join(self.tokenizer.tokeniser(text))
     
     def stats(self, n=10):
         """!
@@ -329,37 +1053,16 @@ class Corpus:
         print(f"Nombre d'auteurs: {len(self.authors)}")
         print("\nStats textuelles :")
         
-        # Dictionnaire pour stocker les occurrences globales (Term Frequency)
-        word_counts = {} 
-        
-        # Dictionnaire pour stocker les documents contenant chaque mot (Document Frequency)
-        doc_word_set = {}
-        
-        all_words = []
+        # Occurrences globales (TF) et nombre de documents (DF) depuis les tokens déjà calculés
+        store = self.get_token_store()
+        tf, df = store.frequences()
+        presents = tf > 0
+        mots = [store.liste_termes[i] for i in presents.nonzero()[0]]
 
-        for doc in self.documents.values():
-            text_nettoye = self.nettoyer_texte(doc.get_texte())
-            
-            mots_du_doc = text_nettoye.split(' ')
-            
-            mots_uniques_du_doc = set(mots_du_doc)
-            
-            for mot in mots_uniques_du_doc:
-                if mot:
-                    doc_word_set[mot] = doc_word_set.get(mot, 0) + 1
-            
-            # Ajout des mots pour le calcul de la fréquence totale (TF)
-            all_words.extend(mots_du_doc)
+        df_freq = pd.DataFrame({'Mot': mots, 'Term Frequency (TF)': tf[presents]})
+        df_freq['Document Frequency (DF)'] = df[presents]
 
-        
-        # Utilisation d'un dictionnaire pour compter la fréquence (plus rapide que boucler à la main)
-        word_counts = Counter([word for word in all_words if word])
-
-        df_freq = pd.DataFrame(word_counts.items(), columns=['Mot', 'Term Frequency (TF)'])
-        
-        df_freq['Document Frequency (DF)'] = df_freq['Mot'].apply(lambda mot: doc_word_set.get(mot, 0))
-        
-        print(f"1. Nombre de mots différents dans le corpus (Vocabulaire): {len(word_counts)} mots.") 
+        print(f"1. Nombre de mots différents dans le corpus (Vocabulaire): {len(df_freq)} mots.") 
         
         print(f"\n2. {n} mots les plus fréquents (Term Frequency, TF) :")
         
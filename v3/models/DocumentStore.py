@@ -0,0 +1,409 @@
+"""!
+# DocumentStore.py
+
+Stockage des documents du corpus en colonnes (alternative au dictionnaire d'objets Document).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from array import array
+from itertools import accumulate, chain
+from collections.abc import Mapping
+from numbers import Integral
+from models.Document import Document, RedditDocument, ArxivDocument
+
+
+class ColonneTexte:
+    """!
+    # ColonneTexte
+
+    Colonne de chaînes stockée dans un seul tampon UTF-8, avec la position de début de chaque valeur.
+    """
+
+    def __init__(self):
+        """!
+        Constructeur d'une colonne vide.
+        """
+        self.tampon = bytearray()
+        self.offsets = array('q', [0])
+
+    def __len__(self):
+        """!
+        Nombre de valeurs.
+
+        **Returns**
+        - Le nombre de valeurs de la colonne.
+        """
+        return len(self.offsets) - 1
+
+    def ajouter(self, valeur):
+        """!
+        Ajoute une valeur à la fin de la colonne.
+
+        **Parameters**
+        - **valeur**: La chaîne à ajouter (convertie avec `str` si besoin).
+        """
+        self.tampon += str(valeur).encode('utf-8')
+        self.offsets.append(len(self.tampon))
+
+    def ajouter_lot(self, valeurs):
+        """!
+        Ajoute plusieurs valeurs à la fin de la colonne.
+
+        **Parameters**
+        - **valeurs**: Liste des chaînes à ajouter.
+        """
+        valeurs = [valeur if isinstance(valeur, str) else str(valeur) for valeur in valeurs]
+        texte = ''.join(valeurs)
+        if texte.isascii():
+            # Texte ASCII : un caractère par octet, un seul encodage pour tout le lot
+            longueurs = map(len, valeurs)
+        else:
+            longueurs = [len(valeur.encode('utf-8')) for valeur in valeurs]
+        self.offsets.extend(accumulate(longueurs, initial=len(self.tampon)))
+        # La position initiale est déjà présente dans `offsets`
+        self.offsets.pop(len(self.offsets) - len(valeurs) - 1)
+        self.tampon += texte.encode('utf-8')
+
+    def __getitem__(self, position):
+        """!
+        Valeur à une position.
+
+        **Parameters**
+        - **position**: Position de la valeur.
+
+        **Returns**
+        - La chaîne décodée.
+        """
+        return self.tampon[self.offsets[position]:self.offsets[position + 1]].decode('utf-8')
+
+    def longueur(self, position):
+        """!
+        Taille en octets UTF-8 d'une valeur, sans la décoder.
+
+        **Parameters**
+        - **position**: Position de la valeur.
+
+        **Returns**
+        - Le nombre d'octets.
+        """
+        return self.offsets[position + 1] - self.offsets[position]
+
+    def nbytes(self):
+        """!
+        Mémoire occupée par les données de la colonne.
+
+        **Returns**
+        - Le nombre d'octets du tampon et des positions.
+        """
+        return len(self.tampon) + self.offsets.itemsize * len(self.offsets)
+
+
+class Dictionnaire:
+    """!
+    # Dictionnaire
+
+    Encodage par dictionnaire d'une colonne catégorielle : chaque valeur distincte reçoit un code entier.
+    """
+
+    def __init__(self):
+        """!
+        Constructeur d'un dictionnaire vide.
+        """
+        self.valeurs = []
+        self.codes = {}
+
+    def encoder(self, valeur):
+        """!
+        Code d'une valeur, créé si elle est nouvelle.
+
+        **Parameters**
+        - **valeur**: La valeur.
+
+        **Returns**
+        - Le code entier de la valeur.
+        """
+        code = self.codes.get(valeur)
+        if code is None:
+            code = len(self.valeurs)
+            self.codes[valeur] = code
+            self.valeurs.append(valeur)
+        return code
+
+    def __getitem__(self, code):
+        """!
+        Valeur d'un code.
+
+        **Parameters**
+        - **code**: Le code entier.
+
+        **Returns**
+        - La valeur décodée.
+        """
+        return self.valeurs[code]
+
+
+class StockageDocuments(Mapping):
+    """!
+    # StockageDocuments
+
+    Documents stockés colonne par colonne, exposés comme le dictionnaire `{id: Document}` du Corpus.
+
+    - titre, date, URL et texte : une ColonneTexte chacun (un tampon et des positions),
+    - auteur et type : codes entiers d'un Dictionnaire,
+    - nombre de commentaires : tableau d'entiers,
+    - co-auteurs : codes (dictionnaire des auteurs) de toutes les listes concaténées, et positions.
+
+    Les objets Document, RedditDocument ou ArxivDocument sont reconstruits à chaque accès : ce sont des
+    copies, les modifier ne modifie pas le stockage.
+    """
+
+    ## Classes de documents supportées, indexées par code de type.
+    CLASSES = [Document, RedditDocument, ArxivDocument]
+    ## Type de chaque classe (valeur de `getType()`), indexé par code de type.
+    TYPES = ["Inconnu", "Reddit", "Arxiv"]
+
+    def __init__(self, premier_id=0):
+        """!
+        Constructeur d'un stockage vide.
+
+        **Parameters**
+        - **premier_id**: Identifiant du premier document (les identifiants sont consécutifs).
+        """
+        self.premier_id = premier_id
+        self.titres = ColonneTexte()
+        self.dates = ColonneTexte()
+        self.urls = ColonneTexte()
+        self.textes = ColonneTexte()
+        self.auteurs = Dictionnaire()
+        self.codes_auteurs = array('l')
+        self.codes_types = array('b')
+        self.nb_comments = array('q')
+        self.co_auteurs = array('l')
+        self.offsets_co_auteurs = array('q', [0])
+
+    def __len__(self):
+        """!
+        Nombre de documents.
+
+        **Returns**
+        - Le nombre de documents stockés.
+        """
+        return len(self.codes_types)
+
+    def __iter__(self):
+        """!
+        Parcours des identifiants, sans reconstruire les documents.
+
+        **Returns**
+        - Un itérateur sur les identifiants, par ordre d'ajout.
+        """
+        return iter(range(self.premier_id, self.premier_id + len(self)))
+
+    def _position(self, doc_id):
+        """!
+        Position d'un document dans les colonnes.
+
+        **Parameters**
+        - **doc_id**: Identifiant du document.
+
+        **Returns**
+        - La position (KeyError si l'identifiant est absent).
+        """
+        # Les identifiants peuvent être des entiers NumPy (par exemple `ids_docs` du SearchEngine)
+        if not isinstance(doc_id, Integral) or not 0 <= doc_id - self.premier_id < len(self):
+            raise KeyError(doc_id)
+        return int(doc_id) - self.premier_id
+
+    def __setitem__(self, doc_id, document):
+        """!
+        Ajoute un document à la fin du stockage.
+
+        **Parameters**
+        - **doc_id**: Identifiant du document, qui doit suivre le dernier identifiant stocké.
+        - **document**: Instance de Document, RedditDocument ou ArxivDocument.
+
+        **Notes**
+        - Le stockage est en ajout seul : remplacer un document existant lève une KeyError.
+        """
+        if doc_id != self.premier_id + len(self):
+            raise KeyError(f"Identifiant {doc_id} non consécutif (attendu {self.premier_id + len(self)}).")
+        if type(document) not in self.CLASSES:
+            raise TypeError(f"Type de document non supporté par le stockage en colonnes : {type(document).__name__}.")
+
+        self.titres.ajouter(document.get_titre())
+        self.dates.ajouter(document.get_date())
+        self.urls.ajouter(document.get_url())
+        self.textes.ajouter(document.get_texte())
+        self.codes_auteurs.append(self.auteurs.encoder(document.get_auteur()))
+        self.nb_comments.append(int(getattr(document, 'nb_comments', 0)))
+        for co_auteur in getattr(document, 'co_auteurs', []):
+            self.co_auteurs.append(self.auteurs.encoder(co_auteur))
+        self.offsets_co_auteurs.append(len(self.co_auteurs))
+        self.codes_types.append(self.CLASSES.index(type(document)))
+
+    def ajouter_lot(self, premier_id, documents):
+        """!
+        Ajoute plusieurs documents à la fin du stockage, colonne par colonne.
+
+        **Parameters**
+        - **premier_id**: Identifiant du premier document, qui doit suivre le dernier identifiant stocké.
+        - **documents**: Liste d'instances de Document, RedditDocument ou ArxivDocument.
+        """
+        self.ajouter_colonnes(premier_id, {
+            'classes': [type(document) for document in documents],
+            'titres': [document.get_titre() for document in documents],
+            'auteurs': [document.get_auteur() for document in documents],
+            'dates': [document.get_date() for document in documents],
+            'urls': [document.get_url() for document in documents],
+            'textes': [document.get_texte() for document in documents],
+            'nb_comments': [getattr(document, 'nb_comments', 0) for document in documents],
+            'co_auteurs': [getattr(document, 'co_auteurs', []) for document in documents]
+        })
+
+    def ajouter_colonnes(self, premier_id, colonnes):
+        """!
+        Ajoute des documents décrits colonne par colonne, sans objet Document intermédiaire.
+
+        **Parameters**
+        - **premier_id**: Identifiant du premier document, qui doit suivre le dernier identifiant stocké.
+        - **colonnes**: Dictionnaire de listes alignées : classes, titres, auteurs, dates, urls, textes,
+          nb_comments, co_auteurs (listes de noms).
+        """
+        if premier_id != self.premier_id + len(self):
+            raise KeyError(f"Identifiant {premier_id} non consécutif (attendu {self.premier_id + len(self)}).")
+        codes_classes = {classe: code for code, classe in enumerate(self.CLASSES)}
+        for classe in set(colonnes['classes']):
+            if classe not in codes_classes:
+                raise TypeError(f"Type de document non supporté par le stockage en colonnes : {classe.__name__}.")
+
+        self.titres.ajouter_lot(colonnes['titres'])
+        self.dates.ajouter_lot(colonnes['dates'])
+        self.urls.ajouter_lot(colonnes['urls'])
+        self.textes.ajouter_lot(colonnes['textes'])
+        self.codes_auteurs.extend(map(self.auteurs.encoder, colonnes['auteurs']))
+        self.nb_comments.extend(map(int, colonnes['nb_comments']))
+        self.offsets_co_auteurs.extend(accumulate(map(len, colonnes['co_auteurs']), initial=len(self.co_auteurs)))
+        self.offsets_co_auteurs.pop(len(self.offsets_co_auteurs) - len(colonnes['co_auteurs']) - 1)
+        self.co_auteurs.extend(map(self.auteurs.encoder, chain.from_iterable(colonnes['co_auteurs'])))
+        self.codes_types.extend(map(codes_classes.__getitem__, colonnes['classes']))
+
+    def __getitem__(self, doc_id):
+        """!
+        Reconstruction d'un document.
+
+        **Parameters**
+        - **doc_id**: Identifiant du document.
+
+        **Returns**
+        - L'objet Document (ou classe fille) correspondant.
+        """
+        i = self._position(doc_id)
+        champs = (self.titres[i], self.auteurs[self.codes_auteurs[i]], self.dates[i], self.urls[i], self.textes[i])
+        classe = self.CLASSES[self.codes_types[i]]
+        if classe is RedditDocument:
+            return RedditDocument(*champs, self.nb_comments[i])
+        if classe is ArxivDocument:
+            codes = self.co_auteurs[self.offsets_co_auteurs[i]:self.offsets_co_auteurs[i + 1]]
+            return ArxivDocument(*champs, co_auteurs=[self.auteurs[code] for code in codes])
+        return Document(*champs)
+
+    def get_texte(self, doc_id):
+        """!
+        Accesseur direct pour le texte d'un document, sans reconstruire l'objet.
+
+        **Parameters**
+        - **doc_id**: Identifiant du document.
+
+        **Returns**
+        - Le texte du document.
+        """
+        return self.textes[self._position(doc_id)]
+
+    def iter_textes(self):
+        """!
+        Parcours des textes de tous les documents, sans reconstruire les objets.
+
+        **Returns**
+        - Un générateur des textes, par ordre d'ajout.
+        """
+        return (self.textes[i] for i in range(len(self)))
+
+    def nbytes(self):
+        """!
+        Mémoire occupée par les données des colonnes (hors dictionnaire des auteurs).
+
+        **Returns**
+        - Le nombre d'octets.
+        """
+        tableaux = [self.codes_auteurs, self.codes_types, self.nb_comments, self.co_auteurs, self.offsets_co_auteurs]
+        return (sum(colonne.nbytes() for colonne in [self.titres, self.dates, self.urls, self.textes])
+                + sum(tableau.itemsize * len(tableau) for tableau in tableaux))
+
+
+class ListeDocuments:
+    """!
+    # ListeDocuments
+
+    Production d'un auteur sous forme d'identifiants dans un StockageDocuments : les documents
+    ne sont reconstruits qu'au parcours.
+    """
+
+    def __init__(self, stockage):
+        """!
+        Constructeur d'une liste vide.
+
+        **Parameters**
+        - **stockage**: Le StockageDocuments contenant les documents.
+        """
+        self.stockage = stockage
+        self.ids = array('q')
+
+    def append(self, doc_id):
+        """!
+        Ajoute un document à la liste.
+
+        **Parameters**
+        - **doc_id**: Identifiant du document dans le stockage.
+        """
+        self.ids.append(doc_id)
+
+    def extend(self, ids_docs):
+        """!
+        Ajoute plusieurs documents à la liste.
+
+        **Parameters**
+        - **ids_docs**: Identifiants des documents dans le stockage.
+        """
+        self.ids.extend(ids_docs)
+
+    def __len__(self):
+        """!
+        Nombre de documents.
+
+        **Returns**
+        - La taille de la liste.
+        """
+        return len(self.ids)
+
+    def __getitem__(self, position):
+        """!
+        Document à une position de la liste.
+
+        **Parameters**
+        - **position**: Position dans la liste.
+
+        **Returns**
+        - Le document reconstruit.
+        """
+        return self.stockage[self.ids[position]]
+
+    def __iter__(self):
+        """!
+        Parcours des documents.
+
+        **Returns**
+        - Un générateur des documents reconstruits.
+        """
+        return (self.stockage[doc_id] for doc_id in self.ids)
@@ -0,0 +1,195 @@
+"""!
+# InvertedIndex.py
+
+Index inversé (terme -> documents) et évaluation top-k avec élagage MaxScore.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import heapq
+from bisect import bisect_left
+import numpy as np
+
+
+class InvertedIndex:
+    """!
+    # InvertedIndex
+
+    Listes de postings par terme construites à partir d'une matrice Documents x Mots.
+
+    Chaque liste contient les documents (triés) et les poids du terme, ainsi que
+    la borne supérieure du poids du terme, utilisée par l'algorithme MaxScore.
+    Les occurrences brutes (TF) peuvent être gardées à côté des poids : les listes forment
+    alors aussi la matrice TF par colonnes, réutilisée par l'indexation incrémentale.
+    """
+
+    # Marge de sécurité pour les comparaisons de bornes en virgule flottante
+    EPSILON = 1e-12
+
+    def __init__(self, mat_poids, occurrences=None):
+        """!
+        Constructeur de l'index inversé.
+
+        **Parameters**
+        - **mat_poids**: Matrice creuse Documents x Mots des poids (déjà normalisés par document).
+        - **occurrences**: Occurrences de chaque couple (document, terme), dans l'ordre des postings
+          de `mat_poids` (matrice CSC triée), ou None.
+        """
+        mat_csc = mat_poids.tocsc()
+        mat_csc.sort_indices()
+
+        self.indptr = mat_csc.indptr
+        self.docs = mat_csc.indices
+        self.poids = mat_csc.data
+        self.occurrences = occurrences
+        self.N_docs = mat_poids.shape[0]
+
+        # Borne supérieure de chaque terme : poids maximal dans sa liste de postings
+        self.bornes = np.zeros(mat_csc.shape[1])
+        non_vides = np.diff(self.indptr) > 0
+        if non_vides.any():
+            self.bornes[non_vides] = np.maximum.reduceat(self.poids, self.indptr[:-1][non_vides])
+
+    @classmethod
+    def depuis_tableaux(cls, indptr, docs, poids, bornes, N_docs, occurrences=None):
+        """!
+        Reconstruction d'un index inversé à partir de ses tableaux (par exemple chargés depuis le disque).
+
+        **Parameters**
+        - **indptr**: Début de la liste de postings de chaque terme (plus la fin).
+        - **docs**: Documents de toutes les listes, concaténés.
+        - **poids**: Poids correspondants.
+        - **bornes**: Borne supérieure du poids de chaque terme.
+        - **N_docs**: Nombre de documents.
+        - **occurrences**: Occurrences correspondantes (None si elles n'ont pas été enregistrées).
+
+        **Returns**
+        - L'InvertedIndex, sans copie des tableaux.
+        """
+        index = cls.__new__(cls)
+        index.indptr = indptr
+        index.docs = docs
+        index.poids = poids
+        index.bornes = bornes
+        index.occurrences = occurrences
+        index.N_docs = N_docs
+        return index
+
+    def get_postings(self, id_terme):
+        """!
+        Accesseur pour la liste de postings d'un terme.
+
+        **Parameters**
+        - **id_terme**: Identifiant du terme dans le vocabulaire.
+
+        **Returns**
+        - Un couple (documents, poids) de tableaux NumPy.
+        """
+        debut, fin = self.indptr[id_terme], self.indptr[id_terme + 1]
+        return self.docs[debut:fin], self.poids[debut:fin]
+
+    def top_k(self, poids_requete, k):
+        """!
+        Évaluation document par document (DAAT) des k meilleurs documents avec MaxScore.
+
+        **Parameters**
+        - **poids_requete**: Dictionnaire {id_terme: poids du terme dans la requête}.
+        - **k**: Nombre de documents à retourner.
+
+        **Returns**
+        - Un triplet (documents, scores, stats) : documents et scores triés par score décroissant,
+          et un dictionnaire de statistiques (postings évalués, postings totaux, documents évalués).
+
+        **Notes**
+        - Les termes sont triés par contribution maximale croissante. Les premiers termes dont la
+          somme des contributions maximales ne dépasse pas le seuil courant sont "non essentiels" :
+          ils ne servent qu'à compléter le score des documents trouvés dans les listes essentielles.
+        - Le résultat est exact : un document n'est écarté que si sa borne ne peut pas dépasser le seuil.
+        """
+        termes = []
+        for id_terme, poids_terme in poids_requete.items():
+            docs, poids = self.get_postings(id_terme)
+            # Un terme de poids nul partout (présent dans tous les documents) ne change aucun score
+            if len(docs) > 0 and poids_terme > 0 and self.bornes[id_terme] > 0:
+                termes.append((poids_terme * self.bornes[id_terme], poids_terme, docs, poids))
+        termes.sort(key=lambda t: t[0])
+
+        stats = {
+            'postings_evalues': 0,
+            'postings_total': sum(len(t[2]) for t in termes),
+            'documents_evalues': 0
+        }
+        if k <= 0 or not termes:
+            return np.empty(0, dtype=np.intp), np.empty(0), stats
+
+        n_termes = len(termes)
+        contributions = [t[0] for t in termes]
+        poids_termes = [t[1] for t in termes]
+        listes_docs = [t[2] for t in termes]
+        listes_poids = [t[3] for t in termes]
+        longueurs = [len(d) for d in listes_docs]
+        curseurs = [0] * n_termes
+
+        # cumul[i] : somme des contributions maximales des termes 0..i
+        cumul = list(np.cumsum(contributions))
+
+        # Tas minimum de (score, -document) : la racine est le moins bon des k retenus
+        tas = []
+        seuil = 0.0
+        premier_essentiel = 0
+        postings_evalues = 0
+        documents_evalues = 0
+
+        while premier_essentiel < n_termes:
+            # Prochain document candidat : le plus petit document courant des listes essentielles
+            doc = self.N_docs
+            for i in range(premier_essentiel, n_termes):
+                c = curseurs[i]
+                if c < longueurs[i] and listes_docs[i][c] < doc:
+                    doc = listes_docs[i][c]
+            if doc == self.N_docs:
+                break
+
+            documents_evalues += 1
+            score = 0.0
+            for i in range(premier_essentiel, n_termes):
+                c = curseurs[i]
+                if c < longueurs[i] and listes_docs[i][c] == doc:
+                    score += poids_termes[i] * listes_poids[i][c]
+                    curseurs[i] = c + 1
+                    postings_evalues += 1
+
+            # Complétion par les listes non essentielles, tant que la borne reste compétitive
+            for i in range(premier_essentiel - 1, -1, -1):
+                if score + cumul[i] <= seuil - self.EPSILON:
+                    break
+                c = bisect_left(listes_docs[i], doc, curseurs[i], longueurs[i])
+                curseurs[i] = c
+                postings_evalues += 1
+                if c < longueurs[i] and listes_docs[i][c] == doc:
+                    score += poids_termes[i] * listes_poids[i][c]
+
+            if score <= 0:
+                continue
+
+            # Les documents sont parcourus par ordre croissant : à score égal, le plus ancien l'emporte
+            if len(tas) < k:
+                heapq.heappush(tas, (score, -int(doc)))
+            elif score > tas[0][0]:
+                heapq.heapreplace(tas, (score, -int(doc)))
+            else:
+                continue
+
+            if len(tas) == k:
+                seuil = tas[0][0]
+                while premier_essentiel < n_termes and cumul[premier_essentiel] <= seuil - self.EPSILON:
+                    premier_essentiel += 1
+
+        stats['postings_evalues'] = postings_evalues
+        stats['documents_evalues'] = documents_evalues
+
+        meilleurs = sorted(tas, key=lambda t: (-t[0], -t[1]))
+        documents = np.array([-d for _, d in meilleurs], dtype=np.intp)
+        scores = np.array([s for s, _ in meilleurs])
+        return documents, scores, stats
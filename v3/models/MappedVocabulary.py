@@ -0,0 +1,156 @@
+"""!
+# MappedVocabulary.py
+
+Vocabulaire en lecture seule adossé à des tableaux projetés en mémoire (memmap).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+
+
+class VocabulaireMappe:
+    """!
+    # VocabulaireMappe
+
+    Remplace le dictionnaire `{mot: {'id', 'doc_count'}}` du SearchEngine pour un index chargé
+    en mémoire partagée : aucun objet Python n'est créé par terme.
+
+    - un tampon UTF-8 de tous les termes, concaténés par identifiant,
+    - les positions de début de chaque terme dans ce tampon (plus la fin),
+    - les identifiants des termes triés par ordre lexicographique (recherche dichotomique),
+    - les fréquences documentaires.
+    """
+
+    def __init__(self, tampon, offsets, ordre, df):
+        """!
+        Constructeur du vocabulaire.
+
+        **Parameters**
+        - **tampon**: Tableau `uint8` des termes encodés en UTF-8.
+        - **offsets**: Tableau des positions de début de chaque terme (taille nombre de termes + 1).
+        - **ordre**: Identifiants des termes triés par ordre lexicographique.
+        - **df**: Tableau des fréquences documentaires, indexé par identifiant.
+        """
+        self.tampon = tampon
+        self.offsets = offsets
+        self.ordre = ordre
+        self.df = df
+
+    def __len__(self):
+        """!
+        Nombre de termes.
+
+        **Returns**
+        - La taille du vocabulaire.
+        """
+        return len(self.offsets) - 1
+
+    def _octets(self, id_terme):
+        """!
+        Terme encodé d'un identifiant.
+
+        **Parameters**
+        - **id_terme**: Identifiant du terme.
+
+        **Returns**
+        - Les octets UTF-8 du terme.
+        """
+        return self.tampon[self.offsets[id_terme]:self.offsets[id_terme + 1]].tobytes()
+
+    def get_terme(self, id_terme):
+        """!
+        Accesseur pour le terme d'un identifiant.
+
+        **Parameters**
+        - **id_terme**: Identifiant du terme.
+
+        **Returns**
+        - Le terme.
+        """
+        return self._octets(id_terme).decode('utf-8')
+
+    def get_id(self, mot):
+        """!
+        Identifiant d'un terme par recherche dichotomique.
+
+        **Parameters**
+        - **mot**: Le terme.
+
+        **Returns**
+        - L'identifiant du terme, ou None s'il est absent.
+
+        **Notes**
+        - O(log V) comparaisons ; seules les pages lues du tampon sont chargées.
+        """
+        cible = mot.encode('utf-8')
+        debut, fin = 0, len(self.ordre)
+        while debut < fin:
+            milieu = (debut + fin) // 2
+            if self._octets(self.ordre[milieu]) < cible:
+                debut = milieu + 1
+            else:
+                fin = milieu
+        if debut < len(self.ordre) and self._octets(self.ordre[debut]) == cible:
+            return int(self.ordre[debut])
+        return None
+
+    def get(self, mot, defaut=None):
+        """!
+        Accès au style dictionnaire.
+
+        **Parameters**
+        - **mot**: Le terme.
+        - **defaut**: Valeur retournée si le terme est absent.
+
+        **Returns**
+        - Un dictionnaire {'id', 'doc_count'}, ou `defaut`.
+        """
+        id_terme = self.get_id(mot)
+        if id_terme is None:
+            return defaut
+        return {'id': id_terme, 'doc_count': int(self.df[id_terme])}
+
+    def __contains__(self, mot):
+        """!
+        Test d'appartenance d'un terme.
+
+        **Parameters**
+        - **mot**: Le terme.
+
+        **Returns**
+        - Vrai si le terme est dans le vocabulaire.
+        """
+        return self.get_id(mot) is not None
+
+    def __getitem__(self, mot):
+        """!
+        Accès au style dictionnaire.
+
+        **Parameters**
+        - **mot**: Le terme.
+
+        **Returns**
+        - Un dictionnaire {'id', 'doc_count'} (KeyError si le terme est absent).
+        """
+        infos = self.get(mot)
+        if infos is None:
+            raise KeyError(mot)
+        return infos
+
+    @staticmethod
+    def ordre_lexicographique(termes):
+        """!
+        Identifiants de termes triés par ordre lexicographique.
+
+        **Parameters**
+        - **termes**: Liste des termes, indexée par identifiant.
+
+        **Returns**
+        - Tableau NumPy `int64` des identifiants.
+
+        **Notes**
+        - L'ordre des chaînes Python est celui des octets UTF-8 comparés par `get_id`.
+        """
+        return np.array(sorted(range(len(termes)), key=termes.__getitem__), dtype=np.int64)
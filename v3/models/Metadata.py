@@ -0,0 +1,291 @@
+"""!
+# Metadata.py
+
+Métadonnées des documents du corpus en colonnes NumPy (type, auteur, date, nombre de commentaires, titre).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from datetime import datetime, timezone
+from numbers import Real
+import numpy as np
+import pandas as pd
+
+
+class Metadonnees:
+    """!
+    # Metadonnees
+
+    Colonnes des métadonnées des documents, dans l'ordre du corpus :
+
+    - type et auteur : codes entiers (`noms_types` et `noms_auteurs` donnent les valeurs),
+    - date : secondes depuis l'epoch, UTC (NaN si la date est inconnue ou illisible),
+    - nombre de commentaires (0 hors Reddit),
+    - titre normalisé (en minuscules).
+
+    Les colonnes triables ont un ordre de tri (index secondaire), calculé à la première demande puis
+    complété par fusion lors des ajouts : un intervalle de valeurs est obtenu par recherche dichotomique
+    et les n premières valeurs par simple lecture, sans parcourir ni retrier la colonne.
+    """
+
+    ## Origine des dates.
+    EPOCH = pd.Timestamp(0, tz='UTC')
+    ## Colonnes catégorielles (codes entiers) et colonnes triables (index secondaires).
+    CATEGORIELLES = ('types', 'auteurs')
+    TRIABLES = ('dates', 'nb_comments', 'titres')
+
+    def __init__(self):
+        """!
+        Constructeur de colonnes vides.
+        """
+        self.ids = np.empty(0, dtype=np.int64)
+        self.types = np.empty(0, dtype=np.int32)
+        self.auteurs = np.empty(0, dtype=np.int32)
+        self.dates = np.empty(0)
+        self.nb_comments = np.empty(0, dtype=np.int64)
+        self.titres = np.empty(0, dtype=object)
+        self.noms_types = []
+        self.noms_auteurs = []
+        self._codes = {'types': {}, 'auteurs': {}}
+        self._tris = {}
+
+    def __len__(self):
+        """!
+        Nombre de documents.
+
+        **Returns**
+        - Le nombre de documents décrits.
+        """
+        return len(self.ids)
+
+    @classmethod
+    def epoch(cls, dates):
+        """!
+        Conversion de dates en secondes depuis l'epoch.
+
+        **Parameters**
+        - **dates**: Itérable de dates : chaînes ISO 8601 (avec ou sans 'Z'), chaînes comme "April 12, 2015",
+          objets datetime.
+
+        **Returns**
+        - Tableau NumPy de flottants, NaN pour une date absente ou illisible ("Date inconnue").
+
+        **Notes**
+        - Les dates sans fuseau sont considérées en UTC.
+        - Chaque valeur distincte n'est analysée qu'une fois (les phrases d'un discours partagent sa date).
+        - `format='mixed'` (un format déduit pour chaque valeur) nécessite pandas 2.0 (voir requirements.txt).
+        """
+        codes, uniques = pd.factorize(pd.Series(list(dates), dtype=object))
+        instants = pd.to_datetime(pd.Series(uniques, dtype=object), format='mixed', utc=True, errors='coerce')
+        secondes = (instants - cls.EPOCH).dt.total_seconds().to_numpy(dtype=np.float64)
+        # Code -1 (valeur absente) : dernière case, NaN
+        return np.append(secondes, np.nan)[codes]
+
+    @classmethod
+    def instant(cls, valeur):
+        """!
+        Conversion d'une date isolée (par exemple une borne d'intervalle) en secondes depuis l'epoch.
+
+        **Parameters**
+        - **valeur**: Chaîne (voir `epoch`), datetime ou nombre de secondes depuis l'epoch.
+
+        **Returns**
+        - Le nombre de secondes, NaN si la date est illisible.
+        """
+        if isinstance(valeur, Real):
+            return float(valeur)
+        if isinstance(valeur, str):
+            try:
+                # Cas courant (ISO 8601) analysé sans passer par pandas
+                valeur = datetime.fromisoformat(valeur.strip())
+            except ValueError:
+                pass
+        if isinstance(valeur, datetime):
+            return (valeur if valeur.tzinfo else valeur.replace(tzinfo=timezone.utc)).timestamp()
+        return float(cls.epoch([valeur])[0])
+
+    def _encoder(self, colonne, valeurs):
+        """!
+        Codes entiers des valeurs d'une colonne catégorielle, créés pour les valeurs nouvelles.
+
+        **Parameters**
+        - **colonne**: "types" ou "auteurs".
+        - **valeurs**: Liste des valeurs.
+
+        **Returns**
+        - Tableau NumPy des codes.
+        """
+        codes = self._codes[colonne]
+        noms = self.noms_types if colonne == 'types' else self.noms_auteurs
+        for valeur in dict.fromkeys(valeurs):
+            if valeur not in codes:
+                codes[valeur] = len(noms)
+                noms.append(valeur)
+        return np.fromiter(map(codes.__getitem__, valeurs), dtype=np.int32, count=len(valeurs))
+
+    def ajouter(self, colonnes):
+        """!
+        Ajoute des documents à la fin des colonnes.
+
+        **Parameters**
+        - **colonnes**: Dictionnaire de listes alignées : ids, types, auteurs, dates (chaînes), nb_comments,
+          titres.
+
+        **Notes**
+        - Chaque date est analysée une seule fois, à l'ajout.
+        - Les ordres de tri existants sont complétés par fusion : seuls les nouveaux documents sont triés.
+        """
+        debut = len(self.ids)
+        self.ids = np.concatenate([self.ids, np.asarray(colonnes['ids'], dtype=np.int64)])
+        self.types = np.concatenate([self.types, self._encoder('types', list(colonnes['types']))])
+        self.auteurs = np.concatenate([self.auteurs, self._encoder('auteurs', list(colonnes['auteurs']))])
+        self.dates = np.concatenate([self.dates, self.epoch(colonnes['dates'])])
+        self.nb_comments = np.concatenate([self.nb_comments, np.asarray(colonnes['nb_comments'], dtype=np.int64)])
+        titres = np.empty(len(colonnes['titres']), dtype=object)
+        titres[:] = [str(titre).lower() for titre in colonnes['titres']]
+        self.titres = np.concatenate([self.titres, titres])
+
+        for colonne, (ordre, triees) in self._tris.items():
+            valeurs = getattr(self, colonne)[debut:]
+            ordre_nouveaux = np.argsort(valeurs, kind='stable')
+            nouvelles = valeurs[ordre_nouveaux]
+            # Insertion après les valeurs égales : même ordre qu'un tri stable de toute la colonne
+            rangs = np.searchsorted(triees, nouvelles, side='right')
+            self._tris[colonne] = (np.insert(ordre, rangs, ordre_nouveaux + debut),
+                                   np.insert(triees, rangs, nouvelles))
+
+    def positions(self, ids_docs):
+        """!
+        Positions de documents dans les colonnes.
+
+        **Parameters**
+        - **ids_docs**: Tableau NumPy d'identifiants de documents du corpus.
+
+        **Returns**
+        - Tableau NumPy des positions.
+
+        **Notes**
+        - Les identifiants attribués par le Corpus sont croissants : recherche dichotomique, ou simple
+          décalage quand ils sont consécutifs.
+        """
+        if len(self.ids) and self.ids[-1] - self.ids[0] == len(self.ids) - 1:
+            return ids_docs - self.ids[0]
+        return np.searchsorted(self.ids, ids_docs)
+
+    def masque_valeurs(self, colonne, valeurs):
+        """!
+        Documents dont une colonne catégorielle prend l'une des valeurs données.
+
+        **Parameters**
+        - **colonne**: "types" ou "auteurs".
+        - **valeurs**: Valeurs acceptées (les valeurs inconnues ne sélectionnent rien).
+
+        **Returns**
+        - Masque booléen NumPy (un élément par document).
+        """
+        codes = self._codes[colonne]
+        table = np.zeros(len(codes), dtype=bool)
+        table[[codes[valeur] for valeur in valeurs if valeur in codes]] = True
+        # Une lecture de table par document, sans comparaison de chaînes
+        return table[getattr(self, colonne)]
+
+    def _tri(self, colonne):
+        """!
+        Ordre de tri d'une colonne, calculé à la première demande.
+
+        **Parameters**
+        - **colonne**: "dates", "nb_comments" ou "titres".
+
+        **Returns**
+        - Un couple (positions triées par valeur croissante, valeurs triées) ; les NaN sont à la fin.
+        """
+        if colonne not in self._tris:
+            valeurs = getattr(self, colonne)
+            ordre = np.argsort(valeurs, kind='stable')
+            self._tris[colonne] = (ordre, valeurs[ordre])
+        return self._tris[colonne]
+
+    def _tranche(self, colonne, debut, fin, n=None, decroissant=False):
+        """!
+        Lecture d'une tranche de l'ordre de tri d'une colonne.
+
+        **Parameters**
+        - **colonne**: "dates", "nb_comments" ou "titres".
+        - **debut**, **fin**: Rangs de la tranche dans l'ordre croissant.
+        - **n**: Nombre maximal de documents (None : toute la tranche).
+        - **decroissant**: Si vrai, les plus grandes valeurs d'abord (la tranche est lue depuis la fin).
+
+        **Returns**
+        - Tableau NumPy des positions des documents ; à valeur égale, par ordre d'ajout.
+        """
+        ordre, triees = self._tri(colonne)
+        if not decroissant:
+            return ordre[debut:fin][:n]
+
+        n = fin - debut if n is None else min(n, fin - debut)
+        if n <= 0:
+            return ordre[:0]
+        # Ex-aequo de la dernière valeur retenue : tous repris, pour garder l'ordre d'ajout à valeur égale
+        debut = max(debut, int(np.searchsorted(triees, triees[fin - n], side='left')))
+        candidats, valeurs = ordre[debut:fin], triees[debut:fin]
+        groupes = np.concatenate([[0], np.cumsum(valeurs[1:] != valeurs[:-1])])
+        return candidats[np.lexsort((candidats, -groupes))][:n]
+
+    def intervalle(self, colonne, minimum=None, maximum=None, n=None, decroissant=False):
+        """!
+        Documents dont une colonne numérique est comprise entre deux bornes (incluses).
+
+        **Parameters**
+        - **colonne**: "dates" ou "nb_comments".
+        - **minimum**: Borne inférieure (None : pas de borne).
+        - **maximum**: Borne supérieure (None : pas de borne).
+        - **n**: Nombre maximal de documents (None : tous).
+        - **decroissant**: Si vrai, par valeur décroissante.
+
+        **Returns**
+        - Tableau NumPy des positions des documents, par valeur croissante (ou décroissante).
+
+        **Notes**
+        - Deux recherches dichotomiques dans la colonne triée, puis lecture de la tranche ; les dates
+          inconnues (NaN) ne sont jamais sélectionnées.
+        """
+        _, triees = self._tri(colonne)
+        debut = 0 if minimum is None else int(np.searchsorted(triees, minimum, side='left'))
+        # NaN est trié après +inf : la borne infinie exclut les dates inconnues
+        fin = int(np.searchsorted(triees, np.inf if maximum is None else maximum, side='right'))
+        return self._tranche(colonne, debut, max(debut, fin), n, decroissant)
+
+    def premiers(self, colonne, n, decroissant=False):
+        """!
+        Documents ayant les plus petites (ou les plus grandes) valeurs d'une colonne triable.
+
+        **Parameters**
+        - **colonne**: "dates", "nb_comments" ou "titres".
+        - **n**: Nombre de documents.
+        - **decroissant**: Si vrai, les plus grandes valeurs d'abord.
+
+        **Returns**
+        - Tableau NumPy des positions des documents ; à valeur égale, par ordre d'ajout.
+
+        **Notes**
+        - Lecture de l'ordre de tri en O(n) (plus les ex-aequo de la n-ième valeur en ordre décroissant),
+          sans retrier la colonne.
+        - Les dates inconnues (NaN) viennent toujours en dernier.
+        """
+        ordre, triees = self._tri(colonne)
+        if not decroissant:
+            return ordre[:n]
+        valides = len(triees) if triees.dtype == object else int(np.searchsorted(triees, np.inf, side='right'))
+        meilleurs = self._tranche(colonne, 0, valides, n, decroissant=True)
+        return np.concatenate([meilleurs, ordre[valides:valides + n - len(meilleurs)]])
+
+    def nbytes(self):
+        """!
+        Mémoire occupée par les colonnes et les ordres de tri (hors noms des types et des auteurs).
+
+        **Returns**
+        - Le nombre d'octets.
+        """
+        colonnes = [self.ids, self.types, self.auteurs, self.dates, self.nb_comments]
+        return sum(tableau.nbytes for tableau in colonnes) + sum(o.nbytes + v.nbytes for o, v in self._tris.values())
@@ -0,0 +1,121 @@
+"""!
+# MetadataFilter.py
+
+Filtres de recherche sur les métadonnées des documents (type, auteur, date, nombre de commentaires).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from numbers import Real
+import numpy as np
+from models.Metadata import Metadonnees
+
+
+class FiltresMetadonnees:
+    """!
+    # FiltresMetadonnees
+
+    Filtres d'une recherche, donnés sous forme de dictionnaire :
+
+    - `type` : type de document ("Reddit", "Arxiv", ...) ou liste de types,
+    - `auteur` : auteur ou liste d'auteurs,
+    - `date_min`, `date_max` : bornes des dates (chaîne, datetime ou secondes depuis l'epoch),
+    - `nb_comments_min`, `nb_comments_max` : bornes du nombre de commentaires.
+
+    Toutes les conditions doivent être vérifiées ; les bornes sont incluses. Les filtres sont compilés en
+    un masque booléen des documents (voir `masque`), appliqué aux lignes de l'index avant le calcul des scores.
+    """
+
+    ## Filtres sur une colonne catégorielle de Metadonnees.
+    VALEURS = {'type': 'types', 'auteur': 'auteurs'}
+    ## Filtres d'intervalle : (colonne de Metadonnees, borne inférieure ou supérieure).
+    BORNES = {'date_min': ('dates', 0), 'date_max': ('dates', 1),
+              'nb_comments_min': ('nb_comments', 0), 'nb_comments_max': ('nb_comments', 1)}
+
+    def __init__(self, filtres=None):
+        """!
+        Constructeur : vérification et normalisation des filtres.
+
+        **Parameters**
+        - **filtres**: Dictionnaire des filtres (None ou vide : aucun filtre).
+        """
+        filtres = filtres or {}
+        inconnus = set(filtres) - set(self.VALEURS) - set(self.BORNES)
+        if inconnus:
+            raise ValueError(f"Filtres inconnus : {', '.join(sorted(inconnus))}")
+
+        self.valeurs = {}
+        self.intervalles = {}
+        for cle, valeur in filtres.items():
+            if valeur is None:
+                continue
+            if cle in self.VALEURS:
+                valeurs = [valeur] if isinstance(valeur, str) else list(valeur)
+                self.valeurs[self.VALEURS[cle]] = tuple(sorted(set(valeurs)))
+            else:
+                colonne, cote = self.BORNES[cle]
+                bornes = self.intervalles.setdefault(colonne, [None, None])
+                bornes[cote] = self._borne(cle, valeur)
+
+    @staticmethod
+    def _borne(cle, valeur):
+        """!
+        Conversion d'une borne en nombre.
+
+        **Parameters**
+        - **cle**: Nom du filtre.
+        - **valeur**: Borne donnée par l'utilisateur.
+
+        **Returns**
+        - La borne (secondes depuis l'epoch pour une date).
+        """
+        if isinstance(valeur, Real):
+            return float(valeur)
+        if cle.startswith('date'):
+            borne = Metadonnees.instant(valeur)
+            if not np.isnan(borne):
+                return borne
+        raise ValueError(f"Borne invalide pour {cle} : {valeur!r}")
+
+    def __bool__(self):
+        """!
+        Indique si au moins un filtre est actif.
+
+        **Returns**
+        - Vrai s'il y a une condition à vérifier.
+        """
+        return bool(self.valeurs or self.intervalles)
+
+    def cle(self):
+        """!
+        Forme normalisée des filtres, pour la clé du cache de requêtes.
+
+        **Returns**
+        - Un tuple hachable, identique pour deux dictionnaires de filtres équivalents.
+        """
+        return (tuple(sorted(self.valeurs.items())),
+                tuple(sorted((colonne, tuple(bornes)) for colonne, bornes in self.intervalles.items())))
+
+    def masque(self, metadonnees):
+        """!
+        Compilation des filtres en masque booléen des documents.
+
+        **Parameters**
+        - **metadonnees**: Objet Metadonnees du corpus.
+
+        **Returns**
+        - Masque booléen NumPy (un élément par document, dans l'ordre de `metadonnees`).
+
+        **Notes**
+        - Valeurs : une lecture de table par document ; intervalles : deux recherches dichotomiques
+          dans la colonne triée, puis écriture des seules positions retenues.
+        """
+        masque = np.ones(len(metadonnees), dtype=bool)
+        for colonne, valeurs in self.valeurs.items():
+            masque &= metadonnees.masque_valeurs(colonne, valeurs)
+        for colonne, (minimum, maximum) in self.intervalles.items():
+            dans_intervalle = np.zeros(len(metadonnees), dtype=bool)
+            dans_intervalle[metadonnees.intervalle(colonne, minimum, maximum)] = True
+            masque &= dans_intervalle
+        return masque
@@ -0,0 +1,135 @@
+"""!
+# ParallelBuilder.py
+
+Tokenisation et comptage des documents en parallèle (plusieurs processus).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import numpy as np
+from scipy.sparse import csr_matrix
+from models.TokenStore import TokenStore
+
+
+def _traiter_lot(tokenizer, textes):
+    """!
+    Tokenise et compte un lot de documents (exécuté dans un processus de travail).
+
+    **Parameters**
+    - **tokenizer**: Le Tokenizer.
+    - **textes**: Liste des textes bruts du lot.
+
+    **Returns**
+    - Un dictionnaire avec les termes locaux (ordre de première occurrence), les tokens et offsets
+      en identifiants locaux, et le bloc COO (lignes, colonnes, occurrences) des couples (document, terme).
+    """
+    termes = {}
+    tokens = []
+    offsets = [0]
+    for mots in tokenizer.tokeniser_lot(textes):
+        for mot in mots:
+            tokens.append(termes.setdefault(mot, len(termes)))
+        offsets.append(len(tokens))
+
+    tokens = np.array(tokens, dtype=np.uint32)
+    offsets = np.array(offsets, dtype=np.int64)
+    lignes = np.repeat(np.arange(len(textes), dtype=np.int64), np.diff(offsets))
+
+    # Couples (document, terme) distincts et leur nombre d'occurrences
+    couples, occurrences = np.unique(lignes * max(len(termes), 1) + tokens, return_counts=True)
+    return {
+        'termes': list(termes),
+        'tokens': tokens,
+        'offsets': offsets,
+        'lignes': couples // max(len(termes), 1),
+        'colonnes': couples % max(len(termes), 1),
+        'occurrences': occurrences
+    }
+
+
+class ConstructeurParallele:
+    """!
+    # ConstructeurParallele
+
+    Découpe les documents en lots, traités chacun dans un processus d'un `ProcessPoolExecutor`.
+
+    Les résultats sont fusionnés dans l'ordre des lots : le TokenStore obtenu (identifiants des
+    termes compris) est identique à celui d'une tokenisation séquentielle.
+    """
+
+    def __init__(self, tokenizer, n_workers=None, taille_lot=2000):
+        """!
+        Constructeur.
+
+        **Parameters**
+        - **tokenizer**: Le Tokenizer des documents.
+        - **n_workers**: Nombre de processus (tous les cœurs par défaut).
+        - **taille_lot**: Nombre de documents par lot.
+        """
+        self.tokenizer = tokenizer
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count()
+        self.taille_lot = taille_lot
+
+    def _lots(self, ids_docs, textes):
+        """!
+        Découpage des documents en lots.
+
+        **Parameters**
+        - **ids_docs**: Itérable des identifiants des documents.
+        - **textes**: Itérable des textes, dans le même ordre.
+
+        **Returns**
+        - Générateur de couples (ids des documents, textes).
+        """
+        elements = zip(ids_docs, textes)
+        while True:
+            lot = list(islice(elements, self.taille_lot))
+            if not lot:
+                return
+            yield [doc_id for doc_id, _ in lot], [texte for _, texte in lot]
+
+    def construire(self, documents):
+        """!
+        Tokenisation et comptage parallèles des documents.
+
+        **Parameters**
+        - **documents**: Dictionnaire {id: Document}.
+
+        **Returns**
+        - Un couple (TokenStore, blocs). Chaque bloc est une matrice CSR (documents du lot x termes
+          du TokenStore) des occurrences, à empiler dans l'ordre.
+        """
+        return self.construire_textes(documents.keys(), (doc.get_texte() for doc in documents.values()))
+
+    def construire_textes(self, ids_docs, textes):
+        """!
+        Tokenisation et comptage parallèles de textes (documents ou passages).
+
+        **Parameters**
+        - **ids_docs**: Itérable des identifiants (dans le Corpus) associés aux textes.
+        - **textes**: Itérable des textes, dans le même ordre.
+
+        **Returns**
+        - Voir `construire`.
+        """
+        lots = list(self._lots(ids_docs, textes))
+        store = TokenStore()
+        blocs = []
+
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executeur:
+            # map conserve l'ordre des lots : la fusion est déterministe
+            resultats = executeur.map(_traiter_lot, [self.tokenizer] * len(lots), [textes for _, textes in lots])
+            for (ids_docs, textes), resultat in zip(lots, resultats):
+                correspondance = store.ajouter_bloc(ids_docs, resultat['termes'], resultat['tokens'],
+                                                    resultat['offsets'])
+                blocs.append((resultat['lignes'], correspondance[resultat['colonnes']].astype(np.int64),
+                              resultat['occurrences'], len(textes)))
+
+        n_termes = len(store.liste_termes)
+        blocs = [csr_matrix((occurrences, (lignes, colonnes)), shape=(n_docs, n_termes))
+                 for lignes, colonnes, occurrences, n_docs in blocs]
+        return store, blocs
@@ -0,0 +1,83 @@
+"""!
+# ParallelSearch.py
+
+Recherche d'une expression régulière dans les textes, par lots traités en parallèle (plusieurs processus).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def _chercher_lot(motif, textes):
+    """!
+    Correspondances d'une expression régulière dans un lot de textes (exécuté dans un processus de travail).
+
+    **Parameters**
+    - **motif**: Expression régulière compilée.
+    - **textes**: Liste des textes du lot.
+
+    **Returns**
+    - Pour chaque texte, la liste des couples (début, fin) des correspondances.
+    """
+    return [[match.span() for match in motif.finditer(texte)] for texte in textes]
+
+
+class RechercheParallele:
+    """!
+    # RechercheParallele
+
+    Parcours des textes par lots dans un `ProcessPoolExecutor`, résultats produits au fil de l'eau.
+
+    Seuls quelques lots sont soumis en avance (deux par processus) : le premier résultat arrive dès que
+    le premier lot est traité, et l'arrêt du parcours (limite atteinte) annule les lots en attente.
+    Les correspondances sont produites dans l'ordre des textes, comme un parcours séquentiel.
+    """
+
+    def __init__(self, n_workers=None, taille_lot=500):
+        """!
+        Constructeur.
+
+        **Parameters**
+        - **n_workers**: Nombre de processus (tous les cœurs par défaut).
+        - **taille_lot**: Nombre de textes par lot.
+        """
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count()
+        self.taille_lot = taille_lot
+
+    def occurrences(self, motif, documents):
+        """!
+        Correspondances d'une expression régulière dans des textes.
+
+        **Parameters**
+        - **motif**: Expression régulière compilée.
+        - **documents**: Itérable de couples (id du document, texte).
+
+        **Returns**
+        - Générateur de quadruplets (id du document, texte, début, fin), dans l'ordre des documents.
+        """
+        elements = iter(documents)
+        executeur = ProcessPoolExecutor(max_workers=self.n_workers)
+        en_cours = deque()
+        try:
+            while True:
+                # Fenêtre de lots soumis en avance : la mémoire et le travail inutile restent bornés
+                while len(en_cours) < 2 * self.n_workers:
+                    lot = list(islice(elements, self.taille_lot))
+                    if not lot:
+                        break
+                    en_cours.append((lot, executeur.submit(_chercher_lot, motif, [texte for _, texte in lot])))
+                if not en_cours:
+                    return
+
+                lot, futur = en_cours.popleft()
+                for (doc_id, texte), positions in zip(lot, futur.result()):
+                    for debut, fin in positions:
+                        yield doc_id, texte, debut, fin
+        finally:
+            # Parcours interrompu (limite atteinte) : les lots non commencés sont annulés
+            executeur.shutdown(wait=False, cancel_futures=True)
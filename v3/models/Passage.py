@@ -0,0 +1,108 @@
+"""!
+# Passage.py
+
+Découpage des documents en passages pour l'indexation au niveau des passages.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import re
+
+
+class DecoupeurPassages:
+    """!
+    # DecoupeurPassages
+
+    Découpe le texte d'un document en passages (groupes de phrases).
+
+    Un passage n'est pas un Document : il est décrit par ses positions de début et de fin
+    dans le texte de son document parent, dont il partage les métadonnées.
+    """
+
+    def __init__(self, motif=r'[.!?]\s+', longueur_min=20, phrases_par_passage=1):
+        """!
+        Constructeur.
+
+        **Parameters**
+        - **motif**: Expression régulière des séparateurs de phrases.
+        - **longueur_min**: Les phrases de `longueur_min` caractères ou moins sont ignorées.
+        - **phrases_par_passage**: Nombre de phrases consécutives regroupées dans un passage.
+        """
+        if phrases_par_passage < 1:
+            raise ValueError("phrases_par_passage doit être au moins 1.")
+        self.motif = motif
+        self.longueur_min = longueur_min
+        self.phrases_par_passage = phrases_par_passage
+        self._motif = re.compile(motif)
+
+    def _phrases(self, texte):
+        """!
+        Positions des phrases retenues d'un texte.
+
+        **Parameters**
+        - **texte**: Texte brut.
+
+        **Returns**
+        - Liste de couples (début, fin), espaces de bord exclus.
+        """
+        phrases = []
+        debut = 0
+        for separateur in self._motif.finditer(texte):
+            phrases.append((debut, separateur.start()))
+            debut = separateur.end()
+        phrases.append((debut, len(texte)))
+
+        retenues = []
+        for debut, fin in phrases:
+            phrase = texte[debut:fin]
+            contenu = phrase.strip()
+            if len(contenu) > self.longueur_min:
+                debut += len(phrase) - len(phrase.lstrip())
+                retenues.append((debut, debut + len(contenu)))
+        return retenues
+
+    def decouper(self, texte):
+        """!
+        Découpage d'un texte en passages.
+
+        **Parameters**
+        - **texte**: Texte brut du document.
+
+        **Returns**
+        - Liste de couples (début, fin) des passages dans le texte.
+
+        **Notes**
+        - Un texte sans phrase assez longue forme un seul passage : chaque document a au moins un passage.
+        """
+        phrases = self._phrases(texte)
+        if not phrases:
+            contenu = texte.strip()
+            debut = len(texte) - len(texte.lstrip())
+            return [(debut, debut + len(contenu))]
+
+        k = self.phrases_par_passage
+        return [(phrases[i][0], phrases[min(i + k, len(phrases)) - 1][1]) for i in range(0, len(phrases), k)]
+
+    def get_parametres(self):
+        """!
+        Accesseur pour la configuration du découpage.
+
+        **Returns**
+        - Dictionnaire des arguments du constructeur.
+        """
+        return {
+            'motif': self.motif,
+            'longueur_min': self.longueur_min,
+            'phrases_par_passage': self.phrases_par_passage
+        }
+
+    def __repr__(self):
+        """!
+        Représentation textuelle du découpage.
+
+        **Returns**
+        - Résumé de la configuration.
+        """
+        return (f"<DecoupeurPassages(motif={self.motif!r}, longueur_min={self.longueur_min}, "
+                f"phrases_par_passage={self.phrases_par_passage})>")
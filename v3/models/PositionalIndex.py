@@ -0,0 +1,226 @@
+"""!
+# PositionalIndex.py
+
+Index positionnel : pour chaque terme, ses occurrences (document, position du token, positions dans le texte).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+
+
+class IndexPositionnel:
+    """!
+    # IndexPositionnel
+
+    Index positionnel construit au-dessus du TokenStore du corpus.
+
+    Le TokenStore contient déjà, document après document, l'identifiant de terme de chaque token :
+    la position d'un token dans son document s'en déduit. L'index n'ajoute que les positions de début
+    et de fin de chaque token dans le texte d'origine, et une permutation des tokens triés par terme
+    (listes d'occurrences contiguës, dans l'ordre des documents).
+
+    Sans Tokenizer, les positions dans le texte ne sont pas calculées : l'index ne sert alors que
+    les positions des tokens (`indices`, `postings`), pour les requêtes de phrases et de proximité.
+    """
+
+    def __init__(self, store, tokenizer=None):
+        """!
+        Constructeur d'un index vide.
+
+        **Parameters**
+        - **store**: TokenStore (tokens produits par `tokenizer`).
+        - **tokenizer**: Tokenizer des textes, ou None pour ne pas calculer les positions dans le texte.
+        """
+        self.store = store
+        self.tokenizer = tokenizer
+        self.n_documents = 0
+        self._debuts = [np.empty(0, dtype=np.int32)]
+        self._fins = [np.empty(0, dtype=np.int32)]
+        self._ids_docs = np.empty(0, dtype=np.int64)
+        self._ordre = None
+        self._indptr = None
+        self._frequences_docs = None
+
+    def __len__(self):
+        """!
+        Nombre de documents indexés.
+
+        **Returns**
+        - Le nombre de documents.
+        """
+        return self.n_documents
+
+    def actualiser(self, textes=None):
+        """!
+        Ajoute les positions des documents du TokenStore qui ne sont pas encore indexés.
+
+        **Parameters**
+        - **textes**: Itérable des textes des documents du TokenStore, à partir du premier non indexé
+          (inutile sans Tokenizer).
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+
+        **Notes**
+        - Les tokens ne sont pas recomptés : seules leurs positions dans le texte sont calculées.
+        """
+        n_docs = len(self.store) - self.n_documents
+        if n_docs <= 0:
+            return 0
+        if self.tokenizer is None:
+            return self._ajouter_documents()
+
+        debuts, fins = [], []
+        for texte in textes:
+            for _, debut, fin in self.tokenizer.tokeniser_positions(texte):
+                debuts.append(debut)
+                fins.append(fin)
+            n_docs -= 1
+            if n_docs == 0:
+                break
+
+        offsets = self.store.offsets
+        if len(debuts) != offsets[-1] - offsets[self.n_documents]:
+            raise ValueError("Les positions ne correspondent pas aux tokens du TokenStore (Tokenizer différent ?).")
+
+        self._debuts.append(np.array(debuts, dtype=np.int32))
+        self._fins.append(np.array(fins, dtype=np.int32))
+        return self._ajouter_documents()
+
+    def _ajouter_documents(self):
+        """!
+        Prend en compte les documents du TokenStore non encore indexés.
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+        """
+        ajoutes = len(self.store) - self.n_documents
+        self.n_documents = len(self.store)
+        self._ids_docs = np.asarray(self.store.ids_docs, dtype=np.int64)
+        # Vue triée par terme : reconstruite à la prochaine recherche
+        self._ordre = None
+        return ajoutes
+
+    def _trier(self):
+        """!
+        Construction des listes d'occurrences : tokens triés par terme, puis par position dans le corpus.
+        """
+        if len(self._debuts) > 1:
+            self._debuts = [np.concatenate(self._debuts)]
+            self._fins = [np.concatenate(self._fins)]
+        tokens = self.store.tokens[:self.store.offsets[self.n_documents]]
+        self._ordre = np.argsort(tokens, kind='stable')
+        if len(self._ordre) < 2 ** 31:
+            self._ordre = self._ordre.astype(np.int32)
+        comptes = np.bincount(tokens, minlength=len(self.store.liste_termes))
+        self._indptr = np.concatenate([[0], np.cumsum(comptes)])
+
+        # Nombre de documents de chaque terme : changements de ligne dans chaque liste d'occurrences
+        lignes = np.repeat(np.arange(self.n_documents), np.diff(self.store.offsets[:self.n_documents + 1]))[self._ordre]
+        nouveaux = np.ones(len(lignes), dtype=bool)
+        nouveaux[1:] = lignes[1:] != lignes[:-1]
+        nouveaux[self._indptr[:-1][comptes > 0]] = True
+        cumul = np.concatenate([[0], np.cumsum(nouveaux)])
+        self._frequences_docs = cumul[self._indptr[1:]] - cumul[self._indptr[:-1]]
+
+    def indices(self, mot):
+        """!
+        Positions dans le tableau des tokens du TokenStore des occurrences d'un terme.
+
+        **Parameters**
+        - **mot**: Le terme (token normalisé par le Tokenizer).
+
+        **Returns**
+        - Tableau NumPy croissant (vide si le terme est inconnu), vue sans copie sur l'index.
+
+        **Notes**
+        - Deux tokens qui se suivent dans un document ont des positions consécutives dans ce tableau :
+          les intersections positionnelles se font directement sur ces positions (`lignes` donne les documents).
+        """
+        id_terme = self.store.termes.get(mot)
+        if self._ordre is None:
+            self._trier()
+        if id_terme is None or id_terme + 1 >= len(self._indptr):
+            return np.empty(0, dtype=np.int64)
+        return self._ordre[self._indptr[id_terme]:self._indptr[id_terme + 1]]
+
+    def frequence_documentaire(self, mot):
+        """!
+        Nombre de documents contenant un terme.
+
+        **Parameters**
+        - **mot**: Le terme.
+
+        **Returns**
+        - Le nombre de documents (calculé une fois pour tous les termes lors du tri de l'index).
+        """
+        id_terme = self.store.termes.get(mot)
+        if self._ordre is None:
+            self._trier()
+        if id_terme is None or id_terme >= len(self._frequences_docs):
+            return 0
+        return int(self._frequences_docs[id_terme])
+
+    def lignes(self, indices):
+        """!
+        Lignes du TokenStore contenant des tokens.
+
+        **Parameters**
+        - **indices**: Positions dans le tableau des tokens.
+
+        **Returns**
+        - Tableau NumPy des lignes (documents ou passages) correspondantes.
+        """
+        return np.searchsorted(self.store.offsets, indices, side='right') - 1
+
+    def postings(self, mot):
+        """!
+        Liste d'occurrences positionnelle d'un terme.
+
+        **Parameters**
+        - **mot**: Le terme.
+
+        **Returns**
+        - Un couple de tableaux NumPy (lignes du TokenStore, positions des tokens dans leur document),
+          triés par ligne puis par position.
+        """
+        indices = self.indices(mot)
+        lignes = self.lignes(indices)
+        return lignes, indices - self.store.offsets[lignes]
+
+    def occurrences(self, mot, debut=0, fin=None):
+        """!
+        Occurrences d'un terme.
+
+        **Parameters**
+        - **mot**: Le terme (token normalisé par le Tokenizer).
+        - **debut**, **fin**: Rangs (dans l'ordre du corpus) de la première occurrence retournée et de celle
+          qui suit la dernière (pagination) ; toutes les occurrences par défaut.
+
+        **Returns**
+        - Un quadruplet de tableaux NumPy (ids des documents, positions des tokens dans leur document,
+          débuts et fins dans le texte), dans l'ordre du corpus.
+
+        **Notes**
+        - La liste d'occurrences est découpée avant toute conversion : le coût dépend de la page demandée.
+        """
+        if self.tokenizer is None:
+            raise ValueError("Index positionnel construit sans Tokenizer : positions dans le texte indisponibles.")
+        indices = self.indices(mot)[debut:fin]
+        lignes = self.lignes(indices)
+        return (self._ids_docs[lignes], indices - self.store.offsets[lignes],
+                self._debuts[0][indices].astype(np.int64), self._fins[0][indices].astype(np.int64))
+
+    def nbytes(self):
+        """!
+        Mémoire occupée par l'index (hors TokenStore).
+
+        **Returns**
+        - Le nombre d'octets des tableaux.
+        """
+        total = sum(t.nbytes for t in self._debuts + self._fins) + self._ids_docs.nbytes
+        if self._ordre is not None:
+            total += self._ordre.nbytes + self._indptr.nbytes + self._frequences_docs.nbytes
+        return total
@@ -0,0 +1,223 @@
+"""!
+# ProximityQuery.py
+
+Requêtes de phrases ("...") et de proximité (NEAR/k), évaluées sur les positions des tokens.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import re
+import numpy as np
+
+
+class RequetePositionnelle:
+    """!
+    # RequetePositionnelle
+
+    Requête analysée : mots pour le score, phrases exactes et contraintes de proximité.
+
+    Syntaxe :
+    - `"foreign policy"` : les mots doivent se suivre dans cet ordre ;
+    - `foreign NEAR/3 policy` : positions des deux mots distantes d'au plus 3 (au plus 2 tokens entre eux),
+      dans un ordre quelconque (pour une phrase, c'est son dernier mot à gauche de NEAR et son premier
+      à droite qui comptent) ;
+    - les autres mots sont combinés comme d'habitude (sac de mots).
+    """
+
+    ## Éléments de la requête : phrase entre guillemets, opérateur de proximité ou mot.
+    MOTIF = re.compile(r'"([^"]*)"|\bNEAR/(\d+)\b|([^\s"]+)')
+
+    def __init__(self, texte, tokenizer):
+        """!
+        Analyse d'une requête.
+
+        **Parameters**
+        - **texte**: La requête utilisateur.
+        - **tokenizer**: Tokenizer du moteur (appliqué à chaque mot et à chaque phrase).
+        """
+        self.mots = []
+        self.phrases = []
+        self.proches = []
+
+        operandes = []
+        distance = None
+        for phrase, near, mot in self.MOTIF.findall(texte):
+            if near:
+                distance = int(near) if operandes else None
+                continue
+            tokens = tokenizer.tokeniser(phrase if phrase else mot)
+            if not tokens:
+                continue
+            if phrase:
+                # Une phrase d'un seul mot n'est qu'un mot
+                groupes = [tokens]
+                if len(tokens) > 1:
+                    self.phrases.append(tokens)
+            else:
+                # Un mot peut donner plusieurs tokens ("U.S." -> "u", "s")
+                groupes = [[token] for token in tokens]
+            if distance is not None:
+                self.proches.append((operandes[-1][-1], groupes[0][0], distance))
+                distance = None
+            operandes.extend(groupes)
+            self.mots.extend(tokens)
+
+    def a_contraintes(self):
+        """!
+        Indique si la requête contient des phrases ou des opérateurs de proximité.
+
+        **Returns**
+        - Vrai si des documents doivent être filtrés sur les positions.
+        """
+        return bool(self.phrases or self.proches)
+
+    def paires(self):
+        """!
+        Couples de mots consécutifs de la requête (mots différents), utilisés pour le bonus de proximité.
+
+        **Returns**
+        - Liste de couples (mot, mot suivant).
+        """
+        return [(a, b) for a, b in zip(self.mots, self.mots[1:]) if a != b]
+
+    def cle(self):
+        """!
+        Clé de cache de la requête analysée.
+
+        **Returns**
+        - Un tuple hachable (mots, phrases, contraintes de proximité).
+        """
+        return tuple(self.mots), tuple(map(tuple, self.phrases)), tuple(self.proches)
+
+    @staticmethod
+    def _phrase(index, mots):
+        """!
+        Occurrences d'une phrase exacte.
+
+        **Parameters**
+        - **index**: IndexPositionnel du moteur.
+        - **mots**: Tokens de la phrase, dans l'ordre.
+
+        **Returns**
+        - Tableau NumPy des positions (dans le tableau des tokens) du premier mot de chaque occurrence.
+
+        **Notes**
+        - Seule la liste d'occurrences du mot le plus rare est parcourue : pour chaque candidat, les autres
+          mots sont vérifiés directement dans le tableau des tokens du TokenStore (accès indexé). Une phrase
+          contenant des mots très fréquents ("of the people") coûte autant que son mot le plus rare.
+        """
+        store = index.store
+        ids_termes = [store.termes.get(mot) for mot in mots]
+        if None in ids_termes:
+            return np.empty(0, dtype=np.int64)
+
+        pivot = min(range(len(mots)), key=lambda i: len(index.indices(mots[i])))
+        debuts = index.indices(mots[pivot]).astype(np.int64) - pivot
+        n_tokens = store.offsets[index.n_documents]
+        debuts = debuts[(debuts >= 0) & (debuts + len(mots) <= n_tokens)]
+
+        tokens = store.tokens
+        for i, id_terme in enumerate(ids_termes):
+            if i != pivot and len(debuts):
+                debuts = debuts[tokens[debuts + i] == id_terme]
+        # La phrase ne doit pas chevaucher deux documents
+        return debuts[index.lignes(debuts) == index.lignes(debuts + len(mots) - 1)]
+
+    @staticmethod
+    def _proches(index, mot_a, mot_b, distance):
+        """!
+        Occurrences de deux mots à au plus `distance` positions l'un de l'autre.
+
+        **Parameters**
+        - **index**: IndexPositionnel du moteur.
+        - **mot_a**, **mot_b**: Les deux mots.
+        - **distance**: Écart maximal entre les positions (1 : mots qui se suivent).
+
+        **Returns**
+        - Tableau NumPy des lignes vérifiant la contrainte (avec répétitions).
+
+        **Notes**
+        - Les occurrences du mot le plus rare sont parcourues ; celles de l'autre ne sont consultées
+          que par recherche dichotomique, sans copie.
+        """
+        positions_a, positions_b = index.indices(mot_a), index.indices(mot_b)
+        if len(positions_a) > len(positions_b):
+            positions_a, positions_b = positions_b, positions_a
+        positions_a = positions_a.astype(np.int64)
+
+        # Fenêtre [position - distance, position + distance], bornée au document
+        offsets = index.store.offsets
+        lignes = index.lignes(positions_a)
+        bas = np.maximum(positions_a - distance, offsets[lignes])
+        haut = np.minimum(positions_a + distance, offsets[lignes + 1] - 1)
+        comptes = np.searchsorted(positions_b, haut, side='right') - np.searchsorted(positions_b, bas, side='left')
+        # Un mot proche de lui-même doit apparaître deux fois dans la fenêtre
+        return lignes[comptes > (1 if mot_a == mot_b else 0)]
+
+    def lignes_valides(self, index):
+        """!
+        Lignes de l'index vérifiant toutes les phrases et contraintes de proximité.
+
+        **Parameters**
+        - **index**: IndexPositionnel du moteur.
+
+        **Returns**
+        - Tableau NumPy trié des lignes.
+        """
+        resultat = None
+        for mots in self.phrases:
+            lignes = np.unique(index.lignes(self._phrase(index, mots)))
+            resultat = lignes if resultat is None else np.intersect1d(resultat, lignes, assume_unique=True)
+        for mot_a, mot_b, distance in self.proches:
+            lignes = np.unique(self._proches(index, mot_a, mot_b, distance))
+            resultat = lignes if resultat is None else np.intersect1d(resultat, lignes, assume_unique=True)
+        return resultat if resultat is not None else np.empty(0, dtype=np.int64)
+
+    def proximite(self, index, n_lignes):
+        """!
+        Bonus de proximité de chaque ligne de l'index.
+
+        **Parameters**
+        - **index**: IndexPositionnel du moteur.
+        - **n_lignes**: Nombre de lignes de l'index.
+
+        **Returns**
+        - Tableau NumPy de taille `n_lignes`, entre 0 et 1 : moyenne sur les couples de mots consécutifs
+          de la requête de 1 / distance minimale (distance 1 pour deux mots qui se suivent dans l'ordre
+          de la requête, +1 s'ils sont dans l'ordre inverse ; 0 si l'un des mots est absent).
+        """
+        paires = self.paires()
+        bonus = np.zeros(n_lignes)
+        if not paires:
+            return bonus
+
+        offsets = index.store.offsets
+        for mot_a, mot_b in paires:
+            positions_a, positions_b = index.indices(mot_a), index.indices(mot_b)
+            if len(positions_a) == 0 or len(positions_b) == 0:
+                continue
+            # Parcours de la liste la plus courte, dichotomie dans l'autre
+            inverse = len(positions_a) > len(positions_b)
+            courte, longue = (positions_b, positions_a) if inverse else (positions_a, positions_b)
+            courte = courte.astype(np.int64)
+            lignes = index.lignes(courte)
+
+            suivant = np.searchsorted(longue, courte, side='right')
+            precedent = np.maximum(suivant - 1, 0)
+            suivant = np.minimum(suivant, len(longue) - 1)
+            apres = np.where((longue[suivant] > courte) & (longue[suivant] < offsets[lignes + 1]),
+                             longue[suivant] - courte, np.inf)
+            avant = np.where((longue[precedent] < courte) & (longue[precedent] >= offsets[lignes]),
+                             courte - longue[precedent], np.inf)
+            # Ordre de la requête (a avant b) : distance exacte ; ordre inverse : distance + 1
+            if inverse:
+                distances = np.minimum(avant, apres + 1)
+            else:
+                distances = np.minimum(apres, avant + 1)
+
+            dans_index = lignes < n_lignes
+            minimum = np.full(n_lignes, np.inf)
+            np.minimum.at(minimum, lignes[dans_index], distances[dans_index])
+            bonus += 1.0 / minimum
+        return bonus / len(paires)
@@ -0,0 +1,130 @@
+"""!
+# QueryCache.py
+
+Cache des résultats de requêtes du moteur de recherche.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from collections import OrderedDict
+
+
+class CacheRequetes:
+    """!
+    # CacheRequetes
+
+    Cache borné (LRU) des résultats de requêtes.
+
+    Chaque entrée est associée à une version (celle de l'index et du corpus) : dès que la version
+    change, le cache est vidé, ce qui évite de servir des résultats calculés sur un état périmé.
+    """
+
+    def __init__(self, capacite=128):
+        """!
+        Constructeur.
+
+        **Parameters**
+        - **capacite**: Nombre maximal d'entrées (0 désactive le cache).
+        """
+        self.capacite = capacite
+        self.version = None
+        self._entrees = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        """!
+        Nombre d'entrées du cache.
+
+        **Returns**
+        - Le nombre d'entrées.
+        """
+        return len(self._entrees)
+
+    def _verifier_version(self, version):
+        """!
+        Vide le cache si la version de l'index ou du corpus a changé.
+
+        **Parameters**
+        - **version**: Version courante.
+        """
+        if version != self.version:
+            if self._entrees:
+                self.invalidations += 1
+            self._entrees.clear()
+            self.version = version
+
+    def get(self, cle, version):
+        """!
+        Recherche d'une entrée.
+
+        **Parameters**
+        - **cle**: Clé de la requête (tokens normalisés et paramètres de recherche).
+        - **version**: Version courante de l'index et du corpus.
+
+        **Returns**
+        - La valeur enregistrée, ou None si la requête n'est pas en cache.
+        """
+        self._verifier_version(version)
+        valeur = self._entrees.get(cle)
+        if valeur is None:
+            self.echecs += 1
+            return None
+        self._entrees.move_to_end(cle)
+        self.succes += 1
+        return valeur
+
+    def put(self, cle, version, valeur):
+        """!
+        Enregistre une entrée, en évinçant la moins récemment utilisée si le cache est plein.
+
+        **Parameters**
+        - **cle**: Clé de la requête.
+        - **version**: Version de l'index et du corpus pour laquelle la valeur a été calculée.
+        - **valeur**: Valeur à enregistrer.
+        """
+        if self.capacite <= 0:
+            return
+        self._verifier_version(version)
+        self._entrees[cle] = valeur
+        self._entrees.move_to_end(cle)
+        while len(self._entrees) > self.capacite:
+            self._entrees.popitem(last=False)
+            self.evictions += 1
+
+    def vider(self):
+        """!
+        Supprime toutes les entrées (les compteurs sont conservés).
+        """
+        self._entrees.clear()
+
+    def get_stats(self):
+        """!
+        Accesseur pour les compteurs du cache.
+
+        **Returns**
+        - Dictionnaire (entrées, capacité, succès, échecs, taux de succès, évictions, invalidations).
+        """
+        total = self.succes + self.echecs
+        return {
+            'entrees': len(self._entrees),
+            'capacite': self.capacite,
+            'succes': self.succes,
+            'echecs': self.echecs,
+            'taux_succes': self.succes / total if total > 0 else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+
+    def __repr__(self):
+        """!
+        Représentation textuelle du cache.
+
+        **Returns**
+        - Résumé des compteurs.
+        """
+        return (f"<CacheRequetes({len(self._entrees)}/{self.capacite} entrées, succès={self.succes}, "
+                f"échecs={self.echecs}, évictions={self.evictions})>")
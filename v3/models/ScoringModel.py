@@ -0,0 +1,293 @@
+"""!
+# ScoringModel.py
+
+Modèles de pondération utilisés par le SearchEngine (TF-IDF, BM25, BM25+).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class ModeleScoring(ABC):
+    """!
+    # ModeleScoring
+
+    Classe mère d'un modèle de pondération.
+
+    Un modèle calcule l'IDF de chaque terme et le poids de chaque couple (document, terme).
+    Les poids sont matérialisés dans une matrice creuse Documents x Mots : à la requête,
+    le score reste un produit scalaire creux.
+
+    Classe abstraite : un modèle qui ne définit pas `idf` et `poids` ne peut pas être instancié.
+    """
+
+    ## Nom court du modèle.
+    nom = "abstrait"
+    ## Si vrai, les scores sont divisés par les normes (similarité cosinus).
+    normaliser = False
+
+    @abstractmethod
+    def idf(self, df, N):
+        """!
+        Calcul de l'IDF de chaque terme.
+
+        **Parameters**
+        - **df**: Tableau NumPy des fréquences documentaires (un élément par terme).
+        - **N**: Nombre de documents.
+
+        **Returns**
+        - Tableau NumPy des IDF.
+        """
+
+    @abstractmethod
+    def poids(self, tf, longueurs, idf, longueur_moyenne):
+        """!
+        Poids de couples (document, terme), calculés élément par élément.
+
+        **Parameters**
+        - **tf**: Tableau NumPy des occurrences du terme dans le document.
+        - **longueurs**: Tableau NumPy des longueurs (en mots) des documents correspondants.
+        - **idf**: Tableau NumPy des IDF des termes correspondants.
+        - **longueur_moyenne**: Longueur moyenne d'un document.
+
+        **Returns**
+        - Tableau NumPy des poids.
+        """
+
+    def ponderer(self, mat_TF, longueurs, idf, longueur_moyenne):
+        """!
+        Construction de la matrice pondérée à partir de la matrice TF.
+
+        **Parameters**
+        - **mat_TF**: Matrice creuse CSR Documents x Mots des occurrences.
+        - **longueurs**: Tableau NumPy des longueurs (en mots) des documents.
+        - **idf**: Tableau NumPy des IDF (un élément par terme).
+        - **longueur_moyenne**: Longueur moyenne d'un document.
+
+        **Returns**
+        - Matrice creuse CSR des poids (sans zéros explicites).
+        """
+        lignes = np.repeat(np.arange(mat_TF.shape[0]), np.diff(mat_TF.indptr))
+        poids = self.poids(mat_TF.data, longueurs[lignes], idf[mat_TF.indices], longueur_moyenne)
+
+        mat_poids = csr_matrix((poids, mat_TF.indices.copy(), mat_TF.indptr.copy()), shape=mat_TF.shape)
+        mat_poids.eliminate_zeros()
+        return mat_poids
+
+    def composantes_normes(self, tf, lignes, df, n_lignes):
+        """!
+        Composantes des carrés des normes des documents, indépendantes du nombre de documents.
+
+        **Parameters**
+        - **tf**: Tableau NumPy des occurrences de couples (document, terme).
+        - **lignes**: Tableau NumPy des documents correspondants (entre 0 et `n_lignes` - 1).
+        - **df**: Tableau NumPy des fréquences documentaires des termes correspondants.
+        - **n_lignes**: Nombre de documents.
+
+        **Returns**
+        - Un tableau NumPy (composantes x documents), ou None si le modèle ne sait pas décomposer ses normes.
+
+        **Notes**
+        - Les composantes s'additionnent sur les couples : la variation due au changement de fréquence
+          documentaire de quelques termes se calcule sur les seuls couples de ces termes.
+        """
+        return None
+
+    def normes_composantes(self, composantes, N):
+        """!
+        Normes des documents à partir de leurs composantes (voir `composantes_normes`).
+
+        **Parameters**
+        - **composantes**: Tableau NumPy (composantes x documents).
+        - **N**: Nombre de documents de l'index.
+
+        **Returns**
+        - Tableau NumPy des normes.
+
+        **Notes**
+        - Par défaut, le carré de la norme est la somme des composantes (qui ne dépendent alors pas de N).
+        """
+        return np.sqrt(np.maximum(composantes.sum(axis=0), 0.0))
+
+    def get_parametres(self):
+        """!
+        Accesseur pour les paramètres du modèle (utilisés pour l'enregistrer avec l'index).
+
+        **Returns**
+        - Dictionnaire des arguments du constructeur.
+        """
+        return {}
+
+    def __repr__(self):
+        """!
+        Représentation textuelle du modèle.
+
+        **Returns**
+        - Le nom du modèle.
+        """
+        return f"<{self.__class__.__name__}>"
+
+
+class ModeleTFIDF(ModeleScoring):
+    """!
+    # ModeleTFIDF
+
+    Pondération TF brute x log(N / df), comparée par similarité cosinus.
+
+    See: ModeleScoring
+    """
+
+    nom = "tfidf"
+    normaliser = True
+
+    def idf(self, df, N):
+        """!
+        IDF classique log(N / df) (0 pour un terme absent).
+
+        **Parameters**
+        - **df**: Tableau NumPy des fréquences documentaires.
+        - **N**: Nombre de documents.
+
+        **Returns**
+        - Tableau NumPy des IDF.
+        """
+        idf = np.zeros(len(df))
+        presents = df > 0
+        idf[presents] = np.log(N / df[presents])
+        return idf
+
+    def poids(self, tf, longueurs, idf, longueur_moyenne):
+        """!
+        Poids TF x IDF.
+
+        **Parameters**
+        - **tf**: Tableau NumPy des occurrences.
+        - **longueurs**: Non utilisé par ce modèle.
+        - **idf**: Tableau NumPy des IDF des termes correspondants.
+        - **longueur_moyenne**: Non utilisé par ce modèle.
+
+        **Returns**
+        - Tableau NumPy des poids.
+        """
+        return tf * idf
+
+    def composantes_normes(self, tf, lignes, df, n_lignes):
+        """!
+        Composantes (A, B, C) des carrés des normes TF-IDF.
+
+        **Parameters**
+        - Voir `ModeleScoring.composantes_normes`.
+
+        **Returns**
+        - Tableau NumPy (3 x documents) : A = somme des tf², B = somme des tf² log(df), C = somme des tf² log(df)².
+
+        **Notes**
+        - Avec idf = log(N) - log(df), le carré de la norme vaut log(N)² A - 2 log(N) B + C :
+          ajouter des documents change N pour tous les termes, mais B et C seulement pour les termes ajoutés.
+        """
+        carres = np.asarray(tf, dtype=float) ** 2
+        log_df = np.log(df)
+        return np.vstack([np.bincount(lignes, weights=carres, minlength=n_lignes),
+                          np.bincount(lignes, weights=carres * log_df, minlength=n_lignes),
+                          np.bincount(lignes, weights=carres * log_df ** 2, minlength=n_lignes)])
+
+    def normes_composantes(self, composantes, N):
+        """!
+        Normes TF-IDF à partir des composantes (A, B, C).
+
+        **Parameters**
+        - Voir `ModeleScoring.normes_composantes`.
+
+        **Returns**
+        - Tableau NumPy des normes.
+        """
+        log_N = np.log(N) if N > 0 else 0.0
+        carres = log_N * log_N * composantes[0] - 2 * log_N * composantes[1] + composantes[2]
+        # Les erreurs d'arrondi peuvent donner un carré très légèrement négatif pour une norme nulle
+        return np.sqrt(np.maximum(carres, 0.0))
+
+
+class ModeleBM25(ModeleScoring):
+    """!
+    # ModeleBM25
+
+    Pondération Okapi BM25, ou BM25+ si `delta` est strictement positif.
+
+    See: ModeleScoring
+    """
+
+    nom = "bm25"
+    normaliser = False
+
+    def __init__(self, k1=1.2, b=0.75, delta=0.0):
+        """!
+        Constructeur du modèle BM25.
+
+        **Parameters**
+        - **k1**: Saturation de la fréquence des termes.
+        - **b**: Importance de la normalisation par la longueur du document (entre 0 et 1).
+        - **delta**: Bonus BM25+ ajouté à chaque terme présent (0 pour BM25 classique).
+        """
+        self.k1 = k1
+        self.b = b
+        self.delta = delta
+        if delta > 0:
+            self.nom = "bm25+"
+
+    def idf(self, df, N):
+        """!
+        IDF de BM25 : log(1 + (N - df + 0.5) / (df + 0.5)), toujours positive.
+
+        **Parameters**
+        - **df**: Tableau NumPy des fréquences documentaires.
+        - **N**: Nombre de documents.
+
+        **Returns**
+        - Tableau NumPy des IDF.
+        """
+        return np.log1p((N - df + 0.5) / (df + 0.5))
+
+    def poids(self, tf, longueurs, idf, longueur_moyenne):
+        """!
+        Poids BM25 (ou BM25+) de couples (document, terme) présents.
+
+        **Parameters**
+        - **tf**: Tableau NumPy des occurrences.
+        - **longueurs**: Tableau NumPy des longueurs des documents correspondants.
+        - **idf**: Tableau NumPy des IDF des termes correspondants.
+        - **longueur_moyenne**: Longueur moyenne d'un document.
+
+        **Returns**
+        - Tableau NumPy des poids.
+        """
+        tf = np.asarray(tf, dtype=float)
+        if longueur_moyenne > 0:
+            rapport = longueurs / longueur_moyenne
+        else:
+            rapport = np.ones(len(tf))
+        saturation = self.k1 * (1 - self.b + self.b * rapport)
+
+        return idf * (tf * (self.k1 + 1) / (tf + saturation) + self.delta)
+
+    def get_parametres(self):
+        """!
+        Accesseur pour les paramètres du modèle.
+
+        **Returns**
+        - Dictionnaire {k1, b, delta}.
+        """
+        return {'k1': self.k1, 'b': self.b, 'delta': self.delta}
+
+    def __repr__(self):
+        """!
+        Représentation textuelle du modèle.
+
+        **Returns**
+        - Le nom du modèle et ses paramètres.
+        """
+        return f"<{self.__class__.__name__}(k1={self.k1}, b={self.b}, delta={self.delta})>"
@@ -7,13 +7,31 @@ Moteur de recherche.
 **Version:** 2.0
 """
 
+import hashlib
+import json
 import math
+import mmap
+import os
+import threading
+from itertools import islice
 import numpy as np
 import pandas as pd
-from scipy.sparse import csr_matrix
-from numpy.linalg import norm
-from scipy.sparse import diags
+from scipy.sparse import csc_matrix, csr_matrix, vstack
 from tqdm import tqdm
+from models.InvertedIndex import InvertedIndex
+from models.MappedVocabulary import VocabulaireMappe
+from models.MetadataFilter import FiltresMetadonnees
+from models.ParallelBuilder import ConstructeurParallele
+from models.Passage import DecoupeurPassages
+from models.PositionalIndex import IndexPositionnel
+from models.ProximityQuery import RequetePositionnelle
+from models.QueryCache import CacheRequetes
+from models.SearchResults import Resultats
+from models.StaticRank import RangStatique
+from models.ScoringModel import ModeleTFIDF, ModeleBM25
+from models.Tokenizer import Tokenizer
+from models.TokenStore import TokenStore
+from models.Segment import Segment
 
 
 class SearchEngine:
@@ -23,40 +41,197 @@ class SearchEngine:
     Classe gérant la matrice TF-IDF et la recherche.
     """
 
-    def __init__(self, corpus):
+    ## Identifiant et version du format d'index enregistré sur disque.
+    FORMAT_INDEX = "search-engine-index"
+    VERSION_FORMAT = 5
+    ## Versions du format encore lisibles (la version 2 n'a pas de passages, les versions 2 et 3
+    ## n'ont pas les occurrences dans les postings, les versions 2 à 4 n'ont pas les tokens des lignes).
+    VERSIONS_COMPATIBLES = (2, 3, 4, 5)
+
+    ## Modèles de pondération pouvant être rechargés depuis un index enregistré.
+    MODELES = {'ModeleTFIDF': ModeleTFIDF, 'ModeleBM25': ModeleBM25}
+
+    ## Agrégations possibles des scores des passages d'un même document.
+    AGREGATIONS = ("max", "somme")
+    ## Agrégations possibles des scores des documents d'un auteur (voir `search_auteurs`).
+    AGREGATIONS_AUTEURS = ("somme", "moyenne")
+    ## Nombre de filtres dont les masques sont gardés en cache (voir `_masque_lignes`).
+    TAILLE_CACHE_MASQUES = 32
+
+    def __init__(self, corpus, modele=None, tokenizer=None, facteur_fusion=4, taille_min_segment=1000,
+                 fusion_arriere_plan=True, n_workers=1, taille_lot=2000, passages=None, taille_cache=128):
         """!
         Constructeur qui lance toutes les étapes d'indexation.
 
         **Parameters**
         - **corpus**: L'objet Corpus contenant les documents.
+        - **modele**: Modèle de pondération (ModeleTFIDF par défaut, ou ModeleBM25).
+        - **tokenizer**: Tokenizer des documents et des requêtes (celui du corpus par défaut).
+        - **facteur_fusion**: Nombre de segments de même palier de taille déclenchant une fusion.
+        - **taille_min_segment**: Taille (en documents) du premier palier de fusion.
+        - **fusion_arriere_plan**: Si vrai, les fusions de segments s'exécutent dans un thread.
+        - **n_workers**: Nombre de processus pour la tokenisation et le comptage (None : tous les cœurs).
+        - **taille_lot**: Nombre de documents par lot traité par un processus.
+        - **passages**: DecoupeurPassages pour indexer des passages au lieu de documents entiers (None par défaut).
+        - **taille_cache**: Nombre de requêtes dont les résultats sont gardés en cache (0 : pas de cache).
 
         **Notes**
-        - Construit un vocabulaire, puis une matrice TF et TF-IDF.
+        - Construit un vocabulaire, puis une matrice TF et la matrice pondérée selon le modèle.
+        - Avec `passages`, chaque ligne de l'index est un passage qui référence son document parent
+          (`ids_docs`) et ses positions dans le texte du parent : les métadonnées ne sont pas dupliquées.
+        - Avec plusieurs processus, l'index obtenu est identique (bit à bit) à la construction séquentielle.
+        - Les documents ajoutés ensuite au corpus sont indexés dans des segments (voir `actualiser`).
         """
-        self.corpus = corpus
-        self.vocab = {}          
-        self.mat_TF = None       
-        self.mat_TF_IDF = None   
-        self.N_docs = len(corpus.get_documents())
+        self._init_attributs(corpus, modele, tokenizer, facteur_fusion, taille_min_segment, fusion_arriere_plan,
+                             n_workers, taille_lot, passages, taille_cache)
+        self.store = self._get_store()
+        self.N_docs = len(self.store)
+        self.ids_docs = np.array(self.store.ids_docs)
         
         self._build_vocab()
         self._build_tf_matrix()
+        self._build_statistiques()
         self._build_tfidf_matrix()
+        self._build_normes()
+        self._build_index_inverse()
 
-    def _build_vocab(self):
+    def _init_attributs(self, corpus, modele, tokenizer, facteur_fusion, taille_min_segment, fusion_arriere_plan,
+                        n_workers=1, taille_lot=2000, passages=None, taille_cache=128):
         """!
-        Construction du vocabulaire à partir du corpus.
+        Initialisation des attributs, commune au constructeur et au chargement depuis le disque.
+
+        **Parameters**
+        - Voir le constructeur.
         """
-        mots_uniques = set()
-        docs = list(self.corpus.get_documents().values())
+        self.corpus = corpus
+        self.tokenizer = tokenizer if tokenizer is not None else corpus.tokenizer
+        self.modele = modele if modele is not None else ModeleTFIDF()
+        self.vocab = {}          
+        self.mat_TF = None       
+        self.mat_TF_IDF = None   
+        self.longueurs_docs = None
+        self.longueur_moyenne = 0
+        self.df = None
+        self.idf = None
+        self.normes_docs = None
+        self._composantes_normes = None
+        self.index_inverse = None
+        self.stats_requete = {}
+        self.cache = CacheRequetes(taille_cache)
+        self._cache_masques = CacheRequetes(self.TAILLE_CACHE_MASQUES)
+        self.rang_statique = RangStatique()
+        self._incidence_auteurs = None
+        self._incidence_documents = 0
+        self.N_docs = 0
+        self.ids_docs = None
+        self.n_documents = 0
+        self.passages = passages
+        self.debuts_passages = None
+        self.fins_passages = None
+        self.facteur_fusion = facteur_fusion
+        self.taille_min_segment = taille_min_segment
+        self.fusion_arriere_plan = fusion_arriere_plan
+        self.n_workers = n_workers
+        self.taille_lot = taille_lot
+        self._blocs_tf = None
+        self.termes = []
+        self.store = None
+        self._index_positionnel = None
+        self._store_positions = None
+        self._documents_positions = 0
+        self._positions = None
+        self.lecture_seule = False
+        self._correspondance = None
+        self.segments = []
+        self.version = 0
+        self._segment_base = None
+        self._verrou = threading.Lock()
+        self._thread_fusion = None
 
-        for doc in docs:
-            texte = self.corpus.nettoyer_texte(doc.get_texte())
-            for mot in texte.split(' '):
-                if mot:
-                    mots_uniques.add(mot)
-        
-        liste_mots = sorted(list(mots_uniques))
+    def _get_store(self):
+        """!
+        Tokens des documents à indexer.
+
+        **Returns**
+        - Le TokenStore partagé du corpus, ou un TokenStore propre si le Tokenizer du moteur est différent.
+
+        **Notes**
+        - Si le TokenStore doit être construit avec plusieurs processus, les blocs de la matrice TF
+          comptés par chaque processus sont conservés pour `_build_tf_matrix`.
+        - Avec des passages, le TokenStore est propre au moteur (une entrée par passage).
+        """
+        documents = self.corpus.get_documents()
+        self.n_documents = len(documents)
+        partage = self._store_partage()
+        if partage and (self.n_workers == 1 or self.corpus.has_token_store()):
+            return self.corpus.get_token_store()
+
+        ids_docs, textes = self._textes_a_indexer(documents, 0)
+        if self.n_workers != 1:
+            constructeur = ConstructeurParallele(self.tokenizer, self.n_workers, self.taille_lot)
+            store, self._blocs_tf = constructeur.construire_textes(ids_docs, textes)
+            if partage:
+                self.corpus.set_token_store(store)
+            return store
+
+        store = TokenStore()
+        store.ajouter_lot(ids_docs, self.tokenizer.tokeniser_lot(textes))
+        return store
+
+    def _store_partage(self):
+        """!
+        Indique si le moteur utilise le TokenStore partagé du corpus.
+
+        **Returns**
+        - Vrai si le Tokenizer est celui du corpus et que l'index n'est pas au niveau des passages.
+        """
+        return self.tokenizer is self.corpus.tokenizer and self.passages is None
+
+    def _textes_a_indexer(self, documents, debut, fin=None, enregistrer=True):
+        """!
+        Textes des documents du corpus à partir de la position `debut`, découpés en passages si besoin.
+
+        **Parameters**
+        - **documents**: Dictionnaire des documents du corpus.
+        - **debut**: Position (dans l'ordre du corpus) du premier document à lire.
+        - **fin**: Position suivant le dernier document à lire (None : jusqu'à la fin du corpus).
+        - **enregistrer**: Si faux, les positions des passages ne sont pas enregistrées (lignes déjà indexées).
+
+        **Returns**
+        - Un couple (ids des documents parents, textes) avec une entrée par ligne de l'index.
+
+        **Notes**
+        - Avec des passages, les positions de chaque passage dans le texte de son parent
+          sont ajoutées à `debuts_passages` et `fins_passages`.
+        """
+        ids_docs = list(islice(documents, debut, fin))
+        if self.passages is None:
+            return ids_docs, [documents[doc_id].get_texte() for doc_id in ids_docs]
+
+        parents, textes, debuts, fins = [], [], [], []
+        for doc_id in ids_docs:
+            texte = documents[doc_id].get_texte()
+            for debut_passage, fin_passage in self.passages.decouper(texte):
+                parents.append(doc_id)
+                textes.append(texte[debut_passage:fin_passage])
+                debuts.append(debut_passage)
+                fins.append(fin_passage)
+        if not enregistrer:
+            return parents, textes
+
+        anciens = self.debuts_passages is not None
+        self.debuts_passages = np.concatenate([self.debuts_passages if anciens else np.empty(0, dtype=np.int64),
+                                               np.array(debuts, dtype=np.int64)])
+        self.fins_passages = np.concatenate([self.fins_passages if anciens else np.empty(0, dtype=np.int64),
+                                             np.array(fins, dtype=np.int64)])
+        return parents, textes
+
+    def _build_vocab(self):
+        """!
+        Construction du vocabulaire à partir des termes déjà tokenisés du corpus.
+        """
+        liste_mots = sorted(self.store.liste_termes)
+        self.termes = liste_mots
         
         self.vocab = {}
         for i, mot in enumerate(liste_mots):
@@ -69,72 +244,1326 @@ class SearchEngine:
     def _build_tf_matrix(self):
         """!
         Construction de la matrice Documents x Mots (TF).
+
+        **Notes**
+        - Construite directement depuis le tableau plat des tokens du corpus, sans re-nettoyer les textes.
         """
-        rows = []
-        cols = []
-        data = []
-        
-        docs = list(self.corpus.get_documents().values())
-        
-        for index_doc, doc in enumerate(docs):
-            texte = self.corpus.nettoyer_texte(doc.get_texte())
-            mots_doc = [m for m in texte.split(' ') if m]
-            
-            compte_local = {}
-            for mot in mots_doc:
-                compte_local[mot] = compte_local.get(mot, 0) + 1
-            
-            # Remplissage des listes pour la matrice sparse
-            for mot, count in compte_local.items():
-                if mot in self.vocab:
-                    index_mot = self.vocab[mot]['id']
-                    
-                    rows.append(index_doc)
-                    cols.append(index_mot)
-                    data.append(count)
-                    
-                    self.vocab[mot]['doc_count'] += 1
-        
+        # Correspondance identifiant du stockage -> identifiant du vocabulaire (trié)
+        correspondance = np.empty(len(self.store.liste_termes), dtype=np.int64)
+        for id_store, mot in enumerate(self.store.liste_termes):
+            correspondance[id_store] = self.vocab[mot]['id']
+        self._correspondance = correspondance
+
         n_vocab = len(self.vocab)
-        self.mat_TF = csr_matrix((data, (rows, cols)), shape=(self.N_docs, n_vocab))
+        if self._blocs_tf is not None:
+            # Blocs déjà comptés par les processus : seules les colonnes sont renumérotées
+            blocs = [csr_matrix((bloc.data, correspondance[bloc.indices], bloc.indptr), shape=(bloc.shape[0], n_vocab))
+                     for bloc in self._blocs_tf]
+            self._blocs_tf = None
+            self.mat_TF = vstack(blocs, format='csr') if blocs else csr_matrix((0, n_vocab), dtype=np.int64)
+            self.mat_TF.sort_indices()
+        else:
+            rows = self.store.lignes()
+            cols = correspondance[self.store.tokens]
+            data = np.ones(len(cols), dtype=np.int64)
+
+            # Les doublons (document, mot) sont sommés lors de la conversion en CSR
+            self.mat_TF = csr_matrix((data, (rows, cols)), shape=(self.N_docs, n_vocab))
+            self.mat_TF.sum_duplicates()
+
+        doc_counts = np.bincount(self.mat_TF.indices, minlength=n_vocab)
+        for infos in self.vocab.values():
+            infos['doc_count'] = int(doc_counts[infos['id']])
+
+    def _build_statistiques(self):
+        """!
+        Précalcul des statistiques du corpus utilisées par les modèles de pondération.
+
+        **Notes**
+        - Longueurs des documents, longueur moyenne, fréquences documentaires et IDF sous forme de tableaux NumPy.
+        """
+        self.longueurs_docs = np.asarray(self.mat_TF.sum(axis=1)).ravel()
+        self._longueur_totale = self.longueurs_docs.sum()
+        self.longueur_moyenne = self.longueurs_docs.mean() if self.N_docs > 0 else 0
+
+        self.df = np.zeros(len(self.vocab))
+        for infos in self.vocab.values():
+            self.df[infos['id']] = infos['doc_count']
+        self.idf = self.modele.idf(self.df, self.N_docs)
 
     def _build_tfidf_matrix(self):
         """!
-        Construction de la matrice TF-IDF.
+        Construction de la matrice pondérée (TF-IDF ou BM25 selon le modèle).
         """
-        idf_list = []
-        mots_tries = sorted(self.vocab.keys())
-        
-        for mot in mots_tries:
-            df = self.vocab[mot]['doc_count']
-            # Formule IDF 
-            if df > 0:
-                val_idf = math.log(self.N_docs / df)
+        self.mat_TF_IDF = self.modele.ponderer(self.mat_TF, self.longueurs_docs, self.idf, self.longueur_moyenne)
+
+    def set_modele(self, modele):
+        """!
+        Change le modèle de pondération sans re-tokeniser le corpus.
+
+        **Parameters**
+        - **modele**: Nouveau modèle (par exemple ModeleBM25(k1=1.5, b=0.5)).
+
+        **Notes**
+        - Seuls l'IDF, la matrice pondérée, les normes et l'index inversé sont recalculés depuis `mat_TF`.
+        - Les segments en attente sont d'abord consolidés dans l'index principal.
+        """
+        self._verifier_ecriture()
+        self.consolider(verbeux=False)
+        self.version += 1
+        self.modele = modele
+        self.idf = self.modele.idf(self.df, self.N_docs)
+        self._build_tfidf_matrix()
+        self._build_normes()
+        self._build_index_inverse()
+
+    def actualiser(self, verbeux=True):
+        """!
+        Indexe les documents ajoutés au corpus depuis la dernière indexation, dans un nouveau segment.
+
+        **Parameters**
+        - **verbeux**: Si faux, rien n'est affiché (synchronisation automatique avant une recherche).
+
+        **Returns**
+        - Le nombre de documents indexés.
+
+        **Notes**
+        - Seuls les nouveaux documents sont lus : le coût est proportionnel à leur nombre,
+          pas à la taille de l'index (voir `_creer_segment_base`).
+        - Les compteurs globaux (nombre de documents, fréquences documentaires, longueur moyenne)
+          sont mis à jour ; l'IDF est appliquée à la requête.
+        """
+        self._verifier_ecriture()
+        documents = self.corpus.get_documents()
+        if len(documents) <= self.n_documents:
+            return 0
+
+        if self._segment_base is None:
+            # L'index principal devient le premier segment (jamais fusionné), avant la mise à jour des compteurs
+            segment_base = self._creer_segment_base()
+            with self._verrou:
+                self._segment_base = segment_base
+
+        n_nouveaux = len(documents) - self.n_documents
+        ids_nouveaux, offsets, tokens = self._tokens_nouveaux_documents(documents)
+        debut, fin = self.N_docs, self.N_docs + len(ids_nouveaux)
+        self.n_documents = len(documents)
+        segment = Segment.depuis_tokens(np.arange(debut, fin), ids_nouveaux, offsets, tokens)
+        if len(self.df) < len(self.termes):
+            self.df = np.concatenate([self.df, np.zeros(len(self.termes) - len(self.df))])
+
+        # Mise à jour des compteurs globaux
+        doc_counts = np.diff(segment.mat_TF.indptr)
+        self.df[segment.termes] += doc_counts
+        for id_terme, count in zip(segment.termes, doc_counts):
+            self.vocab[self.termes[id_terme]]['doc_count'] += int(count)
+        self.N_docs = fin
+        self._longueur_totale += segment.longueurs.sum()
+        self.longueur_moyenne = self._longueur_totale / self.N_docs
+        self.idf = self.modele.idf(self.df, self.N_docs)
+
+        with self._verrou:
+            self.segments.append(segment)
+            self.version += 1
+
+        if verbeux:
+            print(f"-> Segment ajouté : {n_nouveaux} documents ({len(self.segments)} segments).")
+        self._planifier_fusions()
+        return n_nouveaux
+
+    def _creer_segment_base(self):
+        """!
+        Segment couvrant l'index principal, construit sans copie à partir des tableaux du moteur.
+
+        **Returns**
+        - Le Segment de base.
+
+        **Notes**
+        - Les colonnes de la matrice TF sont celles de l'index inversé (occurrences gardées avec les postings),
+          les longueurs et les composantes des normes sont celles calculées à l'indexation.
+        - Un index enregistré dans un format antérieur n'a pas les occurrences dans ses postings :
+          ses colonnes et ses composantes sont alors calculées une fois ici.
+        """
+        n_base, n_termes_base = self.mat_TF.shape
+        index = self.index_inverse
+        if index.occurrences is not None:
+            mat_TF = csc_matrix((index.occurrences, index.docs, index.indptr), shape=(n_base, n_termes_base))
+        else:
+            mat_TF = self.mat_TF.tocsc()
+        if self._composantes_normes is None and self.modele.normaliser:
+            self._composantes_normes = self._calculer_composantes_normes()
+        # Copie des fréquences : `actualiser` les met ensuite à jour sur place
+        return Segment(np.arange(n_base), self.ids_docs, mat_TF, np.arange(n_termes_base),
+                       longueurs=self.longueurs_docs, composantes=self._composantes_normes,
+                       df=np.array(self.df[:n_termes_base]))
+
+    def _id_terme(self, mot):
+        """!
+        Identifiant d'un terme dans le vocabulaire du moteur, ajouté à la fin s'il est nouveau.
+
+        **Parameters**
+        - **mot**: Le terme.
+
+        **Returns**
+        - L'identifiant du terme.
+        """
+        infos = self.vocab.get(mot)
+        if infos is None:
+            infos = {'id': len(self.termes), 'doc_count': 0}
+            self.vocab[mot] = infos
+            self.termes.append(mot)
+        return infos['id']
+
+    def _tokens_nouveaux_documents(self, documents):
+        """!
+        Tokens des documents du corpus qui ne sont pas encore indexés, en identifiants du vocabulaire.
+
+        **Parameters**
+        - **documents**: Dictionnaire des documents du corpus.
+
+        **Returns**
+        - Un triplet (ids des documents, offsets à partir de 0, tableau des identifiants de termes),
+          avec une entrée par ligne de l'index (par passage si l'index est au niveau des passages).
+
+        **Notes**
+        - Réutilise les tokens du TokenStore quand il existe : aucun document n'est tokenisé deux fois.
+        """
+        if self.store is None:
+            # Index chargé depuis le disque : seuls les nouveaux documents sont tokenisés
+            ids_docs, textes = self._textes_a_indexer(documents, self.n_documents)
+            listes_mots = self.tokenizer.tokeniser_lot(textes)
+            offsets = np.cumsum([0] + [len(mots) for mots in listes_mots])
+            tokens = np.array([self._id_terme(mot) for mots in listes_mots for mot in mots], dtype=np.int64)
+            return np.array(ids_docs, dtype=np.int64), offsets, tokens
+
+        if not self._store_partage():
+            ids_docs, textes = self._textes_a_indexer(documents, self.n_documents)
+            self.store.ajouter_lot(ids_docs, self.tokenizer.tokeniser_lot(textes))
+        else:
+            self.store = self.corpus.get_token_store()
+
+        # Nouveaux termes du stockage : ajoutés à la fin du vocabulaire
+        nouveaux_termes = [self._id_terme(mot) for mot in self.store.liste_termes[len(self._correspondance):]]
+        if nouveaux_termes:
+            self._correspondance = np.concatenate([self._correspondance, nouveaux_termes])
+
+        debut, fin = self.N_docs, len(self.store)
+        offsets = self.store.offsets[debut:fin + 1]
+        tokens = self._correspondance[self.store.tokens[offsets[0]:offsets[-1]]]
+        return np.array(self.store.ids_docs[debut:fin]), offsets - offsets[0], tokens
+
+    def _verifier_ecriture(self):
+        """!
+        Lève une ValueError si l'index est en lecture seule (chargé en mémoire partagée).
+        """
+        if self.lecture_seule:
+            raise ValueError("Index en lecture seule (chargé avec mmap=True) : modification impossible.")
+
+    def _synchroniser(self):
+        """!
+        Indexe automatiquement les documents ajoutés au corpus avant une recherche.
+
+        **Notes**
+        - Un index en lecture seule n'est pas synchronisé : il reste l'image de l'index enregistré.
+        """
+        if not self.lecture_seule and len(self.corpus.get_documents()) > self.n_documents:
+            self.actualiser(verbeux=False)
+
+    def _niveau(self, taille):
+        """!
+        Palier de taille d'un segment pour la politique de fusion.
+
+        **Parameters**
+        - **taille**: Nombre de documents du segment.
+
+        **Returns**
+        - 0 sous `taille_min_segment`, puis +1 à chaque multiplication par `facteur_fusion`.
+        """
+        if taille < self.taille_min_segment:
+            return 0
+        return 1 + int(math.log(taille / self.taille_min_segment, self.facteur_fusion))
+
+    def _groupe_a_fusionner(self):
+        """!
+        Recherche d'un palier contenant au moins `facteur_fusion` segments.
+
+        **Returns**
+        - La liste des segments à fusionner, ou None.
+        """
+        par_niveau = {}
+        for segment in self.segments:
+            par_niveau.setdefault(self._niveau(len(segment)), []).append(segment)
+        for niveau in sorted(par_niveau):
+            if len(par_niveau[niveau]) >= self.facteur_fusion:
+                return par_niveau[niveau][:self.facteur_fusion]
+        return None
+
+    def _planifier_fusions(self):
+        """!
+        Lance les fusions de segments nécessaires (dans un thread si `fusion_arriere_plan`).
+        """
+        with self._verrou:
+            if self._groupe_a_fusionner() is None:
+                return
+            if self.fusion_arriere_plan:
+                if self._thread_fusion is None or not self._thread_fusion.is_alive():
+                    self._thread_fusion = threading.Thread(target=self._fusionner_segments, daemon=True)
+                    self._thread_fusion.start()
+                return
+        self._fusionner_segments()
+
+    def _fusionner_segments(self):
+        """!
+        Fusionne les segments par paliers de taille (size-tiered) jusqu'à ce qu'aucun palier ne soit plein.
+
+        **Notes**
+        - La fusion est calculée hors verrou : les recherches continuent sur les anciens segments.
+        """
+        while True:
+            with self._verrou:
+                groupe = self._groupe_a_fusionner()
+            if groupe is None:
+                return
+
+            fusion = Segment.fusionner(groupe)
+
+            with self._verrou:
+                restants = [seg for seg in self.segments if all(seg is not g for g in groupe)]
+                self.segments = sorted(restants + [fusion], key=lambda seg: seg.lignes[0])
+
+    def attendre_fusions(self):
+        """!
+        Attend la fin des fusions de segments en arrière-plan.
+        """
+        if self._thread_fusion is not None:
+            self._thread_fusion.join()
+
+    def consolider(self, verbeux=True):
+        """!
+        Fusionne tous les segments dans l'index principal (matrices, normes et index inversé).
+
+        **Parameters**
+        - **verbeux**: Si faux, rien n'est affiché (consolidation automatique avant une recherche).
+
+        **Notes**
+        - Aucune tokenisation : les matrices TF des segments sont réutilisées.
+        """
+        self.attendre_fusions()
+        with self._verrou:
+            segments = self.segments
+            if not segments:
+                return
+
+            n_termes = len(self.termes)
+            base = self.mat_TF
+            blocs = [csr_matrix((base.data, base.indices, base.indptr), shape=(base.shape[0], n_termes))]
+            for segment in segments:
+                mat = segment.mat_TF.tocsr()
+                blocs.append(csr_matrix((mat.data, segment.termes[mat.indices], mat.indptr),
+                                        shape=(mat.shape[0], n_termes)))
+
+            lignes = np.concatenate([np.arange(base.shape[0])] + [seg.lignes for seg in segments])
+            ordre = np.argsort(lignes, kind='stable')
+            self.mat_TF = vstack(blocs).tocsr()[ordre]
+            self.mat_TF.sort_indices()
+            self.ids_docs = np.concatenate([self.ids_docs] + [seg.ids_docs for seg in segments])[ordre]
+
+            self.segments = []
+            self._segment_base = None
+            self.version += 1
+
+        self._build_statistiques()
+        self._build_tfidf_matrix()
+        self._build_normes()
+        self._build_index_inverse()
+        if verbeux:
+            print(f"-> Index consolidé : {self.N_docs} documents.")
+
+    @staticmethod
+    def _sha256(chemin):
+        """!
+        Somme de contrôle SHA-256 d'un fichier.
+
+        **Parameters**
+        - **chemin**: Chemin du fichier.
+
+        **Returns**
+        - Chaîne hexadécimale.
+        """
+        empreinte = hashlib.sha256()
+        with open(chemin, 'rb') as fichier:
+            for bloc in iter(lambda: fichier.read(1 << 20), b''):
+                empreinte.update(bloc)
+        return empreinte.hexdigest()
+
+    def _tableaux_index(self):
+        """!
+        Tableaux NumPy décrivant l'index complet.
+
+        **Returns**
+        - Dictionnaire {nom: tableau}.
+        """
+        termes = [mot.encode('utf-8') for mot in self.termes]
+        tableaux = {
+            'tf_indptr': self.mat_TF.indptr,
+            'tf_indices': self.mat_TF.indices,
+            'tf_data': self.mat_TF.data,
+            'poids_indptr': self.mat_TF_IDF.indptr,
+            'poids_indices': self.mat_TF_IDF.indices,
+            'poids_data': self.mat_TF_IDF.data,
+            'postings_indptr': self.index_inverse.indptr,
+            'postings_docs': self.index_inverse.docs,
+            'postings_poids': self.index_inverse.poids,
+            'bornes': self.index_inverse.bornes,
+            'idf': self.idf,
+            'df': self.df,
+            'normes': self.normes_docs,
+            'longueurs': self.longueurs_docs,
+            'ids_docs': self.ids_docs,
+            # Vocabulaire : un tampon UTF-8 et la position de début de chaque terme
+            'termes_tampon': np.frombuffer(b''.join(termes), dtype=np.uint8),
+            'termes_offsets': np.cumsum([0] + [len(mot) for mot in termes], dtype=np.int64),
+            'termes_ordre': VocabulaireMappe.ordre_lexicographique(self.termes),
+        }
+        if self.index_inverse.occurrences is not None:
+            tableaux['postings_occurrences'] = self.index_inverse.occurrences
+        if self.passages is not None:
+            tableaux['passages_debuts'] = self.debuts_passages
+            tableaux['passages_fins'] = self.fins_passages
+        tableaux['positions_tokens'], tableaux['positions_offsets'] = self._tableaux_positions()
+        return tableaux
+
+    def _tableaux_positions(self):
+        """!
+        Tokens de chaque ligne de l'index, pour reconstruire l'index positionnel d'un index chargé.
+
+        **Returns**
+        - Un couple (identifiants des tokens dans le vocabulaire de l'index, offsets de chaque ligne).
+        """
+        store = self._get_store_positions()
+        correspondance = np.array([self.vocab[mot]['id'] for mot in store.liste_termes], dtype=np.uint32)
+        offsets = store.offsets[:self.N_docs + 1]
+        return correspondance[store.tokens[:offsets[-1]]], offsets
+
+    def save(self, path):
+        """!
+        Enregistre l'index sur le disque.
+
+        **Parameters**
+        - **path**: Répertoire de destination (créé si nécessaire).
+
+        **Notes**
+        - Un fichier `.npy` par tableau (matrices CSR, IDF, normes, vocabulaire, ids des documents,
+          positions des passages, tokens de chaque ligne pour l'index positionnel), et un en-tête `index.json`
+          contenant la version du format, le modèle, le tokenizer, l'empreinte du corpus et la somme de contrôle
+          de chaque fichier.
+        - L'en-tête est écrit en dernier : un enregistrement interrompu n'est pas rechargeable.
+        """
+        self._verifier_ecriture()
+        self._synchroniser()
+        self.consolider(verbeux=False)
+        os.makedirs(path, exist_ok=True)
+        print(f"\n-> Sauvegarde de l'index dans {path}...")
+
+        fichiers = {}
+        for nom, tableau in self._tableaux_index().items():
+            chemin = os.path.join(path, f"{nom}.npy")
+            np.save(chemin, np.ascontiguousarray(tableau), allow_pickle=False)
+            fichiers[nom] = {
+                'sha256': self._sha256(chemin),
+                'dtype': str(tableau.dtype),
+                'shape': list(tableau.shape)
+            }
+
+        entete = {
+            'format': self.FORMAT_INDEX,
+            'version': self.VERSION_FORMAT,
+            'modele': {'classe': self.modele.__class__.__name__, 'parametres': self.modele.get_parametres()},
+            'tokenizer': self.tokenizer.get_parametres(),
+            'N_docs': int(self.N_docs),
+            'n_documents': int(self.n_documents),
+            'passages': self.passages.get_parametres() if self.passages is not None else None,
+            'n_termes': len(self.termes),
+            'longueur_moyenne': float(self.longueur_moyenne),
+            'signature_corpus': self.corpus.signature(),
+            'fichiers': fichiers
+        }
+        with open(os.path.join(path, 'index.json'), 'w', encoding='utf-8') as fichier:
+            json.dump(entete, fichier, indent=2)
+        print("Sauvegarde terminée.")
+
+    @classmethod
+    def load(cls, path, corpus, facteur_fusion=4, taille_min_segment=1000, fusion_arriere_plan=True,
+             mmap=False, prechauffer=False, verifier=True, taille_cache=128):
+        """!
+        Charge un index enregistré par `save`, sans aucune tokenisation.
+
+        **Parameters**
+        - **path**: Répertoire de l'index.
+        - **corpus**: Le Corpus indexé (doit être identique à celui de l'enregistrement).
+        - **facteur_fusion**, **taille_min_segment**, **fusion_arriere_plan**: Voir le constructeur.
+        - **mmap**: Si vrai, les tableaux sont projetés en mémoire (`numpy.memmap`) au lieu d'être copiés,
+          et l'index est en lecture seule.
+        - **prechauffer**: Si vrai (avec `mmap`), charge les pages des tableaux dès l'ouverture (voir `prechauffer`).
+        - **verifier**: Si faux, les sommes de contrôle ne sont pas recalculées (ouverture plus rapide).
+        - **taille_cache**: Voir le constructeur.
+
+        **Returns**
+        - Le SearchEngine chargé.
+
+        **Notes**
+        - Lève une ValueError si le format ou sa version ne correspondent pas, si le corpus a changé
+          depuis l'enregistrement, ou si un fichier est corrompu (somme de contrôle).
+        - Avec `mmap`, plusieurs processus qui chargent le même index partagent ses pages via le cache
+          du système : la mémoire n'est pas multipliée par le nombre de processus.
+        """
+        print(f"\n-> Chargement de l'index depuis {path}...")
+        with open(os.path.join(path, 'index.json'), encoding='utf-8') as fichier:
+            entete = json.load(fichier)
+
+        if entete.get('format') != cls.FORMAT_INDEX or entete.get('version') not in cls.VERSIONS_COMPATIBLES:
+            raise ValueError(f"Format d'index non supporté : {entete.get('format')} v{entete.get('version')} "
+                             f"(attendu {cls.FORMAT_INDEX} v{cls.VERSION_FORMAT}).")
+        if entete['signature_corpus'] != corpus.signature():
+            raise ValueError("L'index enregistré ne correspond pas au corpus (documents modifiés depuis l'enregistrement).")
+
+        tableaux = {}
+        for nom, infos in entete['fichiers'].items():
+            chemin = os.path.join(path, f"{nom}.npy")
+            if verifier and cls._sha256(chemin) != infos['sha256']:
+                raise ValueError(f"Somme de contrôle invalide pour {chemin} : fichier corrompu ou modifié.")
+            # Un tableau vide ne peut pas être projeté en mémoire
+            projeter = mmap and math.prod(infos['shape']) > 0
+            tableaux[nom] = np.load(chemin, mmap_mode='r' if projeter else None, allow_pickle=False)
+
+        tokenizer = corpus.tokenizer
+        if tokenizer.get_parametres() != entete['tokenizer']:
+            tokenizer = Tokenizer(**entete['tokenizer'])
+        modele = cls.MODELES[entete['modele']['classe']](**entete['modele']['parametres'])
+        passages = DecoupeurPassages(**entete['passages']) if entete.get('passages') else None
+
+        moteur = cls.__new__(cls)
+        moteur._init_attributs(corpus, modele, tokenizer, facteur_fusion, taille_min_segment, fusion_arriere_plan,
+                               passages=passages, taille_cache=taille_cache)
+        moteur.lecture_seule = mmap
+        moteur._charger_tableaux(entete, tableaux)
+        if mmap and prechauffer:
+            moteur.prechauffer()
+        print(f"Chargement terminé. {moteur.N_docs} documents, {len(moteur.vocab)} mots.")
+        return moteur
+
+    def _charger_tableaux(self, entete, tableaux):
+        """!
+        Reconstruction de l'état du moteur à partir des tableaux d'un index enregistré.
+
+        **Parameters**
+        - **entete**: En-tête `index.json` de l'index.
+        - **tableaux**: Dictionnaire {nom: tableau} des fichiers `.npy`.
+        """
+        self.N_docs = entete['N_docs']
+        self.n_documents = entete.get('n_documents', self.N_docs)
+        forme = (self.N_docs, entete['n_termes'])
+
+        self.df = tableaux['df']
+        offsets = tableaux['termes_offsets']
+        if self.lecture_seule:
+            # Pas de dictionnaire Python : recherche dichotomique dans les tableaux projetés
+            self.termes = None
+            self.vocab = VocabulaireMappe(tableaux['termes_tampon'], offsets, tableaux['termes_ordre'], self.df)
+        else:
+            tampon = tableaux['termes_tampon'].tobytes()
+            self.termes = [tampon[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+            self.vocab = {mot: {'id': i, 'doc_count': int(self.df[i])} for i, mot in enumerate(self.termes)}
+
+        self.mat_TF = csr_matrix((tableaux['tf_data'], tableaux['tf_indices'], tableaux['tf_indptr']), shape=forme)
+        self.mat_TF_IDF = csr_matrix((tableaux['poids_data'], tableaux['poids_indices'], tableaux['poids_indptr']),
+                                     shape=forme)
+        self.index_inverse = InvertedIndex.depuis_tableaux(tableaux['postings_indptr'], tableaux['postings_docs'],
+                                                           tableaux['postings_poids'], tableaux['bornes'], self.N_docs,
+                                                           tableaux.get('postings_occurrences'))
+        self.idf = tableaux['idf']
+        self.normes_docs = tableaux['normes']
+        self.longueurs_docs = tableaux['longueurs']
+        self._longueur_totale = self.longueurs_docs.sum()
+        self.longueur_moyenne = entete['longueur_moyenne']
+        self.ids_docs = tableaux['ids_docs']
+        if self.passages is not None:
+            self.debuts_passages = tableaux['passages_debuts']
+            self.fins_passages = tableaux['passages_fins']
+        if 'positions_tokens' in tableaux:
+            self._positions = (tableaux['positions_tokens'], tableaux['positions_offsets'])
+            self._documents_positions = self.n_documents
+
+    def _tableaux_projetes(self):
+        """!
+        Tableaux de l'index projetés en mémoire.
+
+        **Returns**
+        - Liste des `numpy.memmap` utilisés par le moteur.
+        """
+        tableaux = [self.mat_TF.indptr, self.mat_TF.indices, self.mat_TF.data,
+                    self.mat_TF_IDF.indptr, self.mat_TF_IDF.indices, self.mat_TF_IDF.data,
+                    self.index_inverse.indptr, self.index_inverse.docs, self.index_inverse.poids,
+                    self.index_inverse.bornes, self.idf, self.df, self.normes_docs, self.longueurs_docs,
+                    self.ids_docs]
+        if self.index_inverse.occurrences is not None:
+            tableaux.append(self.index_inverse.occurrences)
+        if isinstance(self.vocab, VocabulaireMappe):
+            tableaux += [self.vocab.tampon, self.vocab.offsets, self.vocab.ordre]
+        if self.passages is not None:
+            tableaux += [self.debuts_passages, self.fins_passages]
+        if self._positions is not None:
+            tableaux += list(self._positions)
+
+        # Les matrices creuses gardent une vue sur le memmap : on remonte à la projection d'origine
+        projetes = []
+        for tableau in tableaux:
+            while not isinstance(tableau, np.memmap) and isinstance(tableau.base, np.ndarray):
+                tableau = tableau.base
+            if isinstance(tableau, np.memmap):
+                projetes.append(tableau)
+        return projetes
+
+    def prechauffer(self):
+        """!
+        Charge à l'avance les pages des tableaux projetés en mémoire.
+
+        **Returns**
+        - Le nombre d'octets préchargés.
+
+        **Notes**
+        - Évite les défauts de page lors des premières requêtes. La lecture d'un octet par page
+          remplit le cache du système, partagé par tous les processus qui projettent l'index.
+        """
+        taille_page = mmap.PAGESIZE
+        total = 0
+        for tableau in self._tableaux_projetes():
+            if hasattr(mmap, 'MADV_WILLNEED') and getattr(tableau, '_mmap', None) is not None:
+                tableau._mmap.madvise(mmap.MADV_WILLNEED)
+            octets = tableau.reshape(-1).view(np.uint8)
+            int(octets[::taille_page].sum())
+            total += octets.nbytes
+        return total
+
+    def _scores_segments(self, query_vec):
+        """!
+        Calcul des scores sur l'index principal et les segments, avec les statistiques globales courantes.
+
+        **Parameters**
+        - **query_vec**: Vecteur creux de la requête.
+
+        **Returns**
+        - Un triplet (lignes, ids, scores) des documents de score strictement positif, par ordre d'indexation.
+        """
+        with self._verrou:
+            segments = [self._segment_base] + self.segments
+            version = self.version
+
+        norm_query = self._normes_requetes(query_vec)[0]
+        lignes, ids, scores = [], [], []
+        for segment in segments:
+            docs, dots = segment.produits(query_vec.indices, query_vec.data, self.modele,
+                                          self.idf, self.longueur_moyenne)
+            if self.modele.normaliser:
+                normes = segment.normes(self.modele, self.df, self.N_docs, self.idf, self.longueur_moyenne,
+                                        version)[docs]
+                sims = np.zeros(len(dots))
+                np.divide(dots, normes * norm_query, out=sims, where=normes > 0)
+                dots = sims
+            lignes.append(segment.lignes[docs])
+            ids.append(segment.ids_docs[docs])
+            scores.append(dots)
+
+        lignes = np.concatenate(lignes)
+        ids = np.concatenate(ids)
+        scores = np.concatenate(scores)
+
+        positifs = scores > 0
+        ordre = np.argsort(lignes[positifs], kind='stable')
+        return lignes[positifs][ordre], ids[positifs][ordre], scores[positifs][ordre]
+
+    @staticmethod
+    def _agreger(lignes, ids, scores, agregation):
+        """!
+        Regroupement des scores des passages par document parent (field collapsing).
+
+        **Parameters**
+        - **lignes**: Lignes de l'index (passages) de score strictement positif.
+        - **ids**: Identifiants des documents parents, dans le même ordre.
+        - **scores**: Scores des passages, dans le même ordre.
+        - **agregation**: "max" (score du meilleur passage) ou "somme" (somme des scores des passages).
+
+        **Returns**
+        - Un triplet (lignes, ids, scores) avec une entrée par document parent : la ligne est celle
+          de son meilleur passage, le score est le score agrégé.
+        """
+        if len(lignes) == 0:
+            return lignes, ids, scores
+
+        # Tri par parent puis par score décroissant : le premier passage de chaque groupe est le meilleur
+        ordre = np.lexsort((-scores, ids))
+        lignes, ids, scores = lignes[ordre], ids[ordre], scores[ordre]
+        debuts = np.flatnonzero(np.concatenate([[True], ids[1:] != ids[:-1]]))
+        agreges = scores[debuts] if agregation == "max" else np.add.reduceat(scores, debuts)
+        return lignes[debuts], ids[debuts], agreges
+
+    def _build_normes(self):
+        """!
+        Précalcul des normes des documents (lignes de la matrice TF-IDF).
+
+        **Notes**
+        - Calculées une seule fois à l'indexation au lieu d'être recalculées à chaque requête.
+        - Pour un modèle sans normalisation (BM25), toutes les normes valent 1.
+        - Les composantes des normes (voir `ModeleScoring.composantes_normes`) sont gardées pour
+          l'indexation incrémentale : les normes de l'index principal se mettent alors à jour
+          sans relire toute la matrice.
+        """
+        self._composantes_normes = None
+        if not self.modele.normaliser:
+            self.normes_docs = np.ones(self.N_docs)
+            return
+
+        carres = self.mat_TF_IDF.multiply(self.mat_TF_IDF).sum(axis=1)
+        self.normes_docs = np.sqrt(np.asarray(carres).ravel())
+        self._composantes_normes = self._calculer_composantes_normes()
+
+    def _calculer_composantes_normes(self):
+        """!
+        Composantes des normes des lignes de l'index principal.
+
+        **Returns**
+        - Tableau NumPy (composantes x lignes), ou None si le modèle ne décompose pas ses normes.
+        """
+        lignes = np.repeat(np.arange(self.mat_TF.shape[0]), np.diff(self.mat_TF.indptr))
+        return self.modele.composantes_normes(self.mat_TF.data, lignes, self.df[self.mat_TF.indices],
+                                              self.mat_TF.shape[0])
+
+    def _build_index_inverse(self):
+        """!
+        Construction de l'index inversé (terme -> documents) à partir de la matrice TF-IDF.
+
+        **Notes**
+        - Les poids sont divisés par la norme du document : le produit avec la requête donne directement le cosinus.
+        - Construit depuis la matrice TF par colonnes : les occurrences sont gardées avec les postings
+          (y compris les couples de poids nul), pour servir de segment de base à l'indexation incrémentale.
+        """
+        inverses = np.zeros(self.N_docs)
+        np.divide(1.0, self.normes_docs, out=inverses, where=self.normes_docs > 0)
+        mat_csc = self.mat_TF.tocsc()
+        mat_csc.sort_indices()
+        colonnes = np.repeat(np.arange(mat_csc.shape[1]), np.diff(mat_csc.indptr))
+        docs = mat_csc.indices
+        poids = self.modele.poids(mat_csc.data, self.longueurs_docs[docs], self.idf[colonnes], self.longueur_moyenne)
+        mat_poids = csc_matrix((poids * inverses[docs], docs, mat_csc.indptr), shape=mat_csc.shape)
+        self.index_inverse = InvertedIndex(mat_poids, occurrences=mat_csc.data)
+
+    def _get_store_positions(self):
+        """!
+        Tokens des lignes de l'index, à jour des documents indexés, sur lesquels repose l'index positionnel.
+
+        **Returns**
+        - Le TokenStore du moteur, ou celui reconstruit pour un index chargé depuis le disque.
+
+        **Notes**
+        - Un index chargé depuis le disque n'a pas de TokenStore : il est reconstruit à partir des tokens
+          enregistrés avec l'index. Seuls les documents indexés depuis le chargement sont tokenisés
+          (tous les documents pour un index enregistré sans ses tokens, aux formats 2 à 4).
+        """
+        if self.store is not None:
+            return self.store
+
+        if self._store_positions is None:
+            if self._positions is not None:
+                tokens, offsets = self._positions
+                termes = self.termes
+                if termes is None:
+                    termes = map(self.vocab.get_terme, range(len(self.vocab)))
+                self._store_positions = TokenStore.depuis_tableaux(self.ids_docs[:len(offsets) - 1], termes,
+                                                                   tokens, offsets)
             else:
-                val_idf = 0
-            idf_list.append(val_idf)
-            
-        # Multiplication : Matrice TF * Diagonale des IDF
-        diag_idf = diags(idf_list)
-        
-        self.mat_TF_IDF = self.mat_TF.dot(diag_idf)
+                self._store_positions = TokenStore()
+        store = self._store_positions
+        if self._documents_positions < self.n_documents:
+            ids_docs, textes = self._textes_a_indexer(self.corpus.get_documents(), self._documents_positions,
+                                                      self.n_documents, enregistrer=False)
+            store.ajouter_lot(ids_docs, self.tokenizer.tokeniser_lot(textes))
+            self._documents_positions = self.n_documents
+        return store
+
+    def _get_index_positionnel(self):
+        """!
+        Index positionnel des lignes de l'index (pour les phrases et la proximité), construit à la première demande.
+
+        **Returns**
+        - L'IndexPositionnel, à jour des documents indexés.
+
+        **Notes**
+        - Construit au-dessus des tokens de `_get_store_positions` : aucun document déjà tokenisé ne l'est à nouveau.
+        - N'est construit que pour une requête avec phrase ou NEAR, ou avec un poids de proximité non nul.
+        """
+        store = self._get_store_positions()
+        if self._index_positionnel is None or self._index_positionnel.store is not store:
+            self._index_positionnel = IndexPositionnel(store)
+        self._index_positionnel.actualiser()
+        return self._index_positionnel
+
+    def _scores_positionnels(self, requete, lignes, scores, poids_proximite):
+        """!
+        Application des phrases, des contraintes de proximité et du bonus de proximité aux scores.
+
+        **Parameters**
+        - **requete**: RequetePositionnelle analysée.
+        - **lignes**: Lignes de l'index des scores.
+        - **scores**: Scores des lignes (sac de mots).
+        - **poids_proximite**: Poids du bonus de proximité (0 : pas de bonus).
+
+        **Returns**
+        - Tableau NumPy des scores : nuls pour les lignes ne vérifiant pas les contraintes,
+          multipliés par `1 + poids_proximite * bonus` sinon (bonus entre 0 et 1).
+        """
+        bonus = poids_proximite > 0 and bool(requete.paires())
+        if not requete.a_contraintes() and not bonus:
+            return scores
+
+        index = self._get_index_positionnel()
+        if requete.a_contraintes():
+            scores = np.where(np.isin(lignes, requete.lignes_valides(index)), scores, 0.0)
+        if bonus:
+            scores = scores * (1.0 + poids_proximite * requete.proximite(index, self.N_docs)[lignes])
+        return scores
+
+    def _masque_lignes(self, filtres, ids):
+        """!
+        Lignes de l'index dont le document vérifie les filtres de métadonnées.
+
+        **Parameters**
+        - **filtres**: FiltresMetadonnees actifs.
+        - **ids**: Identifiants (dans le Corpus) des documents des lignes.
+
+        **Returns**
+        - Masque booléen NumPy, aligné sur `ids`.
+
+        **Notes**
+        - Les filtres sont compilés sur les colonnes de métadonnées du corpus (un élément par document),
+          puis lus pour chaque ligne : les passages d'un document partagent son résultat.
+        - Le masque des documents et celui des lignes de l'index principal sont gardés en cache par filtre,
+          jusqu'au prochain changement de l'index ou du corpus : une requête qui réutilise des filtres
+          ne reparcourt pas les métadonnées.
+        """
+        metadonnees = self.corpus.get_metadonnees()
+        cle = filtres.cle()
+        version = (self.version, self.corpus.get_version())
+        masques = self._cache_masques.get(cle, version)
+        if masques is None:
+            masque_documents = filtres.masque(metadonnees)
+            masques = (masque_documents, masque_documents[metadonnees.positions(self.ids_docs)])
+            for masque in masques:
+                masque.setflags(write=False)
+            self._cache_masques.put(cle, version, masques)
+
+        masque_documents, masque_index = masques
+        if ids is self.ids_docs:
+            return masque_index
+        return masque_documents[metadonnees.positions(ids)]
+
+    def _facteurs_statiques(self, ids, poids_recence, poids_commentaires):
+        """!
+        Facteurs de rang statique (fraîcheur, commentaires) des documents de lignes de l'index.
+
+        **Parameters**
+        - **ids**: Identifiants (dans le Corpus) des documents des lignes.
+        - **poids_recence**, **poids_commentaires**: Voir `search`.
+
+        **Returns**
+        - Tableau NumPy des facteurs multiplicatifs des scores, aligné sur `ids`.
+
+        **Notes**
+        - Les caractéristiques sont calculées une fois par document (voir RangStatique) : une requête
+          ne fait qu'une lecture et deux opérations par ligne.
+        """
+        metadonnees = self.corpus.get_metadonnees()
+        rang_statique = self.rang_statique.actualiser(metadonnees)
+        return rang_statique.facteurs(metadonnees.positions(ids), poids_recence, poids_commentaires)
+
+    def _vecteur_requete(self, mots):
+        """!
+        Construction du vecteur creux (1 x vocabulaire) d'une requête.
+
+        **Parameters**
+        - **mots**: Tokens de la requête (voir `RequetePositionnelle.mots`).
+
+        **Returns**
+        - Une matrice creuse CSR contenant le nombre d'occurrences de chaque mot connu.
+        """
+        compte = {}
+        for mot in mots:
+            if mot in self.vocab:
+                idx = self.vocab[mot]['id']
+                compte[idx] = compte.get(idx, 0) + 1
+
+        cols = sorted(compte)
+        data = [float(compte[c]) for c in cols]
+        rows = [0] * len(cols)
+        return csr_matrix((data, (rows, cols)), shape=(1, len(self.vocab)))
+
+    def _normes_requetes(self, mat_queries):
+        """!
+        Normes des vecteurs requêtes selon le modèle de pondération.
+
+        **Parameters**
+        - **mat_queries**: Matrice creuse (requêtes x vocabulaire).
+
+        **Returns**
+        - Tableau NumPy des normes (1 pour un modèle sans normalisation).
+        """
+        if not self.modele.normaliser:
+            return np.ones(mat_queries.shape[0])
+        return np.sqrt(np.asarray(mat_queries.multiply(mat_queries).sum(axis=1)).ravel())
+
+    @staticmethod
+    def _top_k(scores, k):
+        """!
+        Sélection des k meilleurs scores par sélection partielle.
+
+        **Parameters**
+        - **scores**: Tableau NumPy des scores.
+        - **k**: Nombre d'indices à retourner.
+
+        **Returns**
+        - Les indices des k meilleurs scores, triés par score décroissant puis par indice.
+        """
+        n = len(scores)
+        k = min(k, n)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        if k < n:
+            # argpartition est en O(N), seul le sous-ensemble retenu est trié.
+            # Les ex-aequo au seuil sont départagés par indice croissant.
+            seuil = scores[np.argpartition(-scores, k - 1)[k - 1]]
+            superieurs = np.flatnonzero(scores > seuil)
+            egaux = np.flatnonzero(scores == seuil)[:k - len(superieurs)]
+            candidats = np.concatenate([superieurs, egaux])
+        else:
+            candidats = np.arange(n)
+
+        ordre = np.lexsort((candidats, -scores[candidats]))
+        return candidats[ordre]
 
-    def search(self, query, n_results=10):
+    def _scores(self, query_vec, lignes=None):
+        """!
+        Calcul des scores (similarités cosinus, ou BM25) entre la requête et tous les documents.
+
+        **Parameters**
+        - **query_vec**: Vecteur creux de la requête (1 x vocabulaire).
+        - **lignes**: Lignes de l'index à évaluer (None : toutes).
+
+        **Returns**
+        - Tableau NumPy des scores (un par document, ou un par ligne de `lignes`).
+        """
+        norm_query = self._normes_requetes(query_vec)[0]
+        matrice, normes = self.mat_TF_IDF, self.normes_docs
+        if lignes is not None:
+            # Seules les lignes retenues sont lues : coût proportionnel à leur nombre de termes
+            matrice, normes = matrice[lignes], normes[lignes]
+        # Un seul produit matrice creuse - vecteur creux pour tout le corpus
+        dots = np.asarray(matrice.dot(query_vec.T).todense()).ravel()
+
+        scores = np.zeros(matrice.shape[0])
+        np.divide(dots, normes * norm_query, out=scores, where=normes > 0)
+        return scores
+
+    def _build_resultats(self, ids, scores, lignes=None):
+        """!
+        Construction des résultats d'une requête.
+
+        **Parameters**
+        - **ids**: Identifiants (dans le Corpus) des documents triés.
+        - **scores**: Scores des documents, dans le même ordre que `ids`.
+        - **lignes**: Lignes de l'index correspondantes (pour retrouver les passages).
+
+        **Returns**
+        - Un objet Resultats (documents de score strictement positif), sans lecture des métadonnées.
+        """
+        extraits = None
+        if self.passages is not None and lignes is not None:
+            extraits = (self.debuts_passages[lignes], self.fins_passages[lignes])
+        return Resultats(self.corpus.get_documents(), ids, scores, extraits)
+
+    def search(self, query, n_results=10, methode="vectorielle", agregation="max", dataframe=True,
+               poids_proximite=0.0, filtres=None, poids_recence=0.0, poids_commentaires=0.0):
         """!
         Recherche des documents les plus pertinents pour une requête.
 
+        **Parameters**
+        - **query**: La requête utilisateur.
+        - **n_results**: Nombre de documents à retourner.
+        - **methode**: "vectorielle" (produit matrice creuse - vecteur), "maxscore" (index inversé avec élagage top-k)
+          ou "boucle" (ancienne boucle document par document, conservée pour comparaison).
+        - **agregation**: Pour un index au niveau des passages, "max" ou "somme" (une ligne par document
+          avec son meilleur passage), ou None (une ligne par passage). Ignoré sinon.
+        - **dataframe**: Si faux, retourne un objet Resultats (tableaux NumPy des ids et des scores,
+          métadonnées lues à la demande) au lieu d'un DataFrame.
+        - **poids_proximite**: Poids du bonus de proximité des mots de la requête (0 par défaut : sac de mots pur).
+        - **filtres**: Dictionnaire de filtres sur les métadonnées, par exemple
+          `{'type': 'Reddit', 'date_min': '2024-01-01', 'nb_comments_min': 10}` (voir FiltresMetadonnees).
+        - **poids_recence**: Poids de la fraîcheur des documents (0 : non utilisée).
+        - **poids_commentaires**: Poids du nombre de commentaires Reddit (0 : non utilisé).
+
+        **Returns**
+        - Un DataFrame (ou un Resultats) avec les résultats triés par score décroissant.
+
+        **Notes**
+        - Retourne un résultat vide si aucun terme de la requête n'est dans le vocabulaire.
+        - Avec "maxscore", le nombre de postings évalués est disponible dans `stats_requete`.
+        - Les documents ajoutés au corpus depuis l'indexation sont d'abord indexés dans un segment ;
+          "maxscore" et "boucle" consolident les segments dans l'index principal avant de chercher. Cette
+          consolidation reconstruit les matrices, les normes et l'index inversé (coût proportionnel à la taille
+          de l'index) : avec des ajouts fréquents, "vectorielle" évite ce coût en évaluant les segments.
+        - L'agrégation des passages n'est disponible qu'avec "vectorielle".
+        - Phrases exactes (`"foreign policy"`) et proximité (`war NEAR/5 peace`) : voir RequetePositionnelle.
+          Seules les lignes qui les vérifient sont retournées ; elles ne sont disponibles qu'avec "vectorielle".
+        - Avec "vectorielle", le score d'une ligne est multiplié par `1 + poids_proximite * bonus`, où le bonus
+          (entre 0 et 1) est d'autant plus grand que les mots consécutifs de la requête sont proches dans
+          la ligne, et dans le même ordre. L'index positionnel n'est construit que pour une phrase, un NEAR
+          ou un poids de proximité non nul : par défaut, les scores sont ceux de "maxscore" et "boucle".
+        - Les filtres ne sont disponibles qu'avec "vectorielle" : ils sont évalués en masque booléen sur
+          des colonnes de métadonnées avant le calcul des scores, et seules les lignes retenues sont évaluées.
+        - Rang statique (voir RangStatique, demi-vie réglable avec `rang_statique.set_demi_vie`) : avec
+          "vectorielle", le score est aussi multiplié par
+          `1 + poids_recence * fraîcheur + poids_commentaires * engagement`, avant la sélection des meilleurs.
+        - Les résultats sont mis en cache (voir `get_stats_cache`) : la clé est la requête analysée
+          et les paramètres de recherche ; le cache est vidé dès que l'index ou le corpus change.
+        """
+        if methode not in ("vectorielle", "maxscore", "boucle"):
+            raise ValueError(f"Méthode de recherche inconnue : {methode}")
+        grouper = self._verifier_agregation(agregation)
+        if grouper and methode != "vectorielle":
+            raise ValueError("L'agrégation des passages n'est disponible qu'avec la méthode 'vectorielle'.")
+        requete = RequetePositionnelle(query, self.tokenizer)
+        if requete.a_contraintes() and methode != "vectorielle":
+            raise ValueError("Les phrases et l'opérateur NEAR ne sont disponibles qu'avec la méthode 'vectorielle'.")
+        filtres = FiltresMetadonnees(filtres)
+        if filtres and methode != "vectorielle":
+            raise ValueError("Les filtres ne sont disponibles qu'avec la méthode 'vectorielle'.")
+        if (poids_recence or poids_commentaires) and methode != "vectorielle":
+            raise ValueError("Le rang statique n'est disponible qu'avec la méthode 'vectorielle'.")
+
+        self._synchroniser()
+        if methode != "vectorielle":
+            self.consolider(verbeux=False)
+
+        cle = (requete.cle(), n_results, methode, agregation if self.passages else None,
+               poids_proximite if methode == "vectorielle" else None, filtres.cle(),
+               poids_recence, poids_commentaires, self.rang_statique.demi_vie if poids_recence else None)
+        version = (self.version, self.corpus.get_version())
+        en_cache = self.cache.get(cle, version)
+        if en_cache is not None:
+            resultats, self.stats_requete = en_cache
+        else:
+            self.stats_requete = {}
+            resultats = self._search_sans_cache(requete, query, n_results, methode, agregation, grouper,
+                                                poids_proximite, filtres, poids_recence, poids_commentaires)
+            self.cache.put(cle, version, (resultats, self.stats_requete))
+
+        # Un Resultats est en lecture seule ; to_dataframe retourne une copie du DataFrame construit une fois
+        return resultats.to_dataframe() if dataframe else resultats
+
+    def _search_sans_cache(self, requete, query, n_results, methode, agregation, grouper, poids_proximite,
+                           filtres, poids_recence=0.0, poids_commentaires=0.0):
+        """!
+        Calcul des résultats d'une requête (voir `search`), sans consulter le cache.
+
+        **Parameters**
+        - **requete**: RequetePositionnelle analysée.
+        - **query**, **n_results**, **methode**, **agregation**, **poids_proximite**: Voir `search`.
+        - **grouper**: Vrai si les scores des passages sont regroupés par document.
+        - **filtres**: FiltresMetadonnees (voir `search`).
+        - **poids_recence**, **poids_commentaires**: Voir `search`.
+
+        **Returns**
+        - Un objet Resultats trié par score décroissant.
+        """
+        if methode == "boucle":
+            return self._search_boucle(query, n_results)
+
+        query_vec = self._vecteur_requete(requete.mots)
+        if query_vec.nnz == 0:
+            return self._build_resultats([], [])
+
+        if methode == "maxscore":
+            norm_query = self._normes_requetes(query_vec)[0]
+            poids_requete = dict(zip(query_vec.indices, query_vec.data / norm_query))
+            indices, scores, self.stats_requete = self.index_inverse.top_k(poids_requete, n_results)
+            return self._build_resultats(self.ids_docs[indices], scores, indices)
+
+        lignes, ids, scores = self._scores_vectoriels(requete, query_vec, agregation, grouper, poids_proximite,
+                                                      filtres, poids_recence, poids_commentaires)
+        meilleurs = self._top_k(scores, n_results)
+        return self._build_resultats(ids[meilleurs], scores[meilleurs], lignes[meilleurs])
+
+    def _scores_vectoriels(self, requete, query_vec, agregation, grouper, poids_proximite, filtres,
+                           poids_recence=0.0, poids_commentaires=0.0):
+        """!
+        Scores des lignes de l'index pour la méthode "vectorielle", avant la sélection des meilleurs.
+
+        **Parameters**
+        - **requete**: RequetePositionnelle analysée.
+        - **query_vec**: Vecteur creux de la requête (au moins un terme connu).
+        - **agregation**, **grouper**, **poids_proximite**, **filtres**, **poids_recence**, **poids_commentaires**:
+          Voir `_search_sans_cache`.
+
+        **Returns**
+        - Un triplet (lignes, ids, scores) de tableaux NumPy alignés (une ligne par document si `grouper`).
+        """
+        if self.segments:
+            lignes, ids, scores = self._scores_segments(query_vec)
+            if filtres:
+                retenues = self._masque_lignes(filtres, ids)
+                lignes, ids, scores = lignes[retenues], ids[retenues], scores[retenues]
+        elif filtres:
+            # Filtres appliqués avant le produit : les lignes écartées ne sont pas évaluées
+            # (si elles sont peu nombreuses, le produit sur tout l'index reste moins coûteux que l'extraction)
+            lignes = np.flatnonzero(self._masque_lignes(filtres, self.ids_docs))
+            if len(lignes) * 2 < self.N_docs:
+                scores = self._scores(query_vec, lignes)
+            else:
+                scores = self._scores(query_vec)[lignes]
+            ids = self.ids_docs[lignes]
+        else:
+            scores = self._scores(query_vec)
+            lignes, ids = np.arange(self.N_docs), self.ids_docs
+        scores = self._scores_positionnels(requete, lignes, scores, poids_proximite)
+        if poids_recence or poids_commentaires:
+            scores = scores * self._facteurs_statiques(ids, poids_recence, poids_commentaires)
+        if grouper:
+            positifs = scores > 0
+            lignes, ids, scores = self._agreger(lignes[positifs], ids[positifs], scores[positifs], agregation)
+        return lignes, ids, scores
+
+    def get_stats_cache(self):
+        """!
+        Accesseur pour les compteurs du cache de requêtes.
+
+        **Returns**
+        - Dictionnaire (entrées, capacité, succès, échecs, taux de succès, évictions, invalidations).
+        """
+        return self.cache.get_stats()
+
+    def _verifier_agregation(self, agregation):
+        """!
+        Vérifie l'agrégation demandée.
+
+        **Parameters**
+        - **agregation**: "max", "somme" ou None.
+
+        **Returns**
+        - Vrai si les scores des passages doivent être regroupés par document.
+        """
+        if agregation is not None and agregation not in self.AGREGATIONS:
+            raise ValueError(f"Agrégation inconnue : {agregation}")
+        return self.passages is not None and agregation is not None
+
+    def search_many(self, queries, n_results=10, taille_bloc=256, agregation="max", poids_proximite=0.0,
+                    filtres=None, poids_recence=0.0, poids_commentaires=0.0):
+        """!
+        Recherche par lot : évalue plusieurs requêtes avec un seul produit matriciel creux par bloc.
+
+        **Parameters**
+        - **queries**: Liste (ou itérable) de requêtes utilisateur.
+        - **n_results**: Nombre de documents à retourner par requête.
+        - **taille_bloc**: Nombre de requêtes traitées par produit matriciel (borne la mémoire).
+        - **agregation**, **poids_proximite**, **filtres**, **poids_recence**, **poids_commentaires**:
+          Voir `search`.
+
+        **Returns**
+        - Une liste de couples (ids, scores) de tableaux NumPy, un par requête, dans l'ordre des requêtes.
+
+        **Notes**
+        - Les ids sont les identifiants des documents dans le Corpus, triés par score décroissant.
+        - Les résultats sont identiques à ceux de `search` pour chaque requête.
+        - S'il y a des segments (documents ajoutés depuis l'indexation), chaque requête est évaluée sur
+          l'index principal et les segments, comme avec `search` : le lot ne provoque pas de consolidation.
+        """
+        grouper = self._verifier_agregation(agregation)
+        self._synchroniser()
+        requetes = [RequetePositionnelle(query, self.tokenizer) for query in queries]
+        filtres = FiltresMetadonnees(filtres)
+        if self.segments:
+            resultats = []
+            for requete in requetes:
+                query_vec = self._vecteur_requete(requete.mots)
+                if query_vec.nnz == 0:
+                    resultats.append((self.ids_docs[:0], np.empty(0)))
+                    continue
+                _, ids, scores = self._scores_vectoriels(requete, query_vec, agregation, grouper, poids_proximite,
+                                                         filtres, poids_recence, poids_commentaires)
+                positifs = scores > 0
+                ids, scores = ids[positifs], scores[positifs]
+                meilleurs = self._top_k(scores, n_results)
+                resultats.append((ids[meilleurs], scores[meilleurs]))
+            return resultats
+
+        # Masque des lignes calculé une fois pour tout le lot
+        retenues = self._masque_lignes(filtres, self.ids_docs) if filtres else None
+        facteurs = None
+        if poids_recence or poids_commentaires:
+            facteurs = self._facteurs_statiques(self.ids_docs, poids_recence, poids_commentaires)
+        rows = []
+        cols = []
+        data = []
+
+        # Une seule matrice creuse (requêtes x vocabulaire) pour tout le lot
+        for index_query, requete in enumerate(requetes):
+            query_vec = self._vecteur_requete(requete.mots)
+            rows.extend([index_query] * query_vec.nnz)
+            cols.extend(query_vec.indices)
+            data.extend(query_vec.data)
+
+        mat_queries = csr_matrix((data, (rows, cols)), shape=(len(requetes), len(self.vocab)))
+        normes_queries = self._normes_requetes(mat_queries)
+
+        resultats = []
+        for debut in range(0, len(requetes), taille_bloc):
+            bloc = mat_queries[debut:debut + taille_bloc]
+
+            # Documents x requêtes, puis transposition : une ligne creuse par requête
+            produit = self.mat_TF_IDF.dot(bloc.T).T.tocsr()
+            produit.sort_indices()
+
+            for i in range(produit.shape[0]):
+                debut_ligne, fin_ligne = produit.indptr[i], produit.indptr[i + 1]
+                indices_docs = produit.indices[debut_ligne:fin_ligne]
+                dots = produit.data[debut_ligne:fin_ligne]
+
+                # Seuls les documents partageant un terme avec la requête ont un score non nul
+                scores = dots / (self.normes_docs[indices_docs] * normes_queries[debut + i])
+                scores = self._scores_positionnels(requetes[debut + i], indices_docs, scores, poids_proximite)
+                if facteurs is not None:
+                    scores = scores * facteurs[indices_docs]
+                positifs = scores > 0
+                if retenues is not None:
+                    positifs &= retenues[indices_docs]
+                indices_docs = indices_docs[positifs]
+                scores = scores[positifs]
+                if grouper:
+                    indices_docs, _, scores = self._agreger(indices_docs, self.ids_docs[indices_docs], scores,
+                                                            agregation)
+
+                meilleurs = self._top_k(scores, n_results)
+                resultats.append((self.ids_docs[indices_docs[meilleurs]], scores[meilleurs]))
+
+        return resultats
+
+    def _get_incidence_auteurs(self):
+        """!
+        Matrice creuse d'incidence auteurs x documents du corpus (auteurs principaux et co-auteurs).
+
+        **Returns**
+        - Un couple (IndexAuteurs du corpus, matrice CSR : une ligne par code d'auteur, une colonne par
+          document dans l'ordre du corpus, 1 si l'auteur a écrit ou co-écrit le document).
+
+        **Notes**
+        - Construite à partir des listes de documents de l'IndexAuteurs, sans relire les documents,
+          puis reconstruite seulement si des documents ont été ajoutés au corpus.
+        """
+        index = self.corpus.get_index_auteurs()
+        if self._incidence_auteurs is None or self._incidence_documents != len(index):
+            metadonnees = self.corpus.get_metadonnees()
+            longueurs = np.fromiter(map(len, index.documents), dtype=np.int64, count=len(index.documents))
+            ids = np.concatenate([np.array(documents, dtype=np.int64) for documents in index.documents]
+                                 or [np.empty(0, dtype=np.int64)])
+            # Documents de chaque auteur par ordre d'ajout : colonnes déjà triées dans chaque ligne
+            self._incidence_auteurs = csr_matrix(
+                (np.ones(len(ids)), metadonnees.positions(ids), np.concatenate([[0], np.cumsum(longueurs)])),
+                shape=(len(index.noms), len(metadonnees)))
+            self._incidence_documents = len(index)
+        return index, self._incidence_auteurs
+
+    def search_auteurs(self, query, n_results=10, n_documents=3, agregation="somme", dataframe=True,
+                       poids_proximite=0.0, filtres=None):
+        """!
+        Recherche d'experts : auteurs classés selon la pertinence de leurs documents pour une requête.
+
+        **Parameters**
+        - **query**: La requête utilisateur.
+        - **n_results**: Nombre d'auteurs à retourner.
+        - **n_documents**: Nombre de documents retournés pour chaque auteur (ses plus pertinents).
+        - **agregation**: "somme" (somme des scores des documents de l'auteur) ou "moyenne"
+          (somme divisée par le nombre total de documents de l'auteur).
+        - **dataframe**: Si faux, retourne une liste de quadruplets (nom, score, ids, scores des documents).
+        - **poids_proximite**, **filtres**: Voir `search`.
+
+        **Returns**
+        - Un DataFrame (Auteur, Score, Documents, Ids, Titres) trié par score décroissant : Documents est
+          le nombre de documents pertinents de l'auteur, Ids et Titres ceux de ses meilleurs documents.
+
+        **Notes**
+        - Les scores des documents sont ceux de la méthode "vectorielle" (un score par document,
+          celui de son meilleur passage pour un index de passages).
+        - Les co-auteurs des ArxivDocument sont crédités comme l'auteur principal (voir IndexAuteurs).
+        - Un seul produit matrice creuse (auteurs x documents) - vecteur des scores des documents par requête.
+        """
+        if agregation not in self.AGREGATIONS_AUTEURS:
+            raise ValueError(f"Agrégation inconnue : {agregation}")
+        requete = RequetePositionnelle(query, self.tokenizer)
+        filtres = FiltresMetadonnees(filtres)
+        self._synchroniser()
+        index, incidence = self._get_incidence_auteurs()
+        metadonnees = self.corpus.get_metadonnees()
+
+        scores_docs = np.zeros(incidence.shape[1])
+        query_vec = self._vecteur_requete(requete.mots)
+        if query_vec.nnz:
+            # Un score par document : meilleur passage pour un index de passages
+            _, ids, scores = self._scores_vectoriels(requete, query_vec, "max", self.passages is not None,
+                                                     poids_proximite, filtres)
+            positifs = scores > 0
+            scores_docs[metadonnees.positions(ids[positifs])] = scores[positifs]
+
+        scores_auteurs = incidence.dot(scores_docs)
+        if agregation == "moyenne":
+            scores_auteurs = scores_auteurs / np.maximum(np.diff(incidence.indptr), 1)
+        meilleurs = self._top_k(scores_auteurs, n_results)
+        meilleurs = meilleurs[scores_auteurs[meilleurs] > 0]
+
+        resultats = []
+        for code in meilleurs.tolist():
+            positions = incidence.indices[incidence.indptr[code]:incidence.indptr[code + 1]]
+            scores = scores_docs[positions]
+            retenus = self._top_k(scores, min(n_documents, int(np.count_nonzero(scores))))
+            resultats.append((index.noms[code], float(scores_auteurs[code]),
+                              metadonnees.ids[positions[retenus]], scores[retenus], int(np.count_nonzero(scores))))
+        if not dataframe:
+            return [resultat[:4] for resultat in resultats]
+
+        documents = self.corpus.get_documents()
+        return pd.DataFrame([{
+            "Auteur": nom,
+            "Score": round(score, 4),
+            "Documents": n_pertinents,
+            "Ids": ids.tolist(),
+            "Titres": [documents[doc_id].get_titre() for doc_id in ids.tolist()]
+        } for nom, score, ids, _, n_pertinents in resultats], columns=["Auteur", "Score", "Documents", "Ids", "Titres"])
+
+    def _search_boucle(self, query, n_results=10):
+        """!
+        Ancienne recherche : boucle sur chaque document (version de référence).
+
         **Parameters**
         - **query**: La requête utilisateur.
         - **n_results**: Nombre de documents à retourner.
 
         **Returns**
-        - Un DataFrame avec les résultats triés par score décroissant.
+        - Un objet Resultats trié par score décroissant.
 
         **Notes**
-        - Retourne un DataFrame vide si aucun terme de la requête n'est dans le vocabulaire.
+        - Calcule toujours une similarité cosinus : n'a de sens qu'avec le modèle TF-IDF.
         """
-        query_clean = self.corpus.nettoyer_texte(query)
-        mots_query = [m for m in query_clean.split(' ') if m]
+        if not self.modele.normaliser:
+            raise ValueError("La méthode 'boucle' n'est disponible qu'avec le modèle TF-IDF.")
+
+        mots_query = self.tokenizer.tokeniser(query)
         
         query_vec = np.zeros(len(self.vocab))
         
@@ -144,13 +1573,12 @@ class SearchEngine:
                 query_vec[idx] += 1 
         
         scores = []
-        docs = list(self.corpus.get_documents().values())
         
         # Norme du vecteur requête ||B||
         norm_query = np.linalg.norm(query_vec)
         
         if norm_query == 0:
-            return pd.DataFrame()
+            return self._build_resultats([], [])
 
         # Boucle sur chaque document
         for i in tqdm(range(self.N_docs), desc="Recherche", leave=False):
@@ -169,28 +1597,7 @@ class SearchEngine:
             
             scores.append(sim)
             
-        indices_tries = np.argsort(scores)[::-1]
-        
-        resultats = []
-        for i in indices_tries[:n_results]:
-            if scores[i] > 0:
-                doc_obj = docs[i]
-                nb_comments = getattr(doc_obj, 'nb_comments', 0)
-                co = getattr(doc_obj, 'co_auteurs', [])
-                if isinstance(co, (list, tuple)):
-                    co_str = ', '.join(str(c) for c in co)
-                else:
-                    co_str = str(co)
-
-                resultats.append({
-                    "Document": doc_obj.get_titre(),
-                    "Score": round(scores[i], 4),
-                    "Auteur": doc_obj.get_auteur(),
-                    "Date": doc_obj.get_date(),
-                    "URL": doc_obj.get_url(),
-                    "Type": doc_obj.getType(),
-                    "Nb_comments": nb_comments,
-                    "Co_auteurs": co_str
-                })
-                
-        return pd.DataFrame(resultats)
\ No newline at end of file
+        # Même départage des ex-aequo (indice croissant) que la méthode vectorielle
+        scores = np.array(scores)
+        indices_tries = self._top_k(scores, n_results)
+        return self._build_resultats(self.ids_docs[indices_tries], scores[indices_tries], indices_tries)
@@ -0,0 +1,171 @@
+"""!
+# SearchResults.py
+
+Résultats d'une recherche sous forme de tableaux NumPy, sans construction de DataFrame.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class Resultats:
+    """!
+    # Resultats
+
+    Résultats d'une requête : identifiants des documents et scores, triés par score décroissant.
+
+    Les métadonnées (titre, auteur, date...) ne sont lues dans le corpus qu'à la demande ;
+    `to_dataframe()` produit le même DataFrame que `SearchEngine.search`.
+    """
+
+    def __init__(self, documents, ids, scores, extraits=None):
+        """!
+        Constructeur.
+
+        **Parameters**
+        - **documents**: Dictionnaire {id: Document} du corpus.
+        - **ids**: Identifiants des documents, triés par score décroissant.
+        - **scores**: Scores des documents, dans le même ordre.
+        - **extraits**: Pour un index au niveau des passages, couple (débuts, fins) des positions
+          du passage retenu de chaque document dans son texte, ou None.
+
+        **Notes**
+        - Seuls les documents de score strictement positif sont conservés.
+        - Les tableaux sont en lecture seule : un même objet peut être partagé (cache de requêtes).
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        positifs = scores > 0
+        self._documents = documents
+        self.ids = np.asarray(ids, dtype=np.int64)[positifs]
+        self.scores = scores[positifs]
+        self.extraits = None
+        if extraits is not None:
+            self.extraits = tuple(np.asarray(tableau, dtype=np.int64)[positifs] for tableau in extraits)
+        for tableau in (self.ids, self.scores) + (self.extraits or ()):
+            tableau.setflags(write=False)
+        self._dataframe = None
+
+    def __len__(self):
+        """!
+        Nombre de documents retournés.
+
+        **Returns**
+        - Le nombre de résultats.
+        """
+        return len(self.ids)
+
+    def __iter__(self):
+        """!
+        Parcours des résultats.
+
+        **Returns**
+        - Un itérateur de couples (id du document, score).
+        """
+        return zip(self.ids.tolist(), self.scores.tolist())
+
+    def __getitem__(self, position):
+        """!
+        Résultat à une position donnée.
+
+        **Parameters**
+        - **position**: Rang du résultat (0 pour le meilleur).
+
+        **Returns**
+        - Un couple (id du document, score).
+        """
+        return int(self.ids[position]), float(self.scores[position])
+
+    @property
+    def empty(self):
+        """!
+        Indique si la recherche n'a retourné aucun document (comme `DataFrame.empty`).
+
+        **Returns**
+        - Vrai s'il n'y a aucun résultat.
+        """
+        return len(self.ids) == 0
+
+    def get_document(self, position):
+        """!
+        Document d'un résultat, lu dans le corpus à la demande.
+
+        **Parameters**
+        - **position**: Rang du résultat.
+
+        **Returns**
+        - L'objet Document.
+        """
+        return self._documents[int(self.ids[position])]
+
+    def get_passage(self, position):
+        """!
+        Texte du passage retenu pour un résultat (index au niveau des passages).
+
+        **Parameters**
+        - **position**: Rang du résultat.
+
+        **Returns**
+        - Le texte du passage, ou None si l'index n'est pas au niveau des passages.
+        """
+        if self.extraits is None:
+            return None
+        debuts, fins = self.extraits
+        return self.get_document(position).get_texte()[debuts[position]:fins[position]]
+
+    def get_metadonnees(self, position):
+        """!
+        Ligne de résultat complète (métadonnées du document), au format de `to_dataframe`.
+
+        **Parameters**
+        - **position**: Rang du résultat.
+
+        **Returns**
+        - Dictionnaire {colonne: valeur}.
+        """
+        doc_obj = self.get_document(position)
+        co = getattr(doc_obj, 'co_auteurs', [])
+        if isinstance(co, (list, tuple)):
+            co_str = ', '.join(str(c) for c in co)
+        else:
+            co_str = str(co)
+
+        ligne = {
+            "Document": doc_obj.get_titre(),
+            "Score": round(float(self.scores[position]), 4),
+            "Auteur": doc_obj.get_auteur(),
+            "Date": doc_obj.get_date(),
+            "URL": doc_obj.get_url(),
+            "Type": doc_obj.getType(),
+            "Nb_comments": getattr(doc_obj, 'nb_comments', 0),
+            "Co_auteurs": co_str
+        }
+        if self.extraits is not None:
+            ligne["Passage"] = self.get_passage(position)
+        return ligne
+
+    def to_dataframe(self):
+        """!
+        Conversion en DataFrame (format historique de `SearchEngine.search`).
+
+        **Returns**
+        - Un DataFrame avec une ligne par document.
+
+        **Notes**
+        - Le DataFrame est construit une seule fois ; chaque appel en retourne une copie.
+        """
+        if self._dataframe is None:
+            self._dataframe = pd.DataFrame([self.get_metadonnees(i) for i in range(len(self))])
+        return self._dataframe.copy()
+
+    def __repr__(self):
+        """!
+        Représentation textuelle des résultats.
+
+        **Returns**
+        - Résumé (nombre de résultats et meilleur score).
+        """
+        meilleur = f", meilleur score={self.scores[0]:.4f}" if len(self) else ""
+        return f"<Resultats({len(self)} documents{meilleur})>"
@@ -0,0 +1,196 @@
+"""!
+# Segment.py
+
+Segment d'index incrémental : petit bloc de documents avec son propre vocabulaire local.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+
+
+class Segment:
+    """!
+    # Segment
+
+    Bloc de documents indexés en une fois, en ajout seul (append-only).
+
+    Un segment stocke les occurrences brutes (TF) de ses documents : les poids
+    (IDF, normalisation) sont appliqués à la requête à partir des compteurs globaux
+    du moteur, ce qui rend les scores identiques à ceux d'une reconstruction complète.
+    """
+
+    def __init__(self, lignes, ids_docs, mat_TF, termes, longueurs=None, composantes=None, df=None):
+        """!
+        Constructeur d'un segment.
+
+        **Parameters**
+        - **lignes**: Numéros de ligne (globaux, croissants) des documents du segment dans le moteur.
+        - **ids_docs**: Identifiants des documents dans le Corpus.
+        - **mat_TF**: Matrice creuse Documents x Termes locaux des occurrences (non copiée si elle est CSC et triée).
+        - **termes**: Identifiants globaux (vocabulaire du moteur), triés, des termes locaux.
+        - **longueurs**: Longueurs des documents, si elles sont déjà connues.
+        - **composantes**: Composantes des normes déjà calculées (voir `ModeleScoring.composantes_normes`), ou None.
+        - **df**: Fréquences documentaires des termes locaux avec lesquelles `composantes` ont été calculées.
+        """
+        self.lignes = np.asarray(lignes)
+        self.ids_docs = np.asarray(ids_docs)
+        self.termes = np.asarray(termes)
+        self.mat_TF = mat_TF.tocsc()
+        self.mat_TF.sort_indices()
+        self.longueurs = np.asarray(mat_TF.sum(axis=1)).ravel() if longueurs is None else longueurs
+        self._composantes = composantes
+        self._df_composantes = df
+        self._normes = None
+        self._version_normes = None
+
+    @classmethod
+    def depuis_tokens(cls, lignes, ids_docs, offsets, tokens):
+        """!
+        Construction d'un segment à partir de tokens déjà convertis en identifiants globaux.
+
+        **Parameters**
+        - **lignes**: Numéros de ligne globaux des documents.
+        - **ids_docs**: Identifiants des documents dans le Corpus.
+        - **offsets**: Positions de début de chaque document dans `tokens` (plus la fin), à partir de 0.
+        - **tokens**: Tableau NumPy des identifiants globaux des tokens.
+
+        **Returns**
+        - Le Segment construit.
+        """
+        # Vocabulaire local : termes globaux présents dans le segment
+        termes, cols = np.unique(tokens, return_inverse=True)
+        rows = np.repeat(np.arange(len(lignes)), np.diff(offsets))
+        data = np.ones(len(cols), dtype=np.int64)
+
+        mat_TF = csr_matrix((data, (rows, cols)), shape=(len(lignes), len(termes)))
+        mat_TF.sum_duplicates()
+        return cls(lignes, ids_docs, mat_TF, termes)
+
+    @classmethod
+    def fusionner(cls, segments):
+        """!
+        Fusion de plusieurs segments en un seul.
+
+        **Parameters**
+        - **segments**: Liste de segments.
+
+        **Returns**
+        - Le Segment fusionné, documents triés par numéro de ligne.
+        """
+        termes = np.unique(np.concatenate([seg.termes for seg in segments]))
+
+        blocs = []
+        for seg in segments:
+            # Réindexation des colonnes locales dans le vocabulaire fusionné
+            mat = seg.mat_TF.tocsr()
+            cols = np.searchsorted(termes, seg.termes)[mat.indices]
+            blocs.append(csr_matrix((mat.data, cols, mat.indptr), shape=(mat.shape[0], len(termes))))
+
+        lignes = np.concatenate([seg.lignes for seg in segments])
+        ids_docs = np.concatenate([seg.ids_docs for seg in segments])
+        ordre = np.argsort(lignes, kind='stable')
+
+        mat_TF = vstack(blocs).tocsr()[ordre]
+        return cls(lignes[ordre], ids_docs[ordre], mat_TF, termes)
+
+    def __len__(self):
+        """!
+        Nombre de documents du segment.
+
+        **Returns**
+        - Le nombre de documents.
+        """
+        return len(self.lignes)
+
+    def produits(self, ids_termes, poids_requete, modele, idf, longueur_moyenne):
+        """!
+        Produits scalaires entre une requête et les documents du segment qui la contiennent.
+
+        **Parameters**
+        - **ids_termes**: Identifiants globaux des termes de la requête.
+        - **poids_requete**: Poids des termes dans la requête.
+        - **modele**: Modèle de pondération.
+        - **idf**: Tableau NumPy des IDF globaux.
+        - **longueur_moyenne**: Longueur moyenne globale d'un document.
+
+        **Returns**
+        - Un couple (positions locales des documents, produits scalaires).
+        """
+        positions = np.searchsorted(self.termes, ids_termes)
+        presents = positions < len(self.termes)
+        presents[presents] = self.termes[positions[presents]] == ids_termes[presents]
+        if not presents.any():
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        # Seules les colonnes des termes de la requête sont lues
+        sous_matrice = self.mat_TF[:, positions[presents]]
+        colonnes = np.repeat(np.arange(sous_matrice.shape[1]), np.diff(sous_matrice.indptr))
+        docs = sous_matrice.indices
+
+        poids = modele.poids(sous_matrice.data, self.longueurs[docs],
+                             idf[ids_termes[presents]][colonnes], longueur_moyenne)
+        contributions = poids_requete[presents][colonnes] * poids
+
+        docs_uniques, inverse = np.unique(docs, return_inverse=True)
+        return docs_uniques, np.bincount(inverse, weights=contributions)
+
+    def _couples(self, colonnes=None):
+        """!
+        Couples (document, terme) du segment, colonne par colonne.
+
+        **Parameters**
+        - **colonnes**: Positions locales des termes à lire (None : tous).
+
+        **Returns**
+        - Un triplet (occurrences, positions locales des documents, positions locales des termes).
+        """
+        mat = self.mat_TF if colonnes is None else self.mat_TF[:, colonnes]
+        termes = np.arange(mat.shape[1]) if colonnes is None else colonnes
+        return mat.data, mat.indices, np.repeat(termes, np.diff(mat.indptr))
+
+    def normes(self, modele, df, N, idf, longueur_moyenne, version):
+        """!
+        Normes des documents du segment pour les statistiques globales courantes.
+
+        **Parameters**
+        - **modele**: Modèle de pondération.
+        - **df**: Tableau NumPy des fréquences documentaires globales.
+        - **N**: Nombre de documents de l'index.
+        - **idf**: Tableau NumPy des IDF globaux.
+        - **longueur_moyenne**: Longueur moyenne globale d'un document.
+        - **version**: Version des statistiques globales (les normes sont mises en cache par version).
+
+        **Returns**
+        - Tableau NumPy des normes, une par document du segment.
+
+        **Notes**
+        - Si le modèle décompose ses normes (voir `ModeleScoring.composantes_normes`), seules les colonnes des
+          termes dont la fréquence documentaire a changé sont relues ; sinon toutes les normes sont recalculées.
+        """
+        if self._version_normes == version:
+            return self._normes
+
+        df_termes = df[self.termes]
+        if self._composantes is None:
+            tf, docs, colonnes = self._couples()
+            self._composantes = modele.composantes_normes(tf, docs, df_termes[colonnes], len(self))
+        else:
+            changes = np.flatnonzero(df_termes != self._df_composantes)
+            if len(changes):
+                tf, docs, colonnes = self._couples(changes)
+                self._composantes = (self._composantes
+                                     + modele.composantes_normes(tf, docs, df_termes[colonnes], len(self))
+                                     - modele.composantes_normes(tf, docs, self._df_composantes[colonnes], len(self)))
+
+        if self._composantes is not None:
+            self._df_composantes = df_termes
+            self._normes = modele.normes_composantes(self._composantes, N)
+        else:
+            tf, docs, colonnes = self._couples()
+            poids = modele.poids(tf, self.longueurs[docs], idf[self.termes][colonnes], longueur_moyenne)
+            self._normes = np.sqrt(np.bincount(docs, weights=poids ** 2, minlength=len(self)))
+        self._version_normes = version
+        return self._normes
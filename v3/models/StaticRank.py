@@ -0,0 +1,113 @@
+"""!
+# StaticRank.py
+
+Rang statique des documents : signaux indépendants de la requête (fraîcheur, nombre de commentaires Reddit).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+
+
+class RangStatique:
+    """!
+    # RangStatique
+
+    Caractéristiques de rang statique de chaque document du corpus, calculées une fois à partir des
+    colonnes de métadonnées (voir Metadonnees) :
+
+    - fraîcheur : `0.5 ** (âge / demi_vie)`, où l'âge est mesuré depuis le document le plus récent
+      du corpus (1 pour le plus récent, 0 pour une date inconnue),
+    - engagement : `log1p(nb_comments) / log1p(max nb_comments)` (0 hors Reddit).
+
+    Les deux valeurs sont entre 0 et 1. Le moteur multiplie le score textuel d'une ligne par
+    `1 + poids_recence * fraîcheur + poids_commentaires * engagement` : un document sans rapport
+    avec la requête reste à 0, et les poids se changent à chaque requête sans réindexer.
+    """
+
+    ## Secondes par jour.
+    JOUR = 86400.0
+
+    def __init__(self, demi_vie=365.0):
+        """!
+        Constructeur.
+
+        **Parameters**
+        - **demi_vie**: Âge (en jours) auquel la fraîcheur d'un document vaut 0,5.
+        """
+        self._n_documents = 0
+        self._ages = None
+        self.recence = np.empty(0)
+        self.engagement = np.empty(0)
+        self.demi_vie = None
+        self.set_demi_vie(demi_vie)
+
+    def set_demi_vie(self, demi_vie):
+        """!
+        Mutateur pour la demi-vie de la fraîcheur.
+
+        **Parameters**
+        - **demi_vie**: Âge (en jours, strictement positif) auquel la fraîcheur vaut 0,5.
+
+        **Notes**
+        - Seule la fraîcheur est recalculée (une opération vectorisée), à partir des âges déjà calculés.
+        """
+        if not demi_vie > 0:
+            raise ValueError(f"Demi-vie invalide : {demi_vie} (attendu un nombre de jours strictement positif).")
+        self.demi_vie = float(demi_vie)
+        if self._ages is not None:
+            self._calculer_recence()
+
+    def _calculer_recence(self):
+        """!
+        Fraîcheur des documents à partir de leurs âges et de la demi-vie.
+        """
+        # Date inconnue : âge NaN, fraîcheur 0
+        self.recence = np.nan_to_num(np.exp2(-self._ages / (self.demi_vie * self.JOUR)), nan=0.0)
+
+    def actualiser(self, metadonnees):
+        """!
+        Calcule les caractéristiques si des documents ont été ajoutés au corpus.
+
+        **Parameters**
+        - **metadonnees**: Objet Metadonnees du corpus.
+
+        **Returns**
+        - L'objet lui-même.
+
+        **Notes**
+        - Les deux normalisations dépendent de tout le corpus (date la plus récente, nombre maximal de
+          commentaires) : les caractéristiques sont recalculées, en quelques opérations vectorisées.
+        """
+        if len(metadonnees) == self._n_documents:
+            return self
+        dates = metadonnees.dates
+        connues = dates[~np.isnan(dates)]
+        self._ages = (connues.max() if len(connues) else 0.0) - dates
+        self._calculer_recence()
+
+        commentaires = np.log1p(np.maximum(metadonnees.nb_comments, 0))
+        maximum = commentaires.max() if len(commentaires) else 0.0
+        self.engagement = commentaires / maximum if maximum > 0 else np.zeros(len(commentaires))
+        self._n_documents = len(metadonnees)
+        return self
+
+    def facteurs(self, positions, poids_recence, poids_commentaires):
+        """!
+        Facteurs multiplicatifs des scores.
+
+        **Parameters**
+        - **positions**: Positions des documents dans les métadonnées (voir `Metadonnees.positions`).
+        - **poids_recence**: Poids de la fraîcheur.
+        - **poids_commentaires**: Poids de l'engagement.
+
+        **Returns**
+        - Tableau NumPy `1 + poids_recence * fraîcheur + poids_commentaires * engagement`, aligné sur `positions`.
+        """
+        facteurs = np.ones(len(positions))
+        if poids_recence:
+            facteurs += poids_recence * self.recence[positions]
+        if poids_commentaires:
+            facteurs += poids_commentaires * self.engagement[positions]
+        return facteurs
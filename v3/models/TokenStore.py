@@ -0,0 +1,220 @@
+"""!
+# TokenStore.py
+
+Stockage compact des documents tokenisés (identifiants de termes).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+
+
+class TokenStore:
+    """!
+    # TokenStore
+
+    Représentation tokenisée du corpus, construite une seule fois.
+
+    - un dictionnaire global des termes (mot -> identifiant),
+    - un tableau plat `uint32` des identifiants de tous les tokens, document après document,
+    - un tableau des positions de début de chaque document dans ce tableau (offsets).
+    """
+
+    def __init__(self):
+        """!
+        Constructeur d'un stockage vide.
+        """
+        self.termes = {}
+        self.liste_termes = []
+        self.ids_docs = []
+        self._tokens = np.empty(1024, dtype=np.uint32)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self.n_tokens = 0
+
+    @classmethod
+    def depuis_tableaux(cls, ids_docs, termes, tokens, offsets):
+        """!
+        Reconstruction d'un stockage à partir de tableaux déjà calculés (index enregistré).
+
+        **Parameters**
+        - **ids_docs**: Identifiants des documents dans le Corpus.
+        - **termes**: Liste des termes, dans l'ordre de leurs identifiants.
+        - **tokens**: Tableau NumPy des identifiants des tokens, document après document.
+        - **offsets**: Positions de début de chaque document dans `tokens` (plus la fin), à partir de 0.
+
+        **Returns**
+        - Le TokenStore, qui utilise directement `tokens` et `offsets` (sans copie).
+
+        **Notes**
+        - Un ajout ultérieur recopie les tableaux (ils sont pleins) : des tableaux projetés en mémoire
+          ne sont jamais modifiés.
+        """
+        store = cls()
+        store.liste_termes = list(termes)
+        store.termes = {mot: id_terme for id_terme, mot in enumerate(store.liste_termes)}
+        store.ids_docs = list(ids_docs)
+        store._tokens = tokens
+        store._offsets = offsets
+        store.n_tokens = len(tokens)
+        return store
+
+    def __len__(self):
+        """!
+        Nombre de documents stockés.
+
+        **Returns**
+        - Le nombre de documents.
+        """
+        return len(self.ids_docs)
+
+    @property
+    def tokens(self):
+        """!
+        Tableau plat des identifiants de termes de tous les documents.
+
+        **Returns**
+        - Tableau NumPy `uint32` (vue, sans copie).
+        """
+        return self._tokens[:self.n_tokens]
+
+    @property
+    def offsets(self):
+        """!
+        Positions de début de chaque document dans `tokens` (plus la position de fin).
+
+        **Returns**
+        - Tableau NumPy de taille nombre de documents + 1.
+        """
+        return self._offsets[:len(self.ids_docs) + 1]
+
+    def get_id_terme(self, mot):
+        """!
+        Identifiant d'un terme, créé s'il est nouveau.
+
+        **Parameters**
+        - **mot**: Le terme.
+
+        **Returns**
+        - L'identifiant du terme.
+        """
+        id_terme = self.termes.get(mot)
+        if id_terme is None:
+            id_terme = len(self.liste_termes)
+            self.termes[mot] = id_terme
+            self.liste_termes.append(mot)
+        return id_terme
+
+    def ajouter(self, id_doc, mots):
+        """!
+        Ajoute un document tokenisé à la fin du stockage.
+
+        **Parameters**
+        - **id_doc**: Identifiant du document dans le Corpus.
+        - **mots**: Liste des tokens du document.
+        """
+        ids = [self.get_id_terme(mot) for mot in mots if mot]
+        fin = self.n_tokens + len(ids)
+        self._reserver(fin, len(self.ids_docs) + 1)
+
+        self._tokens[self.n_tokens:fin] = ids
+        self.n_tokens = fin
+        self.ids_docs.append(id_doc)
+        self._offsets[len(self.ids_docs)] = fin
+
+    def _reserver(self, n_tokens, n_docs):
+        """!
+        Agrandit les tableaux internes pour contenir au moins `n_tokens` tokens et `n_docs` documents.
+
+        **Parameters**
+        - **n_tokens**: Nombre total de tokens à stocker.
+        - **n_docs**: Nombre total de documents à stocker.
+
+        **Notes**
+        - Agrandissement géométrique : ajout en temps amorti constant.
+        """
+        if n_tokens > len(self._tokens):
+            nouveau = np.empty(max(n_tokens, 2 * len(self._tokens)), dtype=np.uint32)
+            nouveau[:self.n_tokens] = self._tokens[:self.n_tokens]
+            self._tokens = nouveau
+        if n_docs + 1 > len(self._offsets):
+            nouveau = np.zeros(max(n_docs + 1, 2 * len(self._offsets)), dtype=np.int64)
+            nouveau[:len(self.ids_docs) + 1] = self._offsets[:len(self.ids_docs) + 1]
+            self._offsets = nouveau
+
+    def ajouter_lot(self, ids_docs, listes_mots):
+        """!
+        Ajoute plusieurs documents tokenisés.
+
+        **Parameters**
+        - **ids_docs**: Identifiants des documents dans le Corpus.
+        - **listes_mots**: Listes de tokens, dans le même ordre que les identifiants.
+        """
+        for id_doc, mots in zip(ids_docs, listes_mots):
+            self.ajouter(id_doc, mots)
+
+    def ajouter_bloc(self, ids_docs, termes, tokens, offsets):
+        """!
+        Ajoute un bloc de documents déjà convertis en identifiants de termes locaux au bloc.
+
+        **Parameters**
+        - **ids_docs**: Identifiants des documents dans le Corpus.
+        - **termes**: Termes locaux du bloc, dans l'ordre de leur première occurrence.
+        - **tokens**: Tableau NumPy des identifiants locaux des tokens, document après document.
+        - **offsets**: Positions de début de chaque document dans `tokens` (plus la fin), à partir de 0.
+
+        **Returns**
+        - Tableau NumPy de correspondance identifiant local -> identifiant global.
+
+        **Notes**
+        - Les termes étant donnés par ordre de première occurrence, les identifiants globaux sont
+          ceux qu'aurait attribués un ajout document par document.
+        """
+        correspondance = np.array([self.get_id_terme(mot) for mot in termes], dtype=np.uint32)
+        debut = self.n_tokens
+        fin = debut + len(tokens)
+        n_docs = len(self.ids_docs)
+        self._reserver(fin, n_docs + len(ids_docs))
+
+        self._tokens[debut:fin] = correspondance[tokens]
+        self._offsets[n_docs + 1:n_docs + len(ids_docs) + 1] = debut + np.asarray(offsets[1:])
+        self.ids_docs.extend(ids_docs)
+        self.n_tokens = fin
+        return correspondance
+
+    def get_tokens(self, index_doc):
+        """!
+        Tokens d'un document.
+
+        **Parameters**
+        - **index_doc**: Position du document dans le stockage.
+
+        **Returns**
+        - Tableau NumPy des identifiants de termes du document.
+        """
+        return self._tokens[self._offsets[index_doc]:self._offsets[index_doc + 1]]
+
+    def lignes(self):
+        """!
+        Position du document de chaque token.
+
+        **Returns**
+        - Tableau NumPy de même taille que `tokens`.
+        """
+        return np.repeat(np.arange(len(self.ids_docs)), np.diff(self.offsets))
+
+    def frequences(self):
+        """!
+        Fréquences globales de chaque terme.
+
+        **Returns**
+        - Un couple (TF, DF) de tableaux NumPy indexés par identifiant de terme :
+          nombre total d'occurrences et nombre de documents contenant le terme.
+        """
+        n_termes = len(self.liste_termes)
+        tf = np.bincount(self.tokens, minlength=n_termes)
+
+        # Couples (document, terme) distincts
+        couples = np.unique(self.lignes().astype(np.int64) * n_termes + self.tokens)
+        df = np.bincount(couples % n_termes, minlength=n_termes) if n_termes > 0 else np.zeros(0, dtype=np.int64)
+        return tf, df
@@ -0,0 +1,169 @@
+"""!
+# Tokenizer.py
+
+Découpage des textes en tokens (remplace le nettoyage par chaînes successives).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import re
+import unicodedata
+
+
+class Tokenizer:
+    """!
+    # Tokenizer
+
+    Tokeniseur configurable qui retourne directement la liste des mots d'un texte.
+
+    Le texte est mis en minuscules (et éventuellement débarrassé de ses accents par une
+    table de traduction), puis un unique motif précompilé extrait les suites de lettres.
+    Mots vides et longueur minimale sont filtrés dans la même passe.
+    """
+
+    ## Motif des tokens : suites de lettres minuscules non accentuées.
+    MOTIF = re.compile(r'[a-z]+')
+
+    ## Lettres sans décomposition Unicode, traduites explicitement.
+    LIGATURES = {'æ': 'ae', 'œ': 'oe', 'ß': 'ss', 'ø': 'o', 'đ': 'd', 'ł': 'l', 'ð': 'd', 'þ': 'th'}
+
+    def __init__(self, stopwords=None, longueur_min=1, retirer_accents=False):
+        """!
+        Constructeur du Tokenizer.
+
+        **Parameters**
+        - **stopwords**: Ensemble de mots vides à ignorer (optionnel).
+        - **longueur_min**: Longueur minimale d'un token conservé.
+        - **retirer_accents**: Si vrai, "é" devient "e" au lieu de séparer le mot.
+        """
+        self.stopwords = frozenset(stopwords) if stopwords else frozenset()
+        self.longueur_min = longueur_min
+        self.retirer_accents = retirer_accents
+        self._table = self._build_table_accents() if retirer_accents else None
+
+    @classmethod
+    def _build_table_accents(cls):
+        """!
+        Construction de la table de traduction des lettres accentuées (Latin-1 et Latin étendu).
+
+        **Returns**
+        - Un dictionnaire utilisable par `str.translate`.
+
+        **Notes**
+        - Appliquée après `lower()` : seules les minuscules doivent être traduites.
+        """
+        table = {}
+        for code in range(0xC0, 0x250):
+            car = chr(code)
+            base = ''.join(c for c in unicodedata.normalize('NFKD', car) if not unicodedata.combining(c))
+            if base != car and base.isascii():
+                table[code] = base.lower()
+        for car, base in cls.LIGATURES.items():
+            table[ord(car)] = base
+        return table
+
+    def tokeniser(self, texte):
+        """!
+        Découpe un texte en tokens.
+
+        **Parameters**
+        - **texte**: Texte brut.
+
+        **Returns**
+        - Liste des tokens (minuscules, lettres uniquement).
+        """
+        texte = texte.lower()
+        if self._table is not None and not texte.isascii():
+            texte = texte.translate(self._table)
+
+        mots = self.MOTIF.findall(texte)
+        if not self.stopwords and self.longueur_min <= 1:
+            return mots
+        return [m for m in mots if len(m) >= self.longueur_min and m not in self.stopwords]
+
+    def _transformer(self, texte):
+        """!
+        Minuscules et traduction des accents, comme dans `tokeniser`.
+
+        **Parameters**
+        - **texte**: Texte brut.
+
+        **Returns**
+        - Le texte transformé.
+        """
+        texte = texte.lower()
+        if self._table is not None and not texte.isascii():
+            texte = texte.translate(self._table)
+        return texte
+
+    def tokeniser_positions(self, texte):
+        """!
+        Découpe un texte en tokens avec leurs positions dans le texte d'origine.
+
+        **Parameters**
+        - **texte**: Texte brut.
+
+        **Returns**
+        - Liste de triplets (token, début, fin), les mêmes tokens que `tokeniser` dans le même ordre.
+
+        **Notes**
+        - Minuscules et table des accents ne raccourcissent jamais un caractère : si la longueur du texte
+          est inchangée, les positions sont directement celles du texte d'origine. Sinon (ligatures,
+          "İ"...), une table de correspondance caractère par caractère est construite.
+        """
+        transforme = self._transformer(texte)
+        correspondance = None
+        if len(transforme) != len(texte):
+            correspondance = []
+            for position, car in enumerate(texte):
+                correspondance.extend([position] * len(self._transformer(car)))
+            correspondance.append(len(texte))
+
+        filtrer = bool(self.stopwords) or self.longueur_min > 1
+        resultats = []
+        for match in self.MOTIF.finditer(transforme):
+            mot = match.group()
+            if filtrer and (len(mot) < self.longueur_min or mot in self.stopwords):
+                continue
+            debut, fin = match.span()
+            if correspondance is not None:
+                # Fin : position suivant le dernier caractère d'origine couvert par le token
+                debut, fin = correspondance[debut], correspondance[fin - 1] + 1
+            resultats.append((mot, debut, fin))
+        return resultats
+
+    def tokeniser_lot(self, textes):
+        """!
+        Tokenisation d'une liste de textes.
+
+        **Parameters**
+        - **textes**: Itérable de textes bruts.
+
+        **Returns**
+        - Liste de listes de tokens, dans l'ordre des textes.
+        """
+        return [self.tokeniser(texte) for texte in textes]
+
+    def get_parametres(self):
+        """!
+        Accesseur pour la configuration du Tokenizer.
+
+        **Returns**
+        - Dictionnaire des arguments du constructeur.
+        """
+        return {
+            'stopwords': sorted(self.stopwords),
+            'longueur_min': self.longueur_min,
+            'retirer_accents': self.retirer_accents
+        }
+
+    def __repr__(self):
+        """!
+        Représentation textuelle du Tokenizer.
+
+        **Returns**
+        - Résumé de la configuration.
+        """
+        return (f"<Tokenizer(stopwords={len(self.stopwords)}, longueur_min={self.longueur_min}, "
+                f"retirer_accents={self.retirer_accents})>")
@@ -0,0 +1,370 @@
+"""!
+# TrigramIndex.py
+
+Index de trigrammes de caractères des textes, pour ne passer une expression régulière que sur les documents candidats.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+
+class IndexTrigrammes:
+    """!
+    # IndexTrigrammes
+
+    Index trigramme -> documents, construit sur les textes normalisés (minuscules).
+
+    Une expression régulière est analysée en une requête de trigrammes obligatoires (ET / OU) :
+    tout document contenant une correspondance contient ces trigrammes, donc seuls les documents
+    candidats sont parcourus par le moteur d'expressions régulières, sans perte de résultat.
+    Si aucun trigramme ne peut être extrait (".*", "\\w+", mot de moins de 3 lettres...),
+    tous les documents sont candidats.
+
+    Les trigrammes sont codés en un entier (3 x 21 bits) : l'index est un tableau trié de codes
+    et, pour chaque code, la liste croissante des lignes (documents) qui le contiennent.
+    """
+
+    ## Nombre maximal de chaînes exactes suivies pendant l'analyse (au-delà, on ne garde que leurs trigrammes).
+    LIMITE_EXACTES = 16
+    ## Caractères non ASCII reconnus par re.IGNORECASE comme des lettres ASCII, normalisés avant `lower()`.
+    TABLE = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's', 'K': 'k'})
+
+    def __init__(self, taille_lot=1000):
+        """!
+        Constructeur d'un index vide.
+
+        **Parameters**
+        - **taille_lot**: Nombre de documents traités ensemble lors de l'ajout (borne la mémoire temporaire).
+        """
+        self.taille_lot = taille_lot
+        self.ids_docs = np.empty(0, dtype=np.int64)
+        self._lots = []
+        self._codes = np.empty(0, dtype=np.int64)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._lignes = np.empty(0, dtype=np.int32)
+
+    def __len__(self):
+        """!
+        Nombre de documents indexés.
+
+        **Returns**
+        - Le nombre de documents.
+        """
+        return len(self.ids_docs)
+
+    @staticmethod
+    def _code(trigramme):
+        """!
+        Code entier d'un trigramme.
+
+        **Parameters**
+        - **trigramme**: Chaîne de 3 caractères.
+
+        **Returns**
+        - L'entier `c0 << 42 | c1 << 21 | c2`.
+        """
+        return (ord(trigramme[0]) << 42) | (ord(trigramme[1]) << 21) | ord(trigramme[2])
+
+    def ajouter(self, ids_docs, textes):
+        """!
+        Ajoute des documents à l'index.
+
+        **Parameters**
+        - **ids_docs**: Identifiants des documents, dans l'ordre des textes.
+        - **textes**: Itérable des textes correspondants.
+
+        **Returns**
+        - Le nombre de documents ajoutés.
+        """
+        ids_docs = list(ids_docs)
+        textes = iter(textes)
+        debut = len(self.ids_docs)
+        for position in range(0, len(ids_docs), self.taille_lot):
+            lot = [next(textes) for _ in ids_docs[position:position + self.taille_lot]]
+            self._ajouter_lot(lot, debut + position)
+
+        self.ids_docs = np.concatenate([self.ids_docs, np.array(ids_docs, dtype=np.int64)])
+        return len(ids_docs)
+
+    def _ajouter_lot(self, textes, premiere_ligne):
+        """!
+        Trigrammes distincts de chaque texte d'un lot.
+
+        **Parameters**
+        - **textes**: Liste des textes du lot.
+        - **premiere_ligne**: Ligne du premier texte dans l'index.
+
+        **Notes**
+        - Les textes normalisés sont concaténés avec un séparateur "\\0\\0" et convertis en tableau de points
+          de code : tous les trigrammes sont calculés par NumPy, ceux qui contiennent le séparateur sont ignorés.
+        """
+        normalises = [texte.translate(self.TABLE).lower() for texte in textes]
+        points = np.frombuffer('\0\0'.join(normalises).encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+        if len(points) < 3:
+            return
+        codes = (points[:-2] << 42) | (points[1:-1] << 21) | points[2:]
+        lignes = np.repeat(np.arange(len(normalises)), [len(texte) + 2 for texte in normalises])[:len(codes)]
+        valides = (points[:-2] != 0) & (points[1:-1] != 0) & (points[2:] != 0)
+        codes, lignes = codes[valides], lignes[valides]
+
+        # Couples (trigramme, ligne) distincts, triés par trigramme puis par ligne
+        distincts, inverses = np.unique(codes, return_inverse=True)
+        couples = np.unique(inverses.astype(np.int64) * len(normalises) + lignes)
+        self._lots.append((distincts[couples // len(normalises)], couples % len(normalises) + premiere_ligne))
+
+    def _fusionner(self):
+        """!
+        Fusion des lots ajoutés dans l'index : codes distincts triés, bornes et lignes de chaque code.
+
+        **Notes**
+        - Appelée à la première requête qui suit un ajout : les ajouts successifs ne refont pas le tri.
+        """
+        codes = np.concatenate([np.repeat(self._codes, np.diff(self._indptr))] + [lot[0] for lot in self._lots])
+        lignes = np.concatenate([self._lignes] + [lot[1] for lot in self._lots])
+        self._lots = []
+        # Tri stable : les lignes d'un même code restent croissantes (lots ajoutés dans l'ordre)
+        ordre = np.argsort(codes, kind='stable')
+        codes, lignes = codes[ordre], lignes[ordre]
+        self._codes, debuts = np.unique(codes, return_index=True)
+        self._indptr = np.append(debuts, len(codes))
+        self._lignes = lignes.astype(np.int32) if len(self.ids_docs) < 2 ** 31 else lignes
+
+    def postings(self, trigramme):
+        """!
+        Documents contenant un trigramme.
+
+        **Parameters**
+        - **trigramme**: Chaîne de 3 caractères (normalisée).
+
+        **Returns**
+        - Tableau NumPy croissant des lignes.
+        """
+        if self._lots:
+            self._fusionner()
+        code = self._code(trigramme)
+        position = np.searchsorted(self._codes, code)
+        if position == len(self._codes) or self._codes[position] != code:
+            return np.empty(0, dtype=np.int32)
+        return self._lignes[self._indptr[position]:self._indptr[position + 1]]
+
+    def candidats(self, motif):
+        """!
+        Documents pouvant contenir une correspondance d'une expression régulière.
+
+        **Parameters**
+        - **motif**: Expression régulière compilée (la casse est ignorée : l'index est en minuscules).
+
+        **Returns**
+        - Tableau NumPy croissant des lignes candidates, ou None si aucun trigramme n'a pu être extrait
+          (tous les documents doivent être parcourus).
+        """
+        return self._evaluer(self.requete(motif.pattern, motif.flags))
+
+    def _evaluer(self, requete):
+        """!
+        Évaluation d'une requête de trigrammes.
+
+        **Parameters**
+        - **requete**: Trigramme, couple ("et" | "ou", sous-requêtes) ou None (tous les documents).
+
+        **Returns**
+        - Tableau NumPy croissant des lignes, ou None pour tous les documents.
+        """
+        if requete is None:
+            return None
+        if isinstance(requete, str):
+            return self.postings(requete)
+
+        operateur, enfants = requete
+        resultats = [self._evaluer(enfant) for enfant in enfants]
+        if operateur == "ou":
+            return np.unique(np.concatenate(resultats))
+        # Intersection en partant de la liste la plus courte
+        resultats.sort(key=len)
+        lignes = resultats[0]
+        for autre in resultats[1:]:
+            if len(lignes) == 0:
+                break
+            lignes = np.intersect1d(lignes, autre, assume_unique=True)
+        return lignes
+
+    @classmethod
+    def requete(cls, pattern, flags=0):
+        """!
+        Analyse d'une expression régulière en requête de trigrammes obligatoires.
+
+        **Parameters**
+        - **pattern**: Expression régulière (chaîne).
+        - **flags**: Options de compilation (`re.IGNORECASE`...).
+
+        **Returns**
+        - Trigramme, couple ("et" | "ou", sous-requêtes) ou None si aucun trigramme n'est obligatoire.
+
+        **Notes**
+        - L'analyse suit l'arbre syntaxique de `re` : chaque partie donne soit l'ensemble exact des chaînes
+          qu'elle reconnaît (littéraux, petites classes, alternatives), soit une requête. Les répétitions
+          pouvant être vides, les caractères non ASCII, `.`, `\\w`... interrompent les chaînes exactes.
+        - En cas d'erreur d'analyse, retourne None (parcours complet) : le résultat reste exact.
+        """
+        try:
+            exactes, requete = cls._analyser_sequence(sre_parse.parse(pattern, flags))
+        except Exception:
+            return None
+        if exactes is not None:
+            requete = cls._et([requete, cls._depuis_exactes(exactes)])
+        return requete
+
+    @classmethod
+    def _analyser_sequence(cls, elements):
+        """!
+        Analyse d'une suite d'éléments (concaténation).
+
+        **Parameters**
+        - **elements**: Suite de couples (opérateur, argument) de l'arbre syntaxique.
+
+        **Returns**
+        - Un couple (ensemble exact des chaînes reconnues ou None, requête obligatoire).
+        """
+        exactes, requetes, complet = {""}, [], True
+        for operateur, argument in elements:
+            exactes_element, requete = cls._analyser_element(str(operateur), argument)
+            requetes.append(requete)
+            if exactes_element is None:
+                requetes.append(cls._depuis_exactes(exactes))
+                exactes, complet = {""}, False
+                continue
+            produit = {a + b for a in exactes for b in exactes_element}
+            if len(produit) > cls.LIMITE_EXACTES:
+                requetes.append(cls._depuis_exactes(exactes))
+                exactes, complet = exactes_element, False
+            else:
+                exactes = produit
+
+        if complet:
+            return exactes, cls._et(requetes)
+        requetes.append(cls._depuis_exactes(exactes))
+        return None, cls._et(requetes)
+
+    @classmethod
+    def _analyser_element(cls, operateur, argument):
+        """!
+        Analyse d'un élément de l'arbre syntaxique.
+
+        **Parameters**
+        - **operateur**: Nom de l'opérateur ("LITERAL", "IN", "BRANCH"...).
+        - **argument**: Argument de l'opérateur.
+
+        **Returns**
+        - Un couple (ensemble exact des chaînes reconnues ou None, requête obligatoire).
+        """
+        if operateur == "LITERAL":
+            # Seuls les caractères ASCII ont une normalisation sûre avec re.IGNORECASE
+            return ({chr(argument).lower()}, None) if 0 < argument < 128 else (None, None)
+        if operateur in ("AT", "ASSERT", "ASSERT_NOT"):
+            # Éléments de largeur nulle : ne consomment aucun caractère
+            return {""}, None
+        if operateur == "IN":
+            caracteres = set()
+            for sous_operateur, valeur in argument:
+                sous_operateur = str(sous_operateur)
+                if sous_operateur == "LITERAL" and 0 < valeur < 128:
+                    caracteres.add(chr(valeur).lower())
+                elif sous_operateur == "RANGE" and 0 < valeur[0] and valeur[1] < 128 \
+                        and valeur[1] - valeur[0] < cls.LIMITE_EXACTES:
+                    caracteres.update(chr(code).lower() for code in range(valeur[0], valeur[1] + 1))
+                else:
+                    return None, None
+            return (caracteres, None) if len(caracteres) <= cls.LIMITE_EXACTES else (None, None)
+        if operateur == "SUBPATTERN":
+            return cls._analyser_sequence(argument[-1])
+        if operateur == "ATOMIC_GROUP":
+            return cls._analyser_sequence(argument)
+        if operateur == "BRANCH":
+            branches = [cls._analyser_sequence(branche) for branche in argument[1]]
+            if all(exactes is not None for exactes, _ in branches):
+                union = set().union(*(exactes for exactes, _ in branches))
+                if len(union) <= cls.LIMITE_EXACTES and all(requete is None for _, requete in branches):
+                    return union, None
+            return None, cls._ou([requete if exactes is None else cls._et([requete, cls._depuis_exactes(exactes)])
+                                  for exactes, requete in branches])
+        if operateur in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+            minimum, maximum, sous_motif = argument
+            if minimum == 0:
+                return None, None
+            exactes, requete = cls._analyser_sequence(sous_motif)
+            if minimum == maximum == 1:
+                return exactes, requete
+            return None, requete if exactes is None else cls._et([requete, cls._depuis_exactes(exactes)])
+        # ANY, CATEGORY, NOT_LITERAL, GROUPREF... : caractère quelconque
+        return None, None
+
+    @classmethod
+    def _depuis_exactes(cls, exactes):
+        """!
+        Requête obligatoire d'un ensemble de chaînes exactes : l'une d'elles doit apparaître.
+
+        **Parameters**
+        - **exactes**: Ensemble de chaînes.
+
+        **Returns**
+        - Requête (OU des ET des trigrammes de chaque chaîne), ou None si une chaîne a moins de 3 caractères.
+        """
+        if any(len(chaine) < 3 for chaine in exactes):
+            return None
+        return cls._ou([cls._et([chaine[i:i + 3] for i in range(len(chaine) - 2)]) for chaine in sorted(exactes)])
+
+    @staticmethod
+    def _et(requetes):
+        """!
+        Conjonction de requêtes (None : aucune contrainte).
+
+        **Parameters**
+        - **requetes**: Liste de requêtes.
+
+        **Returns**
+        - La requête simplifiée.
+        """
+        enfants = []
+        for requete in requetes:
+            if requete is not None and requete not in enfants:
+                enfants.append(requete)
+        if not enfants:
+            return None
+        return enfants[0] if len(enfants) == 1 else ("et", enfants)
+
+    @staticmethod
+    def _ou(requetes):
+        """!
+        Disjonction de requêtes (None si l'une d'elles n'impose rien).
+
+        **Parameters**
+        - **requetes**: Liste de requêtes.
+
+        **Returns**
+        - La requête simplifiée.
+        """
+        if any(requete is None for requete in requetes):
+            return None
+        enfants = []
+        for requete in requetes:
+            if requete not in enfants:
+                enfants.append(requete)
+        return enfants[0] if len(enfants) == 1 else ("ou", enfants)
+
+    def nbytes(self):
+        """!
+        Mémoire occupée par l'index.
+
+        **Returns**
+        - Le nombre d'octets des tableaux.
+        """
+        if self._lots:
+            self._fusionner()
+        return self._codes.nbytes + self._indptr.nbytes + self._lignes.nbytes + self.ids_docs.nbytes
@@ -0,0 +1,63 @@
+"""!
+# conftest.py
+
+Fixtures communes des tests de non-régression (corpus de test construit à partir de corpus_data.csv).
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+
+Lancer depuis la racine du dépôt :
+
+    python -m pytest -q v3/tests
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from models.Corpus import Corpus
+
+DONNEES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+
+@pytest.fixture(scope="session")
+def donnees():
+    """!
+    Contenu de corpus_data.csv, lu une fois pour toute la session.
+
+    **Returns**
+    - Le DataFrame des documents.
+    """
+    return pd.read_csv(os.path.join(DONNEES, 'corpus_data.csv'), sep='\t')
+
+
+@pytest.fixture
+def creer_corpus(donnees):
+    """!
+    Fabrique de corpus de test.
+
+    **Returns**
+    - Une fonction (stockage, n_documents) retournant le Corpus réinitialisé avec les premiers documents.
+    """
+    def creer(stockage="objets", n_documents=None):
+        corpus = Corpus()
+        # Le Corpus est un singleton : on le réinitialise pour chaque test
+        corpus.__init__(nom="Tests", stockage=stockage)
+        corpus.from_dataframe(donnees if n_documents is None else donnees.iloc[:n_documents])
+        return corpus
+    return creer
+
+
+@pytest.fixture
+def corpus(creer_corpus):
+    """!
+    Corpus de test complet, en stockage "objets".
+
+    **Returns**
+    - Le Corpus.
+    """
+    return creer_corpus()
@@ -0,0 +1,74 @@
+"""!
+# test_author_index.py
+
+Tests de l'index des auteurs et co-auteurs : documents, statistiques et recherche par préfixe,
+comparés au parcours des documents du corpus.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import pytest
+
+from models.AuthorIndex import IndexAuteurs
+from models.Document import ArxivDocument
+
+
+def test_index():
+    index = IndexAuteurs()
+    index.ajouter([1, 2], ["Hans  Fangohr", "Alice"], [["hans fangohr", "Bob"], []], [100, 50])
+    index.ajouter([3], ["bob"], [["ALICE"]], [10])
+    assert len(index) == 3
+    # Casse et espaces ignorés ; le nom affiché est la première graphie rencontrée
+    assert index.get_documents("HANS FANGOHR").tolist() == [1]
+    assert index.get_documents("alice").tolist() == [2, 3]
+    assert index.get_documents("inconnu").tolist() == []
+    assert index.stats("bob") == {'nom': "Bob", 'documents': 2, 'principal': 1, 'co_auteur': 1,
+                                  'taille_moyenne': 55.0}
+    # Auteur principal répété parmi les co-auteurs : compté une fois
+    assert index.stats("hans fangohr")['documents'] == 1
+    assert index.stats("inconnu") is None
+
+    assert index.rechercher("") == ["Alice", "Bob", "Hans  Fangohr"]
+    assert index.rechercher("B") == ["Bob"]
+    assert index.rechercher("a", n=1) == ["Alice"]
+    assert index.rechercher("zz") == []
+
+
+def attendus(corpus):
+    """!
+    Documents de chaque auteur, calculés en parcourant les documents du corpus.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+
+    **Returns**
+    - Dictionnaire nom normalisé -> (identifiants des documents, nombre en auteur principal).
+    """
+    auteurs = {}
+    for doc_id, document in corpus.get_documents().items():
+        principal = IndexAuteurs.normaliser(document.get_auteur())
+        noms = dict.fromkeys([principal] + [IndexAuteurs.normaliser(nom)
+                                            for nom in getattr(document, 'co_auteurs', None) or []])
+        for nom in noms:
+            ids, n_principal = auteurs.get(nom, ([], 0))
+            auteurs[nom] = (ids + [doc_id], n_principal + (nom == principal))
+    return auteurs
+
+
+@pytest.mark.parametrize("stockage", ["objets", "colonnes"])
+def test_corpus(creer_corpus, stockage):
+    corpus = creer_corpus(stockage, n_documents=300)
+    # Index construit avant l'ajout : il est complété à la demande suivante
+    corpus.get_index_auteurs()
+    corpus.add_document(ArxivDocument("Ajout", "Nouvel Auteur", "2024-01-01", "", "Texte.",
+                                      co_auteurs=[corpus.get_documents()[0].get_auteur()]))
+    index = corpus.get_index_auteurs()
+    assert len(index) == len(corpus.get_documents())
+
+    reference = attendus(corpus)
+    assert sorted(IndexAuteurs.normaliser(nom) for nom in index.rechercher("")) == sorted(reference)
+    for nom, (ids, n_principal) in reference.items():
+        assert index.get_documents(nom).tolist() == ids, nom
+        stats = index.stats(nom)
+        assert (stats['documents'], stats['principal']) == (len(ids), n_principal), nom
@@ -0,0 +1,266 @@
+"""!
+# test_corpus.py
+
+Tests de non-régression du Corpus : les différentes façons de charger les documents doivent donner
+le même corpus.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DONNEES
+from models.Corpus import Corpus
+from models.Document import Document
+from models.SearchEngine import SearchEngine
+
+## Motifs de concordance : sous-chaînes, mots entiers (index positionnel), alternatives, sans trigramme.
+MOTIFS = ["software", "ki", "SKI", r"\bsoftware\b", r"\bTHE\b", r"\bcode\b", r"(war|peace)",
+          r"[Pp]ython\s+\w+", r"test(s|ing)?\b", r"\w+ing\b", r"\d{4}", r"\bzzzinconnu\b"]
+## Mots-clés de `search`.
+MOTS_CLES = ["software", "python", "engineering", "c++", "zzzinconnu"]
+
+
+def contenu(corpus):
+    """!
+    Contenu du corpus sous forme comparable.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+
+    **Returns**
+    - La liste des tuples (id, type, titre, auteur, date, url, texte) de chaque document.
+    """
+    return [(doc_id, type(doc).__name__, doc.get_titre(), doc.get_auteur(), str(doc.get_date()), doc.get_url(),
+             doc.get_texte()) for doc_id, doc in corpus.get_documents().items()]
+
+
+def test_load_stream(creer_corpus):
+    # Le Corpus est un singleton : le contenu de référence est calculé avant sa réinitialisation
+    attendu = contenu(creer_corpus())
+    corpus = Corpus()
+    corpus.__init__(nom="Tests")
+    n_documents = corpus.load_stream(os.path.join(DONNEES, 'corpus_data.csv'), taille_bloc=150)
+    assert n_documents == len(attendu)
+    assert contenu(corpus) == attendu
+
+
+def test_load_stream_moteur(creer_corpus):
+    corpus = creer_corpus(n_documents=100)
+    moteur = SearchEngine(corpus, taille_cache=0)
+    n_documents = corpus.load_stream(os.path.join(DONNEES, 'discours_US.csv'), taille_bloc=50, moteur=moteur)
+    # Le moteur est mis à jour après chaque bloc
+    assert n_documents > 0
+    assert moteur.N_docs == len(corpus.get_documents()) == 100 + n_documents
+    reference = SearchEngine(corpus, taille_cache=0)
+    for requete in ("software", "america people", "economy jobs"):
+        trouves = moteur.search(requete, dataframe=False)
+        attendus = reference.search(requete, dataframe=False)
+        assert trouves.ids.tolist() == attendus.ids.tolist(), requete
+        np.testing.assert_allclose(trouves.scores, attendus.scores, rtol=1e-9)
+
+
+def test_stockage_colonnes(creer_corpus):
+    # Le Corpus est un singleton : le contenu de référence est calculé avant sa réinitialisation
+    attendu = contenu(creer_corpus("objets"))
+    assert contenu(creer_corpus("colonnes")) == attendu
+
+
+def auteurs(corpus):
+    """!
+    Auteurs du corpus sous forme comparable.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+
+    **Returns**
+    - Le dictionnaire nom -> (nombre de documents, taille totale des textes).
+    """
+    return {nom: (auteur.get_nb_docs(), auteur.taille_totale) for nom, auteur in corpus.get_authors().items()}
+
+
+@pytest.mark.parametrize("stockage", ["objets", "colonnes"])
+def test_add_documents(creer_corpus, stockage):
+    corpus = creer_corpus(stockage, n_documents=200)
+    documents = [corpus.get_documents()[doc_id] for doc_id in corpus.get_documents()]
+    attendu, attendus_auteurs = contenu(corpus), auteurs(corpus)
+
+    resultats = []
+    for un_par_un in (True, False):
+        corpus.__init__(nom="Tests", stockage=stockage)
+        # Le TokenStore existe avant l'ajout : il est complété au fur et à mesure
+        corpus.get_token_store()
+        version = corpus.get_version()
+        if un_par_un:
+            for document in documents[:150]:
+                corpus.add_document(document)
+            corpus.add_documents(document for document in documents[150:])
+        else:
+            assert corpus.add_documents(documents) == len(documents)
+        assert corpus.get_version() != version
+        assert contenu(corpus) == attendu
+        assert auteurs(corpus) == attendus_auteurs
+        store = corpus.get_token_store()
+        resultats.append((store.ids_docs, store.tokens.tolist(), store.offsets.tolist()))
+    assert resultats[0] == resultats[1]
+
+
+def test_from_dataframe(creer_corpus, donnees):
+    attendu = contenu(creer_corpus())
+    corpus = creer_corpus(n_documents=0)
+    assert corpus.from_records(donnees.to_dict('records')) == len(donnees)
+    assert contenu(corpus) == attendu
+
+    # Valeurs manquantes : chaînes vides
+    corpus = creer_corpus(n_documents=0)
+    corpus.from_dataframe(donnees.iloc[:5].assign(titre=None))
+    assert all(doc.get_titre() == "" for doc in corpus.get_documents().values())
+
+
+def test_from_dataframe_discours(creer_corpus):
+    discours = pd.read_csv(os.path.join(DONNEES, 'discours_US.csv'), sep='\t')
+    corpus = creer_corpus(n_documents=0)
+    assert corpus.from_dataframe(discours) == len(discours)
+    n_phrases = corpus.from_dataframe(discours, phrases=True)
+    assert n_phrases > len(discours)
+    # Une phrase par document, de plus de 20 caractères
+    textes = [doc.get_texte() for doc in corpus.get_documents().values()][len(discours):]
+    assert len(textes) == n_phrases and all(len(texte) > 20 for texte in textes)
+
+
+def parcours_concorde(corpus, motif, context_size=30):
+    """!
+    Concordance calculée par `re.finditer` sur le texte de chaque document.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **motif**: Expression régulière.
+    - **context_size**: Taille des contextes.
+
+    **Returns**
+    - La liste des lignes (contexte gauche, motif trouvé, contexte droit, id du document).
+    """
+    motif = re.compile(motif, re.IGNORECASE)
+    return [(texte[max(0, match.start() - context_size):match.start()].strip(), match.group(),
+             texte[match.end():match.end() + context_size].strip(), doc_id)
+            for doc_id, texte in ((doc_id, doc.get_texte()) for doc_id, doc in corpus.get_documents().items())
+            for match in motif.finditer(texte)]
+
+
+def concordance(corpus, motif, **parametres):
+    """!
+    Lignes du DataFrame produit par `concorde`.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **motif**: Motif recherché.
+    - **parametres**: Autres arguments de `concorde`.
+
+    **Returns**
+    - La liste des lignes (contexte gauche, motif trouvé, contexte droit, id du document).
+    """
+    return list(corpus.concorde(motif, **parametres).itertuples(index=False, name=None))
+
+
+@pytest.mark.parametrize("mot", ["software", "code", "peace", "the", "c++", "zzzinconnu"])
+def test_concorde_mot_entier(corpus, mot):
+    attendues = parcours_concorde(corpus, rf"\b{re.escape(mot)}\b")
+    assert concordance(corpus, mot, mot=True) == attendues
+    assert concordance(corpus, rf"\b{re.escape(mot)}\b") == attendues
+
+
+def test_concorde_index_positionnel(corpus):
+    concordance(corpus, "software", mot=True)
+    assert corpus.stats_requete["methode"] == "index positionnel"
+    # Un mot nu est une sous-chaîne : il n'est pas servi par l'index positionnel
+    assert concordance(corpus, "software") == parcours_concorde(corpus, "software")
+    assert corpus.stats_requete["methode"] != "index positionnel"
+
+
+def test_concorde_casse_speciale(corpus):
+    # Le signe Kelvin est égal à "k" pour re.IGNORECASE, mais pas pour le Tokenizer
+    corpus.add_document(Document("Kelvin", "Test", "2024-01-01", "", "Le \u212aey du test"))
+    assert concordance(corpus, "key", mot=True) == parcours_concorde(corpus, r"\bkey\b")
+    assert concordance(corpus, "key", mot=True)[-1][1] == "\u212aey"
+
+
+@pytest.mark.parametrize("motif", MOTIFS)
+def test_concorde_parcours(corpus, motif):
+    assert concordance(corpus, motif) == parcours_concorde(corpus, motif)
+
+
+@pytest.mark.parametrize("mot_cle", MOTS_CLES)
+def test_search_parcours(corpus, mot_cle):
+    motif = re.compile(r".{0,40}\b" + re.escape(mot_cle) + r"\b.{0,40}", re.IGNORECASE)
+    attendus = [extrait for doc in corpus.get_documents().values() for extrait in motif.findall(doc.get_texte())]
+    assert corpus.search(mot_cle) == attendus
+
+
+def test_trigrammes(corpus):
+    corpus.search("software")
+    assert corpus.stats_requete["methode"] == "trigrammes"
+    assert 0 < corpus.stats_requete["candidats"] < len(corpus.get_documents())
+    concordance(corpus, r"\w+ing\b")
+    assert corpus.stats_requete["methode"] == "trigrammes"
+    # Aucun trigramme obligatoire : tous les documents sont parcourus
+    concordance(corpus, r"\d{2}")
+    assert corpus.stats_requete["methode"] == "parcours complet"
+
+    # Les documents ajoutés après la construction de l'index sont indexés à leur tour
+    corpus.add_document(Document("Ajout", "Test", "2024-01-01", "", "Un mot zzzinconnu ajouté."))
+    assert corpus.search("zzzinconnu") == ["Un mot zzzinconnu ajouté."]
+
+
+def test_stockage_colonnes_motifs(creer_corpus):
+    objets = creer_corpus("objets")
+    attendues = ({motif: concordance(objets, motif) for motif in MOTIFS},
+                 {mot_cle: objets.search(mot_cle) for mot_cle in MOTS_CLES})
+    colonnes = creer_corpus("colonnes")
+    assert ({motif: concordance(colonnes, motif) for motif in MOTIFS},
+            {mot_cle: colonnes.search(mot_cle) for mot_cle in MOTS_CLES}) == attendues
+
+
+def occurrences(corpus, motif, **parametres):
+    """!
+    Occurrences d'un motif produites par `iter_concorde`.
+
+    **Parameters**
+    - **corpus**: Le Corpus.
+    - **motif**: Expression régulière.
+    - **parametres**: Autres arguments de `iter_concorde`.
+
+    **Returns**
+    - La liste des couples (id du document, début de l'occurrence).
+    """
+    return [(ligne["id document"], ligne["position"]) for ligne in corpus.iter_concorde(motif, **parametres)]
+
+
+@pytest.mark.parametrize("motif", [r"\bsoftware\b", "software", r"\w+ing\b", r"\d{2}"])
+def test_concorde_pagination(corpus, motif):
+    attendues = occurrences(corpus, motif)
+    assert [ligne[3] for ligne in parcours_concorde(corpus, motif)] == [doc_id for doc_id, _ in attendues]
+    for limit, offset in [(7, 3), (1, 0), (5, len(attendues) - 2), (3, len(attendues) + 10)]:
+        assert occurrences(corpus, motif, limit=limit, offset=offset) == attendues[offset:offset + limit]
+        assert concordance(corpus, motif, limit=limit, offset=offset) == \
+            parcours_concorde(corpus, motif)[offset:offset + limit]
+
+
+def test_concorde_parallele(corpus):
+    # Motif sans trigramme obligatoire : les textes sont parcourus par lots dans des processus
+    attendues = occurrences(corpus, r"\d{2}")
+    assert occurrences(corpus, r"\d{2}", n_workers=2, taille_lot=50) == attendues
+    assert occurrences(corpus, r"\d{2}", n_workers=2, taille_lot=50, limit=5, offset=20) == attendues[20:25]
+
+
+def test_concorde_arret_anticipe(corpus):
+    lignes = corpus.iter_concorde(r"\d{2}", n_workers=2, taille_lot=20)
+    premiere = next(lignes)
+    # Fermer le générateur annule les lots en attente
+    lignes.close()
+    assert (premiere["id document"], premiere["position"]) == occurrences(corpus, r"\d{2}", limit=1)[0]
@@ -0,0 +1,68 @@
+"""!
+# test_document_store.py
+
+Tests du stockage des documents en colonnes : les documents reconstruits doivent être ceux ajoutés.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import pytest
+
+from models.Document import ArxivDocument, Document, RedditDocument
+from models.DocumentStore import StockageDocuments
+
+
+def champs(document):
+    """!
+    Champs d'un document sous forme comparable.
+
+    **Parameters**
+    - **document**: Le Document.
+
+    **Returns**
+    - Le tuple (type, titre, auteur, date, url, texte, nb_comments, co_auteurs).
+    """
+    return (type(document), document.get_titre(), document.get_auteur(), document.get_date(), document.get_url(),
+            document.get_texte(), getattr(document, 'nb_comments', None), getattr(document, 'co_auteurs', None))
+
+
+## Documents de chaque classe supportée.
+DOCUMENTS = [Document("Titre", "Alice", "2020-01-01", "http://a", "Un texte."),
+             RedditDocument("Post", "Bob", "2021-02-03", "http://b", "Un post.", 12),
+             ArxivDocument("Article", "Carol", "2022-03-04", "http://c", "Un article.", co_auteurs=["Alice", "Dan"]),
+             ArxivDocument("Seul", "Dan", "2023-04-05", "http://d", "Sans co-auteur.")]
+
+
+@pytest.mark.parametrize("par_lot", [False, True])
+def test_reconstruction(par_lot):
+    stockage = StockageDocuments()
+    if par_lot:
+        stockage.ajouter_lot(0, DOCUMENTS)
+    else:
+        for doc_id, document in enumerate(DOCUMENTS):
+            stockage[doc_id] = document
+    assert len(stockage) == len(DOCUMENTS)
+    assert list(stockage) == list(range(len(DOCUMENTS)))
+    assert [champs(stockage[doc_id]) for doc_id in stockage] == [champs(document) for document in DOCUMENTS]
+    assert list(stockage.iter_textes()) == [document.get_texte() for document in DOCUMENTS]
+
+
+@pytest.mark.parametrize("par_lot", [False, True])
+def test_nb_comments_flottant(par_lot):
+    stockage = StockageDocuments()
+    document = RedditDocument("Post", "Bob", "2021-02-03", "http://b", "Un post.", 12.0)
+    if par_lot:
+        stockage.ajouter_lot(0, [document])
+    else:
+        stockage[0] = document
+    assert stockage[0].get_nb_comments() == 12
+
+
+def test_identifiant_non_consecutif():
+    stockage = StockageDocuments()
+    stockage[0] = DOCUMENTS[0]
+    with pytest.raises(KeyError):
+        stockage[2] = DOCUMENTS[1]
+    with pytest.raises(KeyError):
+        stockage[5]
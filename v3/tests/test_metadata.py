@@ -0,0 +1,111 @@
+"""!
+# test_metadata.py
+
+Tests des métadonnées en colonnes : analyse des dates, et index triés (dates, titres) comparés
+à un tri complet, y compris après des ajouts.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from models.Metadata import Metadonnees
+
+## Dates de test : formats ISO (avec ou sans 'Z'), texte, datetime, ex-aequo et dates illisibles.
+DATES = ["2020-05-01T10:00:00Z", "April 12, 2015", "2020-05-01T10:00:00", "Date inconnue",
+         datetime(2018, 1, 1, tzinfo=timezone.utc), "2021-03-04", "", "April 12, 2015"]
+## Titres de test, avec casse différente et doublons.
+TITRES = ["beta", "Alpha", "gamma", "alpha", "Delta", "beta", "epsilon", "Zeta"]
+
+
+def colonnes(debut, fin):
+    """!
+    Colonnes de métadonnées d'une tranche des documents de test.
+
+    **Parameters**
+    - **debut**, **fin**: Positions des documents de test.
+
+    **Returns**
+    - Dictionnaire de listes alignées (voir `Metadonnees.ajouter`).
+    """
+    positions = range(debut, fin)
+    return {'ids': [10 + i for i in positions], 'types': ["Reddit" if i % 2 else "Arxiv" for i in positions],
+            'auteurs': [f"auteur {i % 3}" for i in positions], 'dates': [DATES[i] for i in positions],
+            'nb_comments': [i % 4 for i in positions], 'titres': [TITRES[i] for i in positions]}
+
+
+def tri_complet(valeurs, decroissant=False):
+    """!
+    Ordre de référence : tri stable, valeurs inconnues (NaN) à la fin.
+
+    **Parameters**
+    - **valeurs**: Liste des valeurs.
+    - **decroissant**: Si vrai, les plus grandes valeurs d'abord (à valeur égale, par ordre d'ajout).
+
+    **Returns**
+    - La liste des positions triées.
+    """
+    # NaN est la seule valeur différente d'elle-même
+    connues = [i for i, valeur in enumerate(valeurs) if valeur == valeur]
+    rangs = {valeur: rang for rang, valeur in enumerate(sorted({valeurs[i] for i in connues}))}
+    connues.sort(key=lambda i: (-rangs[valeurs[i]] if decroissant else rangs[valeurs[i]], i))
+    return connues + [i for i, valeur in enumerate(valeurs) if valeur != valeur]
+
+
+def test_dates():
+    secondes = Metadonnees.epoch(DATES)
+    assert secondes[0] == secondes[2] == datetime(2020, 5, 1, 10, tzinfo=timezone.utc).timestamp()
+    assert secondes[1] == secondes[7] == datetime(2015, 4, 12, tzinfo=timezone.utc).timestamp()
+    assert secondes[4] == datetime(2018, 1, 1, tzinfo=timezone.utc).timestamp()
+    assert np.isnan(secondes[3]) and np.isnan(secondes[6])
+    assert Metadonnees.instant("2021-03-04") == secondes[5]
+    assert Metadonnees.instant(12.5) == 12.5
+    assert np.isnan(Metadonnees.instant("pas une date"))
+
+
+@pytest.mark.parametrize("coupure", [0, 3, 8])
+def test_index_tries(coupure):
+    # Ordre de tri calculé sur les premiers documents, puis complété par fusion
+    metadonnees = Metadonnees()
+    metadonnees.ajouter(colonnes(0, coupure))
+    metadonnees.premiers('dates', 1)
+    metadonnees.premiers('titres', 1)
+    metadonnees.ajouter(colonnes(coupure, len(DATES)))
+
+    dates = metadonnees.dates.tolist()
+    titres = metadonnees.titres.tolist()
+    assert titres == [titre.lower() for titre in TITRES]
+    for n in (1, 3, len(DATES)):
+        assert metadonnees.premiers('dates', n).tolist() == tri_complet(dates)[:n]
+        assert metadonnees.premiers('dates', n, decroissant=True).tolist() == tri_complet(dates, True)[:n]
+        assert metadonnees.premiers('titres', n).tolist() == tri_complet(titres)[:n]
+        assert metadonnees.premiers('titres', n, decroissant=True).tolist() == tri_complet(titres, True)[:n]
+
+    minimum, maximum = Metadonnees.instant("2016-01-01"), Metadonnees.instant("2020-05-01T10:00:00")
+    attendus = [i for i in tri_complet(dates) if minimum <= dates[i] <= maximum]
+    assert metadonnees.intervalle('dates', minimum, maximum).tolist() == attendus
+    assert metadonnees.intervalle('dates', minimum, maximum, n=2, decroissant=True).tolist() == \
+        [i for i in tri_complet(dates, True) if minimum <= dates[i] <= maximum][:2]
+    # Les dates inconnues ne sont jamais sélectionnées
+    assert len(metadonnees.intervalle('dates')) == len(DATES) - 2
+
+
+def test_corpus_tris(corpus, capsys):
+    documents = corpus.get_documents()
+    dates = {doc_id: Metadonnees.instant(document.get_date()) for doc_id, document in documents.items()}
+    recents = sorted(dates, key=lambda doc_id: (-dates[doc_id], doc_id))
+    assert corpus.get_ids_by_date(n=5, recent=True).tolist() == recents[:5]
+    assert corpus.get_ids_by_date("2024-01-01", "2024-12-31").tolist() == \
+        sorted((doc_id for doc_id in dates if Metadonnees.instant("2024-01-01") <= dates[doc_id]
+                <= Metadonnees.instant("2024-12-31")), key=lambda doc_id: (dates[doc_id], doc_id))
+    with pytest.raises(ValueError):
+        corpus.get_ids_by_date("pas une date")
+
+    corpus.get_sorted_by_title(3)
+    titres = sorted(documents, key=lambda doc_id: (documents[doc_id].get_titre().lower(), doc_id))
+    sortie = capsys.readouterr().out
+    assert all(str(documents[doc_id]) in sortie for doc_id in titres[:3])
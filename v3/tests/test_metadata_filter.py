@@ -0,0 +1,104 @@
+"""!
+# test_metadata_filter.py
+
+Tests des filtres de métadonnées : masques comparés à la lecture des documents un par un,
+recherches filtrées comparées au filtrage des résultats après coup, et cache des masques.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.MetadataFilter import FiltresMetadonnees
+from models.SearchEngine import SearchEngine
+
+## Filtres testés : valeurs, intervalles de dates et de commentaires, combinaisons.
+FILTRES = [{'type': 'Reddit'}, {'type': ['Arxiv', 'Reddit']}, {'date_min': '2020-01-01'},
+           {'date_max': '2018-06-30T12:00:00'}, {'nb_comments_min': 10}, {'nb_comments_max': 0},
+           {'type': 'Arxiv', 'date_min': '2019-01-01', 'date_max': '2022-12-31'}, {'auteur': 'zzzinconnu'}]
+
+
+def verifie(document, filtres):
+    """!
+    Évaluation directe des filtres sur un document.
+
+    **Parameters**
+    - **document**: Le Document.
+    - **filtres**: Dictionnaire des filtres.
+
+    **Returns**
+    - Vrai si le document vérifie tous les filtres.
+    """
+    date = pd.to_datetime(document.get_date(), utc=True, errors='coerce')
+    date = np.nan if pd.isna(date) else date.timestamp()
+    for cle, valeur in filtres.items():
+        if cle in ('type', 'auteur'):
+            valeurs = [valeur] if isinstance(valeur, str) else valeur
+            if (document.getType() if cle == 'type' else document.get_auteur()) not in valeurs:
+                return False
+        else:
+            mesure = date if cle.startswith('date') else getattr(document, 'nb_comments', 0)
+            borne = pd.Timestamp(valeur, tz='UTC').timestamp() if cle.startswith('date') else valeur
+            if not (mesure >= borne if cle.endswith('min') else mesure <= borne):
+                return False
+    return True
+
+
+@pytest.mark.parametrize("filtres", FILTRES)
+def test_masque(corpus, filtres):
+    masque = FiltresMetadonnees(filtres).masque(corpus.get_metadonnees())
+    attendu = [verifie(document, filtres) for document in corpus.get_documents().values()]
+    assert masque.tolist() == attendu
+
+
+def test_filtres_invalides():
+    with pytest.raises(ValueError):
+        FiltresMetadonnees({'couleur': 'bleu'})
+    with pytest.raises(ValueError):
+        FiltresMetadonnees({'date_min': 'pas une date'})
+    assert not FiltresMetadonnees({}) and not FiltresMetadonnees({'type': None})
+    # Deux dictionnaires équivalents ont la même clé de cache
+    assert FiltresMetadonnees({'type': ['Reddit', 'Arxiv'], 'date_min': 0}).cle() == \
+        FiltresMetadonnees({'date_min': 0.0, 'type': ('Arxiv', 'Reddit', 'Arxiv')}).cle()
+
+
+@pytest.mark.parametrize("filtres", FILTRES)
+def test_recherche_filtree(corpus, filtres):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    documents = corpus.get_documents()
+    for requete in ("software engineering", "the", "python code"):
+        tous = moteur.search(requete, n_results=moteur.N_docs, dataframe=False)
+        attendus = [doc_id for doc_id in tous.ids.tolist() if verifie(documents[doc_id], filtres)][:10]
+        assert moteur.search(requete, dataframe=False, filtres=filtres).ids.tolist() == attendus, requete
+        lot = moteur.search_many([requete], filtres=filtres)
+        assert lot[0][0].tolist() == attendus, requete
+
+
+def test_cache_masques(creer_corpus, donnees, monkeypatch):
+    corpus = creer_corpus(n_documents=300)
+    moteur = SearchEngine(corpus, taille_cache=0, fusion_arriere_plan=False)
+    compilations = []
+    masque = FiltresMetadonnees.masque
+    monkeypatch.setattr(FiltresMetadonnees, 'masque',
+                        lambda self, metadonnees: compilations.append(self.cle()) or masque(self, metadonnees))
+
+    filtres = {'type': 'Arxiv'}
+    premiers = moteur.search("software", dataframe=False, filtres=filtres).ids.tolist()
+    moteur.search("python code", dataframe=False, filtres={'type': ['Arxiv']})
+    assert moteur.search("software", dataframe=False, filtres=filtres).ids.tolist() == premiers
+    # Un seul calcul du masque pour des filtres équivalents
+    assert len(compilations) == 1
+
+    # Les documents ajoutés invalident le masque : les nouveaux documents sont filtrés à leur tour
+    corpus.from_dataframe(donnees.iloc[300:])
+    trouves = moteur.search("software", n_results=1000, dataframe=False, filtres=filtres)
+    assert len(compilations) == 2
+    documents = corpus.get_documents()
+    assert all(documents[doc_id].getType() == 'Arxiv' for doc_id in trouves.ids.tolist())
+    assert any(doc_id >= 300 for doc_id in trouves.ids.tolist())
+    reference = SearchEngine(corpus, taille_cache=0)
+    assert trouves.ids.tolist() == reference.search("software", n_results=1000, dataframe=False,
+                                                    filtres=filtres).ids.tolist()
@@ -0,0 +1,74 @@
+"""!
+# test_proximity_query.py
+
+Tests des requêtes de phrases et de proximité (NEAR/k), comparées aux positions des tokens
+calculées directement.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import pytest
+
+from models.Document import Document
+from models.SearchEngine import SearchEngine
+
+## Textes de test : "alpha" et "beta" à une distance de 1 à 4 positions, dans les deux ordres.
+TEXTES = ["alpha beta", "beta alpha", "alpha one beta", "beta one two alpha", "alpha one two beta",
+          "alpha one two three beta", "alpha alone", "beta alone"]
+
+
+@pytest.fixture
+def moteur(creer_corpus):
+    """!
+    Moteur sur un corpus réduit aux textes de test.
+
+    **Returns**
+    - Le SearchEngine.
+    """
+    corpus = creer_corpus(n_documents=0)
+    corpus.add_documents(Document(f"Texte {i}", "Test", "2024-01-01", "", texte) for i, texte in enumerate(TEXTES))
+    return SearchEngine(corpus, taille_cache=0)
+
+
+def trouves(moteur, requete):
+    """!
+    Textes retournés par une requête.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requete**: La requête.
+
+    **Returns**
+    - L'ensemble des textes des documents retournés.
+    """
+    resultats = moteur.search(requete, n_results=len(TEXTES), dataframe=False)
+    return {TEXTES[doc_id] for doc_id in resultats.ids.tolist()}
+
+
+@pytest.mark.parametrize("distance", [1, 2, 3, 4])
+def test_near_bornes(moteur, distance):
+    # NEAR/k : positions distantes d'au plus k, dans un ordre quelconque
+    attendus = {texte for texte in TEXTES
+                if "alpha" in texte.split() and "beta" in texte.split()
+                and abs(texte.split().index("alpha") - texte.split().index("beta")) <= distance}
+    assert trouves(moteur, f"alpha NEAR/{distance} beta") == attendus
+    # La borne est incluse : à k, le couple est retenu ; à k + 1, il ne l'est plus
+    assert "alpha one two beta" in trouves(moteur, "alpha NEAR/3 beta")
+    assert "alpha one two beta" not in trouves(moteur, "alpha NEAR/2 beta")
+
+
+def test_phrase(moteur):
+    assert trouves(moteur, '"alpha beta"') == {"alpha beta"}
+    assert trouves(moteur, '"beta alpha"') == {"beta alpha"}
+    # Une phrase d'un seul mot n'est qu'un mot
+    assert trouves(moteur, '"alpha"') == {texte for texte in TEXTES if "alpha" in texte}
+
+
+def test_near_meme_mot(creer_corpus):
+    corpus = creer_corpus(n_documents=0)
+    corpus.add_documents(Document(f"Texte {i}", "Test", "2024-01-01", "", texte)
+                         for i, texte in enumerate(["alpha one alpha", "alpha one two alpha", "alpha", "beta"]))
+    moteur = SearchEngine(corpus, taille_cache=0)
+    # Un mot proche de lui-même doit apparaître deux fois dans la fenêtre
+    assert moteur.search("alpha NEAR/2 alpha", dataframe=False).ids.tolist() == [0]
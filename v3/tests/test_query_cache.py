@@ -0,0 +1,49 @@
+"""!
+# test_query_cache.py
+
+Tests du cache des résultats de requêtes : succès, éviction LRU et invalidation par version.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+from models.QueryCache import CacheRequetes
+
+
+def test_succes_echecs():
+    cache = CacheRequetes(capacite=2)
+    assert cache.get("a", 1) is None
+    cache.put("a", 1, "resultats a")
+    assert cache.get("a", 1) == "resultats a"
+    stats = cache.get_stats()
+    assert (stats['succes'], stats['echecs'], stats['taux_succes']) == (1, 1, 0.5)
+
+
+def test_eviction_lru():
+    cache = CacheRequetes(capacite=2)
+    cache.put("a", 1, "resultats a")
+    cache.put("b", 1, "resultats b")
+    # "a" devient la plus récemment utilisée : "b" est évincée
+    cache.get("a", 1)
+    cache.put("c", 1, "resultats c")
+    assert len(cache) == 2
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == "resultats a" and cache.get("c", 1) == "resultats c"
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_invalidation_version():
+    cache = CacheRequetes(capacite=2)
+    cache.put("a", 1, "resultats a")
+    assert cache.get("a", 2) is None
+    assert len(cache) == 0
+    assert cache.get_stats()['invalidations'] == 1
+    # Une valeur calculée pour la nouvelle version est servie
+    cache.put("a", 2, "resultats a v2")
+    assert cache.get("a", 2) == "resultats a v2"
+
+
+def test_cache_desactive():
+    cache = CacheRequetes(capacite=0)
+    cache.put("a", 1, "resultats a")
+    assert len(cache) == 0 and cache.get("a", 1) is None
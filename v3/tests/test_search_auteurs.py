@@ -0,0 +1,102 @@
+"""!
+# test_search_auteurs.py
+
+Tests de la recherche d'experts : scores des auteurs comparés à l'agrégation, calculée directement,
+des scores de leurs documents.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+import pytest
+
+from models.AuthorIndex import IndexAuteurs
+from models.Passage import DecoupeurPassages
+from models.SearchEngine import SearchEngine
+
+## Requêtes testées.
+REQUETES = ["software engineering", "python testing code", "zzzinconnu"]
+
+
+def scores_auteurs(moteur, requete, agregation, filtres=None):
+    """!
+    Scores des auteurs calculés à partir des scores de tous les documents.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requete**: La requête.
+    - **agregation**: "somme" ou "moyenne".
+    - **filtres**: Filtres de métadonnées (voir `SearchEngine.search`).
+
+    **Returns**
+    - Un couple de dictionnaires nom normalisé -> score de l'auteur, et nom normalisé -> scores des documents
+      {id: score} de l'auteur.
+    """
+    documents = moteur.corpus.get_documents()
+    trouves = moteur.search(requete, n_results=len(documents), dataframe=False, filtres=filtres)
+    scores_docs = dict(zip(trouves.ids.tolist(), trouves.scores.tolist()))
+    par_auteur, n_documents = {}, {}
+    for doc_id, document in documents.items():
+        noms = dict.fromkeys(IndexAuteurs.normaliser(nom) for nom in
+                             [document.get_auteur()] + (getattr(document, 'co_auteurs', None) or []))
+        for nom in noms:
+            n_documents[nom] = n_documents.get(nom, 0) + 1
+            if doc_id in scores_docs:
+                par_auteur.setdefault(nom, {})[doc_id] = scores_docs[doc_id]
+    scores = {nom: sum(docs.values()) / (n_documents[nom] if agregation == "moyenne" else 1)
+              for nom, docs in par_auteur.items()}
+    return scores, par_auteur
+
+
+def verifier_experts(moteur, agregation, n_results=10, n_documents=3, filtres=None):
+    """!
+    Vérifie `search_auteurs` sur chaque requête.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **agregation**: "somme" ou "moyenne".
+    - **n_results**, **n_documents**, **filtres**: Voir `search_auteurs`.
+    """
+    for requete in REQUETES:
+        attendus, par_auteur = scores_auteurs(moteur, requete, agregation, filtres)
+        experts = moteur.search_auteurs(requete, n_results, n_documents, agregation, dataframe=False,
+                                         filtres=filtres)
+        assert len(experts) == min(n_results, len(attendus)), requete
+        meilleurs = sorted(attendus.values(), reverse=True)[:n_results]
+        np.testing.assert_allclose([score for _, score, _, _ in experts], meilleurs, rtol=1e-9)
+        for nom, score, ids, scores in experts:
+            docs = par_auteur[IndexAuteurs.normaliser(nom)]
+            assert score == pytest.approx(attendus[IndexAuteurs.normaliser(nom)], rel=1e-9)
+            # Meilleurs documents de l'auteur, par score décroissant
+            np.testing.assert_allclose(scores, sorted(docs.values(), reverse=True)[:n_documents], rtol=1e-9)
+            assert all(docs[doc_id] == pytest.approx(s) for doc_id, s in zip(ids.tolist(), scores))
+
+
+@pytest.mark.parametrize("agregation", ["somme", "moyenne"])
+def test_search_auteurs(corpus, agregation):
+    verifier_experts(SearchEngine(corpus, taille_cache=0), agregation)
+    verifier_experts(SearchEngine(corpus, taille_cache=0), agregation, n_results=3, n_documents=1)
+    # Filtres : seuls les documents retenus comptent, la moyenne reste sur tous les documents de l'auteur
+    verifier_experts(SearchEngine(corpus, taille_cache=0), agregation, filtres={'type': 'Arxiv'})
+
+
+def test_search_auteurs_passages_segments(creer_corpus, donnees):
+    corpus = creer_corpus(n_documents=300)
+    moteur = SearchEngine(corpus, passages=DecoupeurPassages(), fusion_arriere_plan=False, taille_cache=0)
+    corpus.from_dataframe(donnees.iloc[300:])
+    # Index de passages, avec un segment : un score par document, celui de son meilleur passage
+    verifier_experts(moteur, "somme")
+    assert moteur.segments
+
+
+def test_search_auteurs_dataframe(corpus):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    df = moteur.search_auteurs("software engineering", n_results=5)
+    experts = moteur.search_auteurs("software engineering", n_results=5, dataframe=False)
+    assert df["Auteur"].tolist() == [nom for nom, _, _, _ in experts]
+    assert df["Ids"].tolist() == [ids.tolist() for _, _, ids, _ in experts]
+    assert (df["Documents"] >= df["Ids"].map(len)).all()
+    assert moteur.search_auteurs("zzzinconnu").empty
+    with pytest.raises(ValueError):
+        moteur.search_auteurs("software", agregation="max")
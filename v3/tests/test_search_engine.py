@@ -0,0 +1,322 @@
+"""!
+# test_search_engine.py
+
+Tests de non-régression du SearchEngine : les différentes méthodes de recherche et de construction
+de l'index doivent donner les mêmes résultats.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+import pytest
+
+from models.Passage import DecoupeurPassages
+from models.ScoringModel import ModeleBM25, ModeleScoring, ModeleTFIDF
+from models.SearchEngine import SearchEngine
+
+## Requêtes testées : mots fréquents, rares, absents, répétés.
+REQUETES = ["software engineering", "python testing code", "the", "requirements requirements",
+            "machine learning model", "zzzinconnu", "data the of"]
+## Requêtes positionnelles (phrases, NEAR) servies par l'index positionnel.
+REQUETES_POSITIONNELLES = ['"software engineering"', "code NEAR/5 review", '"machine learning" model']
+## Modèles de pondération : TF-IDF, BM25 et BM25+.
+MODELES = [pytest.param(ModeleTFIDF, id="tfidf"), pytest.param(ModeleBM25, id="bm25"),
+           pytest.param(lambda: ModeleBM25(delta=1.0), id="bm25+")]
+
+
+def resultats(moteur, requete, n_results=10, **parametres):
+    """!
+    Résultats d'une recherche sous forme comparable.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requete**: La requête.
+    - **n_results**: Nombre de résultats.
+    - **parametres**: Autres arguments de `search`.
+
+    **Returns**
+    - Un couple (liste des ids, tableau NumPy des scores).
+    """
+    trouves = moteur.search(requete, n_results=n_results, dataframe=False, **parametres)
+    return trouves.ids.tolist(), np.asarray(trouves.scores)
+
+
+def verifier_identiques(moteur, reference, requetes=REQUETES, **parametres):
+    """!
+    Vérifie que deux moteurs retournent les mêmes résultats pour chaque requête.
+
+    **Parameters**
+    - **moteur**, **reference**: Les SearchEngine comparés.
+    - **requetes**: Requêtes testées.
+    - **parametres**: Autres arguments de `search`.
+    """
+    for requete in requetes:
+        ids, scores = resultats(moteur, requete, **parametres)
+        ids_reference, scores_reference = resultats(reference, requete, **parametres)
+        assert ids == ids_reference, requete
+        np.testing.assert_allclose(scores, scores_reference, rtol=1e-9, atol=1e-12)
+
+
+def verifier_methodes(moteur, methodes, requetes=REQUETES):
+    """!
+    Vérifie que plusieurs méthodes de recherche d'un moteur retournent les résultats de "vectorielle".
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **methodes**: Méthodes comparées à "vectorielle".
+    - **requetes**: Requêtes testées.
+    """
+    for requete in requetes:
+        ids, scores = resultats(moteur, requete)
+        for methode in methodes:
+            ids_methode, scores_methode = resultats(moteur, requete, methode=methode)
+            assert ids_methode == ids, (methode, requete)
+            np.testing.assert_allclose(scores_methode, scores, rtol=1e-9, atol=1e-12)
+
+
+def test_vectorielle_boucle(corpus):
+    verifier_methodes(SearchEngine(corpus, taille_cache=0), ["boucle"])
+
+
+def test_requete_vide(corpus):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    for methode in ("vectorielle", "boucle"):
+        assert len(moteur.search("zzzinconnu", methode=methode)) == 0
+        assert len(moteur.search("", methode=methode, dataframe=False)) == 0
+
+
+def test_ex_aequo_ordre_croissant(corpus):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    for methode in ("vectorielle", "boucle"):
+        ids, scores = resultats(moteur, "the", n_results=50, methode=methode)
+        # Scores décroissants, ex-aequo départagés par identifiant croissant
+        assert all((s1, -i1) >= (s2, -i2) for s1, i1, s2, i2 in zip(scores, ids, scores[1:], ids[1:]))
+
+
+def verifier_lot(moteur, requetes=REQUETES, **parametres):
+    """!
+    Vérifie que `search_many` retourne, pour chaque requête, les résultats de `search`.
+
+    **Parameters**
+    - **moteur**: Le SearchEngine.
+    - **requetes**: Requêtes testées.
+    - **parametres**: Autres arguments communs à `search` et `search_many`.
+    """
+    lot = moteur.search_many(requetes, taille_bloc=3, **parametres)
+    assert len(lot) == len(requetes)
+    for requete, (ids, scores) in zip(requetes, lot):
+        ids_reference, scores_reference = resultats(moteur, requete, **parametres)
+        assert ids.tolist() == ids_reference, requete
+        np.testing.assert_allclose(scores, scores_reference, rtol=1e-9, atol=1e-12)
+
+
+def test_search_many(corpus):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    verifier_lot(moteur)
+    verifier_lot(moteur, n_results=3)
+    assert moteur.search_many([]) == []
+
+
+def test_maxscore(corpus):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    verifier_methodes(moteur, ["maxscore"])
+    for n_results in (1, 5, 1000):
+        for requete in REQUETES:
+            ids, _ = resultats(moteur, requete, n_results, methode="maxscore")
+            assert ids == resultats(moteur, requete, n_results)[0], (n_results, requete)
+    moteur.search("the people software", methode="maxscore")
+    assert moteur.stats_requete['postings_evalues'] <= moteur.stats_requete['postings_total']
+
+
+@pytest.mark.parametrize("modele", MODELES)
+def test_modeles_maxscore(corpus, modele):
+    moteur = SearchEngine(corpus, modele=modele(), taille_cache=0)
+    verifier_methodes(moteur, ["maxscore"])
+    verifier_lot(moteur)
+
+
+def test_bm25_plus():
+    bm25, bm25_plus = ModeleBM25(), ModeleBM25(delta=1.0)
+    tf, longueurs, idf = np.array([1, 3]), np.array([10, 200]), np.array([2.0, 2.0])
+    # BM25+ ajoute delta * idf à chaque terme présent, même dans un document très long
+    np.testing.assert_allclose(bm25_plus.poids(tf, longueurs, idf, 50) - bm25.poids(tf, longueurs, idf, 50), idf)
+    assert (bm25.idf(np.array([1, 50, 100]), 100) > 0).all()
+
+
+def test_modele_incomplet():
+    class ModeleSansPoids(ModeleScoring):
+        def idf(self, df, N):
+            return np.ones(len(df))
+
+    with pytest.raises(TypeError):
+        ModeleSansPoids()
+
+
+@pytest.mark.parametrize("modele", MODELES)
+def test_ajout_incremental(creer_corpus, donnees, modele, capsys):
+    corpus = creer_corpus(n_documents=200)
+    moteur = SearchEngine(corpus, modele=modele(), taille_min_segment=50, fusion_arriere_plan=False,
+                          taille_cache=0)
+    capsys.readouterr()
+    for debut in range(200, len(donnees), 100):
+        corpus.from_dataframe(donnees.iloc[debut:debut + 100])
+        moteur.search("software", dataframe=False)
+    # La synchronisation automatique avant une recherche n'affiche rien
+    assert capsys.readouterr().out == ""
+    assert moteur.segments
+
+    reference = SearchEngine(corpus, modele=modele(), taille_cache=0)
+    assert moteur.N_docs == reference.N_docs
+    verifier_identiques(moteur, reference)
+    verifier_identiques(moteur, reference, REQUETES_POSITIONNELLES, poids_proximite=0.5)
+    # search_many évalue les segments sans les consolider
+    verifier_lot(moteur)
+    verifier_lot(moteur, REQUETES_POSITIONNELLES, poids_proximite=0.5)
+    assert moteur.segments
+    moteur.consolider()
+    assert not moteur.segments
+    verifier_identiques(moteur, reference)
+    verifier_identiques(moteur, reference, methode="maxscore")
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_enregistrement(corpus, tmp_path, mmap):
+    moteur = SearchEngine(corpus, modele=ModeleBM25(), taille_cache=0)
+    moteur.save(str(tmp_path))
+    charge = SearchEngine.load(str(tmp_path), corpus, mmap=mmap, taille_cache=0)
+    assert isinstance(charge.modele, ModeleBM25)
+    assert charge.lecture_seule == mmap
+    for methode in ("vectorielle", "maxscore"):
+        verifier_identiques(charge, moteur, methode=methode)
+    verifier_identiques(charge, moteur, REQUETES_POSITIONNELLES, poids_proximite=0.5)
+
+
+def test_enregistrement_puis_ajout(creer_corpus, donnees, tmp_path):
+    corpus = creer_corpus(n_documents=300)
+    SearchEngine(corpus, taille_cache=0).save(str(tmp_path))
+    charge = SearchEngine.load(str(tmp_path), corpus, fusion_arriere_plan=False, taille_cache=0)
+    corpus.from_dataframe(donnees.iloc[300:])
+
+    reference = SearchEngine(corpus, taille_cache=0)
+    verifier_identiques(charge, reference)
+    verifier_identiques(charge, reference, REQUETES_POSITIONNELLES, poids_proximite=0.5)
+
+
+def test_index_corrompu(corpus, tmp_path):
+    SearchEngine(corpus, taille_cache=0).save(str(tmp_path))
+    with open(tmp_path / "idf.npy", "r+b") as fichier:
+        fichier.seek(-1, 2)
+        octet = fichier.read(1)
+        fichier.seek(-1, 2)
+        fichier.write(bytes([octet[0] ^ 0xFF]))
+    with pytest.raises(ValueError):
+        SearchEngine.load(str(tmp_path), corpus)
+
+
+def test_lecture_seule(corpus, tmp_path):
+    SearchEngine(corpus, taille_cache=0).save(str(tmp_path))
+    charge = SearchEngine.load(str(tmp_path), corpus, mmap=True, prechauffer=True, taille_cache=0)
+    assert charge._tableaux_projetes()
+    with pytest.raises(ValueError):
+        charge.set_modele(ModeleBM25())
+
+
+def test_construction_parallele(corpus):
+    sequentiel = SearchEngine(corpus, taille_cache=0)
+    parallele = SearchEngine(corpus, n_workers=2, taille_lot=100, taille_cache=0)
+    assert parallele.termes == sequentiel.termes
+    assert (parallele.mat_TF != sequentiel.mat_TF).nnz == 0
+    np.testing.assert_array_equal(parallele.normes_docs, sequentiel.normes_docs)
+    verifier_identiques(parallele, sequentiel)
+
+
+def test_stockage_colonnes(creer_corpus):
+    # Le Corpus est un singleton : les résultats de référence sont calculés avant sa réinitialisation
+    reference = SearchEngine(creer_corpus("objets"), taille_cache=0)
+    attendus = [resultats(reference, requete) for requete in REQUETES]
+    moteur = SearchEngine(creer_corpus("colonnes"), taille_cache=0)
+    for requete, (ids_reference, scores_reference) in zip(REQUETES, attendus):
+        ids, scores = resultats(moteur, requete)
+        assert ids == ids_reference, requete
+        np.testing.assert_allclose(scores, scores_reference, rtol=1e-9, atol=1e-12)
+
+
+def agreger(ids, scores, agregation, n_results=10):
+    """!
+    Regroupement, calculé directement, des scores de passages par document.
+
+    **Parameters**
+    - **ids**: Identifiants des documents parents de chaque passage.
+    - **scores**: Scores des passages.
+    - **agregation**: "max" ou "somme".
+    - **n_results**: Nombre de documents retournés.
+
+    **Returns**
+    - Un couple (liste des ids, tableau NumPy des scores), par score décroissant puis identifiant croissant.
+    """
+    parents = {}
+    for doc_id, score in zip(ids, scores):
+        parents[doc_id] = max(parents.get(doc_id, 0.0), score) if agregation == "max" else \
+            parents.get(doc_id, 0.0) + score
+    tries = sorted(parents.items(), key=lambda couple: (-couple[1], couple[0]))[:n_results]
+    return [doc_id for doc_id, _ in tries], np.array([score for _, score in tries])
+
+
+def test_decoupage_passages():
+    texte = "Une première phrase assez longue. Courte. Une deuxième phrase assez longue! Et une troisième phrase longue?"
+    # Les phrases de 20 caractères ou moins sont ignorées
+    assert [texte[debut:fin] for debut, fin in DecoupeurPassages().decouper(texte)] == \
+        ["Une première phrase assez longue", "Une deuxième phrase assez longue",
+         "Et une troisième phrase longue?"]
+    assert len(DecoupeurPassages(phrases_par_passage=2).decouper(texte)) == 2
+    with pytest.raises(ValueError):
+        DecoupeurPassages(phrases_par_passage=0)
+
+
+def test_passages(corpus):
+    moteur = SearchEngine(corpus, passages=DecoupeurPassages(), taille_cache=0)
+    for requete in REQUETES:
+        # Sans agrégation : une ligne par passage, dont le document parent peut se répéter
+        ids_passages, scores_passages = resultats(moteur, requete, n_results=100000, agregation=None)
+        for agregation in SearchEngine.AGREGATIONS:
+            ids, scores = resultats(moteur, requete, agregation=agregation)
+            ids_attendus, scores_attendus = agreger(ids_passages, scores_passages, agregation)
+            assert ids == ids_attendus, (agregation, requete)
+            np.testing.assert_allclose(scores, scores_attendus, rtol=1e-9, atol=1e-12)
+            verifier_lot(moteur, [requete], agregation=agregation)
+
+    trouves = moteur.search("software engineering", dataframe=False)
+    for position, doc_id in enumerate(trouves.ids):
+        passage = trouves.get_passage(position)
+        assert passage in corpus.get_documents()[doc_id].get_texte()
+        assert "software" in passage.lower() or "engineering" in passage.lower()
+
+
+def test_cache(creer_corpus, donnees):
+    corpus = creer_corpus(n_documents=300)
+    moteur = SearchEngine(corpus, fusion_arriere_plan=False)
+    premiers = resultats(moteur, "software engineering")
+    # Requête analysée : la casse et la ponctuation ne changent pas la clé
+    assert resultats(moteur, "Software, ENGINEERING!")[0] == premiers[0]
+    assert moteur.get_stats_cache()['succes'] == 1
+
+    # Un ajout au corpus invalide le cache : les résultats tiennent compte des nouveaux documents
+    corpus.from_dataframe(donnees.iloc[300:])
+    verifier_identiques(moteur, SearchEngine(corpus, taille_cache=0))
+    assert moteur.get_stats_cache()['invalidations'] == 1
+
+
+def test_proximite(corpus):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    # Sans poids de proximité, les scores sont ceux du sac de mots et l'index positionnel n'est pas construit
+    verifier_methodes(moteur, ["maxscore"])
+    assert moteur._index_positionnel is None
+    verifier_lot(moteur, REQUETES_POSITIONNELLES, poids_proximite=0.5)
+    # Le bonus de proximité ne fait qu'augmenter les scores
+    for requete in REQUETES:
+        ids, scores = resultats(moteur, requete, n_results=1000)
+        ids_bonus, scores_bonus = resultats(moteur, requete, n_results=1000, poids_proximite=0.5)
+        bonus = dict(zip(ids_bonus, scores_bonus))
+        assert sorted(ids) == sorted(ids_bonus), requete
+        assert all(bonus[doc_id] >= score - 1e-12 for doc_id, score in zip(ids, scores)), requete
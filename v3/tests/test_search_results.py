@@ -0,0 +1,49 @@
+"""!
+# test_search_results.py
+
+Tests des résultats légers (Resultats) : accès aux ids et scores, et DataFrame identique à celui
+de `SearchEngine.search`.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.SearchEngine import SearchEngine
+from models.SearchResults import Resultats
+
+
+def test_acces(corpus):
+    documents = corpus.get_documents()
+    trouves = Resultats(documents, [5, 2, 9, 4], [0.9, 0.5, 0.0, 0.1])
+    # Les scores nuls sont retirés
+    assert len(trouves) == 3 and not trouves.empty
+    assert trouves.ids.tolist() == [5, 2, 4]
+    assert list(trouves) == [(5, 0.9), (2, 0.5), (4, 0.1)]
+    assert trouves[1] == (2, 0.5)
+    assert trouves.get_document(0).get_titre() == documents[5].get_titre()
+    assert trouves.get_passage(0) is None
+    # Tableaux en lecture seule : partagés par le cache de requêtes
+    with pytest.raises(ValueError):
+        trouves.scores[0] = 1.0
+
+    vides = Resultats(documents, [], [])
+    assert vides.empty and vides.to_dataframe().empty
+
+
+def test_dataframe(corpus):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    for requete in ("software engineering", "python testing code", "zzzinconnu"):
+        df = moteur.search(requete)
+        trouves = moteur.search(requete, dataframe=False)
+        assert isinstance(df, pd.DataFrame)
+        pd.testing.assert_frame_equal(trouves.to_dataframe(), df)
+
+    trouves = moteur.search("software engineering", dataframe=False)
+    np.testing.assert_allclose(trouves.to_dataframe()["Score"], np.round(trouves.scores, 4))
+    # Chaque appel retourne une copie
+    trouves.to_dataframe().drop(columns="Score", inplace=True)
+    assert "Score" in trouves.to_dataframe()
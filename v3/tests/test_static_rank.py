@@ -0,0 +1,86 @@
+"""!
+# test_static_rank.py
+
+Tests du rang statique : fraîcheur et engagement de chaque document, et scores du moteur multipliés
+par les facteurs statiques.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import numpy as np
+import pytest
+
+from models.Metadata import Metadonnees
+from models.SearchEngine import SearchEngine
+from models.StaticRank import RangStatique
+
+
+def metadonnees(dates, nb_comments):
+    """!
+    Métadonnées de documents de test.
+
+    **Parameters**
+    - **dates**: Dates des documents.
+    - **nb_comments**: Nombres de commentaires.
+
+    **Returns**
+    - L'objet Metadonnees.
+    """
+    colonnes = Metadonnees()
+    colonnes.ajouter({'ids': list(range(len(dates))), 'types': ["Reddit"] * len(dates),
+                      'auteurs': ["auteur"] * len(dates), 'dates': dates, 'nb_comments': nb_comments,
+                      'titres': ["titre"] * len(dates)})
+    return colonnes
+
+
+def test_caracteristiques():
+    rang = RangStatique(demi_vie=10).actualiser(metadonnees(
+        ["2024-01-21", "2024-01-11", "2024-01-01", "Date inconnue"], [0, 9, 99, 0]))
+    # Fraîcheur : 1 pour le plus récent, divisée par 2 tous les 10 jours, 0 si la date est inconnue
+    np.testing.assert_allclose(rang.recence, [1.0, 0.5, 0.25, 0.0])
+    np.testing.assert_allclose(rang.engagement, [0.0, np.log(10) / np.log(100), 1.0, 0.0])
+    np.testing.assert_allclose(rang.facteurs(np.array([2, 0]), 2.0, 1.0), [1 + 0.5 + 1.0, 1 + 2.0])
+    np.testing.assert_allclose(rang.facteurs(np.array([1, 3]), 0.0, 0.0), [1.0, 1.0])
+
+    rang.set_demi_vie(20)
+    np.testing.assert_allclose(rang.recence, [1.0, 2 ** -0.5, 0.5, 0.0])
+    with pytest.raises(ValueError):
+        rang.set_demi_vie(0)
+
+
+def test_sans_commentaires():
+    rang = RangStatique().actualiser(metadonnees(["2024-01-01", "2023-01-01"], [0, 0]))
+    np.testing.assert_allclose(rang.engagement, [0.0, 0.0])
+
+
+@pytest.mark.parametrize("poids_recence, poids_commentaires", [(0.5, 0.0), (0.0, 2.0), (1.0, 1.0)])
+def test_scores(corpus, poids_recence, poids_commentaires):
+    moteur = SearchEngine(corpus, taille_cache=0)
+    metadonnees_corpus = corpus.get_metadonnees()
+    rang = RangStatique().actualiser(metadonnees_corpus)
+    for requete in ("software engineering", "python code"):
+        tous = moteur.search(requete, n_results=moteur.N_docs, dataframe=False)
+        facteurs = rang.facteurs(metadonnees_corpus.positions(tous.ids), poids_recence, poids_commentaires)
+        scores = dict(zip(tous.ids.tolist(), tous.scores * facteurs))
+        attendus = sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))[:10]
+
+        trouves = moteur.search(requete, dataframe=False, poids_recence=poids_recence,
+                                poids_commentaires=poids_commentaires)
+        assert trouves.ids.tolist() == attendus, requete
+        np.testing.assert_allclose(trouves.scores, [scores[doc_id] for doc_id in attendus])
+        lot = moteur.search_many([requete], poids_recence=poids_recence, poids_commentaires=poids_commentaires)
+        assert lot[0][0].tolist() == attendus, requete
+
+    # Le rang statique n'est disponible qu'avec "vectorielle"
+    with pytest.raises(ValueError):
+        moteur.search("software", methode="maxscore", poids_recence=poids_recence or 1.0)
+
+
+def test_demi_vie_moteur(corpus):
+    moteur = SearchEngine(corpus)
+    avant = moteur.search("software", dataframe=False, poids_recence=1.0).scores
+    # La demi-vie fait partie de la clé du cache : les scores sont recalculés
+    moteur.rang_statique.set_demi_vie(1)
+    apres = moteur.search("software", dataframe=False, poids_recence=1.0).scores
+    assert not np.allclose(np.sort(avant), np.sort(apres))
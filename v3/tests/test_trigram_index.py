@@ -0,0 +1,44 @@
+"""!
+# test_trigram_index.py
+
+Tests de l'index de trigrammes : trigrammes obligatoires extraits des expressions régulières
+et documents candidats.
+
+**Author:** LOREL Guillaume
+**Version:** 1.0
+"""
+
+import re
+
+import pytest
+
+from models.TrigramIndex import IndexTrigrammes
+
+## Textes de test, indexés sous les identifiants 10 à 13 (le dernier avec le signe Kelvin, égal à "k" pour `re`).
+TEXTES = ["Software war", "peace and love", "nothing to see", "Kelvin: \u212aILN"]
+
+
+@pytest.mark.parametrize("pattern", ["ab", ".*", r"\w+", "ki", "(war|x)"])
+def test_requete_sans_trigramme(pattern):
+    assert IndexTrigrammes.requete(pattern, re.IGNORECASE) is None
+
+
+def test_requete():
+    assert IndexTrigrammes.requete(r"\w+ing\b") == "ing"
+    assert IndexTrigrammes.requete("(war|peace)") == ("ou", [("et", ["pea", "eac", "ace"]), "war"])
+    # Expression invalide : parcours complet, le résultat reste exact
+    assert IndexTrigrammes.requete("(") is None
+
+
+@pytest.mark.parametrize("taille_lot", [1, 1000])
+def test_candidats(taille_lot):
+    index = IndexTrigrammes(taille_lot)
+    index.ajouter([10, 11], TEXTES[:2])
+    index.ajouter([12, 13], TEXTES[2:])
+    assert len(index) == 4 and index.ids_docs.tolist() == [10, 11, 12, 13]
+    for pattern, attendus in [("software", [0]), ("(war|peace)", [0, 1]), ("zzz", []), (r"\bkiln\b", [3])]:
+        motif = re.compile(pattern, re.IGNORECASE)
+        assert index.candidats(motif).tolist() == attendus, pattern
+        # Aucun document contenant une correspondance n'est écarté
+        assert all(i in attendus for i, texte in enumerate(TEXTES) if motif.search(texte)), pattern
+    assert index.candidats(re.compile(".*")) is None